@@ -19,9 +19,11 @@
 Arithmetic coder/decoder
 """
 
+from bisect import bisect_right
 from collections import Counter
 from fractions import Fraction
-from typing import Dict, Tuple, Union
+from math import gcd
+from typing import Dict, List, Tuple, Union
 
 __all__ = ['Arithmetic']
 
@@ -32,11 +34,22 @@ class Arithmetic:
     This is based on Andrew Dalke's public domain implementation
     :cite:`Dalke:2005`. It has been ported to use the fractions.Fraction class.
 
+    The probabilities are kept as Fractions, but coding scales them to
+    integers over their common denominator, so that the interval of a text is
+    computed exactly with integer arithmetic, giving the same codes the
+    Fractions would.
+
 
     .. versionadded:: 0.3.6
+    .. versionchanged:: 0.6.0
+        Encoding & decoding use integer arithmetic
     """
 
     _probs = {}  # type: Dict[str, Tuple[Fraction, Fraction]]
+    # The common denominator of the probabilities & each character's start &
+    # width in units of it
+    _denom = 1
+    _scaled = {}  # type: Dict[str, Tuple[int, int]]
 
     def __init__(self, text: Union[str, None] = None) -> None:
         """Initialize arithmetic coder object.
@@ -81,6 +94,20 @@ class Arithmetic:
         """
         self._probs = probs
 
+        denom = 1
+        for bounds in probs.values():
+            for bound in bounds:
+                bound_denom = Fraction(bound).denominator
+                denom = denom * bound_denom // gcd(denom, bound_denom)
+        self._denom = denom
+        self._scaled = {
+            char: (
+                int(Fraction(low) * denom),
+                int((Fraction(high) - Fraction(low)) * denom),
+            )
+            for char, (low, high) in probs.items()
+        }
+
     def train(self, text: str) -> None:
         r"""Generate a probability dict from the provided text.
 
@@ -139,15 +166,16 @@ class Arithmetic:
         tot_letters = sum(counts.values())
 
         tot = 0
-        self._probs = {}
+        probs = {}
         prev = Fraction(0)
         for char, count in sorted(
             counts.items(), key=lambda x: (x[1], x[0]), reverse=True
         ):
             follow = Fraction(tot + count, tot_letters)
-            self._probs[char] = (prev, follow)
+            probs[char] = (prev, follow)
             prev = follow
             tot = tot + count
+        self.set_probs(probs)
 
     def encode(self, text: str) -> Tuple[int, int]:
         """Encode a text using arithmetic coding.
@@ -177,35 +205,101 @@ class Arithmetic:
         .. versionchanged:: 0.3.6
             Encapsulated in class
 
+        """
+        low, width, total = self._interval(text)
+        nbits = self._nbits(width, total)
+        # The midpoint of the interval, in units of 2 ** -nbits; the division
+        # truncation is deliberate
+        return ((2 * low + width) << (nbits - 1)) // total, nbits
+
+    def encoded_len(self, text: str) -> int:
+        """Return the number of bits in the arithmetic coding of a text.
+
+        This is equal to the second value returned by :py:meth:`encode`, but
+        the code itself is not computed, only the width of the text's
+        interval.
+
+        Parameters
+        ----------
+        text : str
+            A string to encode
+
+        Returns
+        -------
+        int
+            The length in bits of the arithmetically coded text
+
+        Example
+        -------
+        >>> ac = Arithmetic('the quick brown fox jumped over the lazy dog')
+        >>> ac.encoded_len('align')
+        34
+
+
+        .. versionadded:: 0.6.0
+
         """
         if '\x00' in text:
             text = text.replace('\x00', ' ')
-        minval = Fraction(0)
-        maxval = Fraction(1)
-
-        for char in text + '\x00':
-            prob_range = self._probs[char]
-            delta = maxval - minval
-            maxval = minval + prob_range[1] * delta
-            minval = minval + prob_range[0] * delta
-
-        # I tried without the /2 just to check.  Doesn't work.
-        # Keep scaling up until the error range is >= 1.  That
-        # gives me the minimum number of bits needed to resolve
-        # down to the end-of-data character.
-        delta = (maxval - minval) / 2
-        nbits = int(0)
-        while delta < 1:
-            nbits += 1
-            delta *= 2
-        # The below condition shouldn't ever be false
-        if nbits == 0:  # pragma: no cover
-            return 0, 0
-        # using -1 instead of /2
-        avg = (maxval + minval) * 2 ** (nbits - 1)
-        # Could return a rational instead ...
-        # the division truncation is deliberate
-        return avg.numerator // avg.denominator, nbits
+        width = 1
+        for char, count in Counter(text + '\x00').items():
+            width *= self._scaled[char][1] ** count
+        return self._nbits(width, self._denom ** (len(text) + 1))
+
+    def _interval(self, text: str) -> Tuple[int, int, int]:
+        """Return the interval of a text.
+
+        Parameters
+        ----------
+        text : str
+            A string to encode
+
+        Returns
+        -------
+        tuple
+            The start & width of the interval, and the denominator of both
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if '\x00' in text:
+            text = text.replace('\x00', ' ')
+        # Narrowing an interval [low, low + width) / total by a character's
+        # interval gives [low * denom + start * width, ... + count * width) /
+        # (total * denom). The narrowing by each half of the text is
+        # computed separately & then combined, so that the multiplications
+        # are of numbers of similar size.
+        parts = [
+            self._scaled[char] + (self._denom,) for char in text + '\x00'
+        ]  # type: List[Tuple[int, int, int]]
+        while len(parts) > 1:
+            merged = [
+                (
+                    low1 * total2 + low2 * width1,
+                    width1 * width2,
+                    total1 * total2,
+                )
+                for (low1, width1, total1), (low2, width2, total2) in zip(
+                    parts[::2], parts[1::2]
+                )
+            ]
+            if len(parts) % 2:
+                merged.append(parts[-1])
+            parts = merged
+        return parts[0]
+
+    @staticmethod
+    def _nbits(width: int, total: int) -> int:
+        """Return the number of bits needed to resolve an interval.
+
+        This is the least number such that half the interval's width is at
+        least 2 ** -nbits.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1 + ((total - 1) // width).bit_length()
 
     def decode(self, longval: int, nbits: int) -> str:
         """Decode the number to a string using the given statistics.
@@ -234,26 +328,39 @@ class Arithmetic:
             Encapsulated in class
 
         """
-        val = Fraction(longval, int(1) << nbits)
+        # The code's value, relative to the interval decoded so far, is
+        # offset / width.
+        offset = longval
+        width = 1 << nbits
         letters = []
 
         probs_items = [
-            (char, minval, maxval)
-            for (char, (minval, maxval)) in self._probs.items()
+            (start, count, char)
+            for char, (start, count) in self._scaled.items()
+            if count
         ]
+        probs_items.sort()
+        starts = [start for start, _, _ in probs_items]
+        # If no character's interval holds the value, the last one is used.
+        fallback = (0, 0, '\x00')
+        if self._scaled:
+            char = list(self._scaled)[-1]
+            fallback = self._scaled[char] + (char,)
 
-        char = '\x00'
-        minval = maxval = Fraction(0)
         while True:
-            for (char, minval, maxval) in probs_items:  # noqa: B007
-                if minval <= val < maxval:
-                    break
+            offset *= self._denom
+            pos = offset // width
+            num = bisect_right(starts, pos) - 1
+            if num >= 0 and pos < starts[num] + probs_items[num][1]:
+                start, count, char = probs_items[num]
+            else:
+                start, count, char = fallback
 
             if char == '\x00':
                 break
             letters.append(char)
-            delta = maxval - minval
-            val = (val - minval) / delta
+            offset -= start * width
+            width *= count
         return ''.join(letters)
 
 
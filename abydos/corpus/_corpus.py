@@ -91,8 +91,7 @@ class Corpus:
             doc = []  # type: List[List[str]]
             for sentence in document.split(sent_split):
                 if word_tokenizer:
-                    word_tokenizer.tokenize(sentence)
-                    sentence_words = word_tokenizer.get_list()
+                    sentence_words = word_tokenizer.tokenize_to_list(sentence)
                 else:
                     sentence_words = sentence.split()
 
@@ -173,8 +173,7 @@ class UnigramCorpus:
             word = self.transform(word)
 
         if self.tokenizer is not None:
-            self.tokenizer.tokenize(word)
-            tokens = self.tokenizer.get_counter()
+            tokens = self.tokenizer.tokenize_to_counter(word)
             for tok in tokens:
                 n = tokens[tok] * count
                 prior_count, prior_doc_count = self.corpus[tok]
@@ -355,6 +355,7 @@ The first three methods can be demonstrated using the
 :py:class:`.DamerauLevenshtein` class, while :py:class:`.SmithWaterman` offers
 the fourth:
 
+>>> from abydos.distance import DamerauLevenshtein, SmithWaterman
 >>> dl = DamerauLevenshtein()
 >>> dl.dist_abs('orange', 'strange')
 2
@@ -367,288 +368,626 @@ the fourth:
 >>> sw.sim_score('TGTTACGG', 'GGTTGACTA')
 4.0
 
+A set of strings can be indexed under a metric with an integer-valued
+``dist_abs``, such as :py:class:`.Levenshtein`, by a Burkhard-Keller tree
+(:py:class:`.BKTree`), which finds the strings within a given distance of, or
+nearest to, a query without comparing it to every string in the set:
+
+>>> from abydos.distance import BKTree
+>>> tree = BKTree(['Niall', 'Neil', 'Nigel', 'Colin'])
+>>> tree.within('Neal', 1)
+[('Neil', 1)]
+
+For Levenshtein & Optimal String Alignment distances specifically, a
+:py:class:`.LevenshteinTrie` shares the computation for words with common
+prefixes, which makes it the faster index for large lexicons:
+
+>>> from abydos.distance import LevenshteinTrie
+>>> trie = LevenshteinTrie(['Niall', 'Neil', 'Nigel', 'Colin'])
+>>> trie.nearest('Neal', 2)
+[('Neil', 1), ('Niall', 2)]
+
+For the token-based measures :py:class:`.Jaccard`, :py:class:`.Dice`,
+:py:class:`.Tversky`, :py:class:`.Cosine`, and :py:class:`.Overlap`, a
+:py:class:`.SimilarityJoin` finds the pairs of strings in two collections (or
+within one) whose similarity meets a threshold, without comparing every pair:
+
+>>> from abydos.distance import SimilarityJoin
+>>> SimilarityJoin().join(['Niall', 'Neil', 'Nigel'], ['Neil', 'Neal'], 0.5)
+[(1, 0, 1.0)]
+
+For very large collections, a :py:class:`.MinHashLSH` index finds the strings
+likely to have a high Jaccard similarity to a query by their
+:py:class:`.MinHash` signatures, in time that does not grow with the size of
+the collection:
+
+>>> from abydos.distance import MinHashLSH
+>>> lsh = MinHashLSH(bands=32, rows=2)
+>>> for num, name in enumerate(['Christopher', 'Kristopher', 'Niall']):
+...     lsh.insert(num, name)
+>>> lsh.query('Christophe')
+[0, 1]
+
 ----
 
 """
 
-from ._aline import ALINE
-from ._ample import AMPLE
-from ._anderberg import Anderberg
-from ._andres_marzo_delta import AndresMarzoDelta
-from ._average_linkage import AverageLinkage
-from ._azzoo import AZZOO
-from ._bag import Bag
-from ._baroni_urbani_buser_i import BaroniUrbaniBuserI
-from ._baroni_urbani_buser_ii import BaroniUrbaniBuserII
-from ._batagelj_bren import BatageljBren
-from ._baulieu_i import BaulieuI
-from ._baulieu_ii import BaulieuII
-from ._baulieu_iii import BaulieuIII
-from ._baulieu_iv import BaulieuIV
-from ._baulieu_ix import BaulieuIX
-from ._baulieu_v import BaulieuV
-from ._baulieu_vi import BaulieuVI
-from ._baulieu_vii import BaulieuVII
-from ._baulieu_viii import BaulieuVIII
-from ._baulieu_x import BaulieuX
-from ._baulieu_xi import BaulieuXI
-from ._baulieu_xii import BaulieuXII
-from ._baulieu_xiii import BaulieuXIII
-from ._baulieu_xiv import BaulieuXIV
-from ._baulieu_xv import BaulieuXV
-from ._baystat import Baystat
-from ._benini_i import BeniniI
-from ._benini_ii import BeniniII
-from ._bennet import Bennet
-from ._bhattacharyya import Bhattacharyya
-from ._bisim import BISIM
-from ._bleu import BLEU
-from ._block_levenshtein import BlockLevenshtein
-from ._brainerd_robinson import BrainerdRobinson
-from ._braun_blanquet import BraunBlanquet
-from ._canberra import Canberra
-from ._cao import Cao
-from ._chao_dice import ChaoDice
-from ._chao_jaccard import ChaoJaccard
-from ._chebyshev import Chebyshev
-from ._chord import Chord
-from ._clark import Clark
-from ._clement import Clement
-from ._cohen_kappa import CohenKappa
-from ._cole import Cole
-from ._complete_linkage import CompleteLinkage
-from ._consonni_todeschini_i import ConsonniTodeschiniI
-from ._consonni_todeschini_ii import ConsonniTodeschiniII
-from ._consonni_todeschini_iii import ConsonniTodeschiniIII
-from ._consonni_todeschini_iv import ConsonniTodeschiniIV
-from ._consonni_todeschini_v import ConsonniTodeschiniV
-from ._cormode_lz import CormodeLZ
-from ._cosine import Cosine
-from ._covington import Covington
-from ._damerau_levenshtein import DamerauLevenshtein
-from ._dennis import Dennis
-from ._dice import Dice
-from ._dice_asymmetric_i import DiceAsymmetricI
-from ._dice_asymmetric_ii import DiceAsymmetricII
-from ._digby import Digby
-from ._discounted_levenshtein import DiscountedLevenshtein
-from ._dispersion import Dispersion
-from ._distance import _Distance
-from ._doolittle import Doolittle
-from ._dunning import Dunning
-from ._editex import Editex
-from ._euclidean import Euclidean
-from ._eudex import Eudex
-from ._eyraud import Eyraud
-from ._fager_mcgowan import FagerMcGowan
-from ._faith import Faith
-from ._fellegi_sunter import FellegiSunter
-from ._fidelity import Fidelity
-from ._fleiss import Fleiss
-from ._fleiss_levin_paik import FleissLevinPaik
-from ._flexmetric import FlexMetric
-from ._forbes_i import ForbesI
-from ._forbes_ii import ForbesII
-from ._fossum import Fossum
-from ._fuzzywuzzy_partial_string import FuzzyWuzzyPartialString
-from ._fuzzywuzzy_token_set import FuzzyWuzzyTokenSet
-from ._fuzzywuzzy_token_sort import FuzzyWuzzyTokenSort
-from ._generalized_fleiss import GeneralizedFleiss
-from ._gilbert import Gilbert
-from ._gilbert_wells import GilbertWells
-from ._gini_i import GiniI
-from ._gini_ii import GiniII
-from ._goodall import Goodall
-from ._goodman_kruskal_lambda import GoodmanKruskalLambda
-from ._goodman_kruskal_lambda_r import GoodmanKruskalLambdaR
-from ._goodman_kruskal_tau_a import GoodmanKruskalTauA
-from ._goodman_kruskal_tau_b import GoodmanKruskalTauB
-from ._gotoh import Gotoh
-from ._gower_legendre import GowerLegendre
-from ._guth import Guth
-from ._guttman_lambda_a import GuttmanLambdaA
-from ._guttman_lambda_b import GuttmanLambdaB
-from ._gwet_ac import GwetAC
-from ._hamann import Hamann
-from ._hamming import Hamming
-from ._harris_lahey import HarrisLahey
-from ._hassanat import Hassanat
-from ._hawkins_dotson import HawkinsDotson
-from ._hellinger import Hellinger
-from ._henderson_heron import HendersonHeron
-from ._higuera_mico import HigueraMico
-from ._horn_morisita import HornMorisita
-from ._hurlbert import Hurlbert
-from ._ident import Ident
-from ._inclusion import Inclusion
-from ._indel import Indel
-from ._isg import ISG
-from ._iterative_substring import IterativeSubString
-from ._jaccard import Jaccard
-from ._jaccard_nm import JaccardNM
-from ._jaro_winkler import JaroWinkler
-from ._jensen_shannon import JensenShannon
-from ._johnson import Johnson
-from ._kendall_tau import KendallTau
-from ._kent_foster_i import KentFosterI
-from ._kent_foster_ii import KentFosterII
-from ._koppen_i import KoppenI
-from ._koppen_ii import KoppenII
-from ._kuder_richardson import KuderRichardson
-from ._kuhns_i import KuhnsI
-from ._kuhns_ii import KuhnsII
-from ._kuhns_iii import KuhnsIII
-from ._kuhns_iv import KuhnsIV
-from ._kuhns_ix import KuhnsIX
-from ._kuhns_v import KuhnsV
-from ._kuhns_vi import KuhnsVI
-from ._kuhns_vii import KuhnsVII
-from ._kuhns_viii import KuhnsVIII
-from ._kuhns_x import KuhnsX
-from ._kuhns_xi import KuhnsXI
-from ._kuhns_xii import KuhnsXII
-from ._kulczynski_i import KulczynskiI
-from ._kulczynski_ii import KulczynskiII
-from ._lcprefix import LCPrefix
-from ._lcsseq import LCSseq
-from ._lcsstr import LCSstr
-from ._lcsuffix import LCSuffix
-from ._length import Length
-from ._levenshtein import Levenshtein
-from ._lig3 import LIG3
-from ._lorentzian import Lorentzian
-from ._maarel import Maarel
-from ._manhattan import Manhattan
-from ._marking import Marking
-from ._marking_metric import MarkingMetric
-from ._masi import MASI
-from ._matusita import Matusita
-from ._maxwell_pilliner import MaxwellPilliner
-from ._mcconnaughey import McConnaughey
-from ._mcewen_michael import McEwenMichael
-from ._meta_levenshtein import MetaLevenshtein
-from ._michelet import Michelet
-from ._millar import Millar
-from ._minhash import MinHash
-from ._minkowski import Minkowski
-from ._mlipns import MLIPNS
-from ._monge_elkan import MongeElkan
-from ._morisita import Morisita
-from ._mountford import Mountford
-from ._mra import MRA
-from ._ms_contingency import MSContingency
-from ._mutual_information import MutualInformation
-from ._ncd_arith import NCDarith
-from ._ncd_bwtrle import NCDbwtrle
-from ._ncd_bz2 import NCDbz2
-from ._ncd_lzma import NCDlzma
-from ._ncd_lzss import NCDlzss
-from ._ncd_paq9a import NCDpaq9a
-from ._ncd_rle import NCDrle
-from ._ncd_zlib import NCDzlib
-from ._needleman_wunsch import NeedlemanWunsch
-from ._overlap import Overlap
-from ._ozbay import Ozbay
-from ._pattern import Pattern
-from ._pearson_chi_squared import PearsonChiSquared
-from ._pearson_heron_ii import PearsonHeronII
-from ._pearson_ii import PearsonII
-from ._pearson_iii import PearsonIII
-from ._pearson_phi import PearsonPhi
-from ._peirce import Peirce
-from ._phonetic_distance import PhoneticDistance
-from ._phonetic_edit_distance import PhoneticEditDistance
-from ._positional_q_gram_dice import PositionalQGramDice
-from ._positional_q_gram_jaccard import PositionalQGramJaccard
-from ._positional_q_gram_overlap import PositionalQGramOverlap
-from ._prefix import Prefix
-from ._q_gram import QGram
-from ._quantitative_cosine import QuantitativeCosine
-from ._quantitative_dice import QuantitativeDice
-from ._quantitative_jaccard import QuantitativeJaccard
-from ._ratcliff_obershelp import RatcliffObershelp
-from ._raup_crick import RaupCrick
-from ._rees_levenshtein import ReesLevenshtein
-from ._relaxed_hamming import RelaxedHamming
-from ._roberts import Roberts
-from ._rogers_tanimoto import RogersTanimoto
-from ._rogot_goldberg import RogotGoldberg
-from ._rouge_l import RougeL
-from ._rouge_s import RougeS
-from ._rouge_su import RougeSU
-from ._rouge_w import RougeW
-from ._russell_rao import RussellRao
-from ._saps import SAPS
-from ._scott_pi import ScottPi
-from ._shape import Shape
-from ._shapira_storer_i import ShapiraStorerI
-from ._sift4 import Sift4
-from ._sift4_extended import Sift4Extended
-from ._sift4_simplest import Sift4Simplest
-from ._single_linkage import SingleLinkage
-from ._size import Size
-from ._smith_waterman import SmithWaterman
-from ._soft_cosine import SoftCosine
-from ._softtf_idf import SoftTFIDF
-from ._sokal_michener import SokalMichener
-from ._sokal_sneath_i import SokalSneathI
-from ._sokal_sneath_ii import SokalSneathII
-from ._sokal_sneath_iii import SokalSneathIII
-from ._sokal_sneath_iv import SokalSneathIV
-from ._sokal_sneath_v import SokalSneathV
-from ._sorgenfrei import Sorgenfrei
-from ._ssk import SSK
-from ._steffensen import Steffensen
-from ._stiles import Stiles
-from ._strcmp95 import Strcmp95
-from ._stuart_tau import StuartTau
-from ._suffix import Suffix
-from ._synoname import Synoname
-from ._tarantula import Tarantula
-from ._tarwid import Tarwid
-from ._tetrachoric import Tetrachoric
-from ._tf_idf import TFIDF
-from ._tichy import Tichy
-from ._token_distance import _TokenDistance
-from ._tulloss_r import TullossR
-from ._tulloss_s import TullossS
-from ._tulloss_t import TullossT
-from ._tulloss_u import TullossU
-from ._tversky import Tversky
-from ._typo import Typo
-from ._unigram_subtuple import UnigramSubtuple
-from ._unknown_a import UnknownA
-from ._unknown_b import UnknownB
-from ._unknown_c import UnknownC
-from ._unknown_d import UnknownD
-from ._unknown_e import UnknownE
-from ._unknown_f import UnknownF
-from ._unknown_g import UnknownG
-from ._unknown_h import UnknownH
-from ._unknown_i import UnknownI
-from ._unknown_j import UnknownJ
-from ._unknown_k import UnknownK
-from ._unknown_l import UnknownL
-from ._unknown_m import UnknownM
-from ._upholt import Upholt
-from ._vps import VPS
-from ._warrens_i import WarrensI
-from ._warrens_ii import WarrensII
-from ._warrens_iii import WarrensIII
-from ._warrens_iv import WarrensIV
-from ._warrens_v import WarrensV
-from ._weighted_jaccard import WeightedJaccard
-from ._whittaker import Whittaker
-from ._yates_chi_squared import YatesChiSquared
-from ._yjhhr import YJHHR
-from ._yujian_bo import YujianBo
-from ._yule_q import YuleQ
-from ._yule_q_ii import YuleQII
-from ._yule_y import YuleY
+import sys
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    # Type checkers do not follow __getattr__, so members are imported
+    # explicitly for them.
+    from ._aline import ALINE
+    from ._ample import AMPLE
+    from ._anderberg import Anderberg
+    from ._andres_marzo_delta import AndresMarzoDelta
+    from ._average_linkage import AverageLinkage
+    from ._azzoo import AZZOO
+    from ._bag import Bag
+    from ._baroni_urbani_buser_i import BaroniUrbaniBuserI
+    from ._baroni_urbani_buser_ii import BaroniUrbaniBuserII
+    from ._batagelj_bren import BatageljBren
+    from ._baulieu_i import BaulieuI
+    from ._baulieu_ii import BaulieuII
+    from ._baulieu_iii import BaulieuIII
+    from ._baulieu_iv import BaulieuIV
+    from ._baulieu_ix import BaulieuIX
+    from ._baulieu_v import BaulieuV
+    from ._baulieu_vi import BaulieuVI
+    from ._baulieu_vii import BaulieuVII
+    from ._baulieu_viii import BaulieuVIII
+    from ._baulieu_x import BaulieuX
+    from ._baulieu_xi import BaulieuXI
+    from ._baulieu_xii import BaulieuXII
+    from ._baulieu_xiii import BaulieuXIII
+    from ._baulieu_xiv import BaulieuXIV
+    from ._baulieu_xv import BaulieuXV
+    from ._baystat import Baystat
+    from ._benini_i import BeniniI
+    from ._benini_ii import BeniniII
+    from ._bennet import Bennet
+    from ._bhattacharyya import Bhattacharyya
+    from ._bisim import BISIM
+    from ._bk_tree import BKTree
+    from ._bleu import BLEU
+    from ._block_levenshtein import BlockLevenshtein
+    from ._brainerd_robinson import BrainerdRobinson
+    from ._braun_blanquet import BraunBlanquet
+    from ._canberra import Canberra
+    from ._cao import Cao
+    from ._chao_dice import ChaoDice
+    from ._chao_jaccard import ChaoJaccard
+    from ._chebyshev import Chebyshev
+    from ._chord import Chord
+    from ._clark import Clark
+    from ._clement import Clement
+    from ._cohen_kappa import CohenKappa
+    from ._cole import Cole
+    from ._complete_linkage import CompleteLinkage
+    from ._consonni_todeschini_i import ConsonniTodeschiniI
+    from ._consonni_todeschini_ii import ConsonniTodeschiniII
+    from ._consonni_todeschini_iii import ConsonniTodeschiniIII
+    from ._consonni_todeschini_iv import ConsonniTodeschiniIV
+    from ._consonni_todeschini_v import ConsonniTodeschiniV
+    from ._cormode_lz import CormodeLZ
+    from ._cosine import Cosine
+    from ._covington import Covington
+    from ._damerau_levenshtein import DamerauLevenshtein
+    from ._dennis import Dennis
+    from ._dice import Dice
+    from ._dice_asymmetric_i import DiceAsymmetricI
+    from ._dice_asymmetric_ii import DiceAsymmetricII
+    from ._digby import Digby
+    from ._discounted_levenshtein import DiscountedLevenshtein
+    from ._dispersion import Dispersion
+    from ._distance import _Distance
+    from ._doolittle import Doolittle
+    from ._dunning import Dunning
+    from ._editex import Editex
+    from ._euclidean import Euclidean
+    from ._eudex import Eudex
+    from ._eyraud import Eyraud
+    from ._fager_mcgowan import FagerMcGowan
+    from ._faith import Faith
+    from ._fellegi_sunter import FellegiSunter
+    from ._fidelity import Fidelity
+    from ._fleiss import Fleiss
+    from ._fleiss_levin_paik import FleissLevinPaik
+    from ._flexmetric import FlexMetric
+    from ._forbes_i import ForbesI
+    from ._forbes_ii import ForbesII
+    from ._fossum import Fossum
+    from ._fuzzywuzzy_partial_string import FuzzyWuzzyPartialString
+    from ._fuzzywuzzy_token_set import FuzzyWuzzyTokenSet
+    from ._fuzzywuzzy_token_sort import FuzzyWuzzyTokenSort
+    from ._generalized_fleiss import GeneralizedFleiss
+    from ._gilbert import Gilbert
+    from ._gilbert_wells import GilbertWells
+    from ._gini_i import GiniI
+    from ._gini_ii import GiniII
+    from ._goodall import Goodall
+    from ._goodman_kruskal_lambda import GoodmanKruskalLambda
+    from ._goodman_kruskal_lambda_r import GoodmanKruskalLambdaR
+    from ._goodman_kruskal_tau_a import GoodmanKruskalTauA
+    from ._goodman_kruskal_tau_b import GoodmanKruskalTauB
+    from ._gotoh import Gotoh
+    from ._gower_legendre import GowerLegendre
+    from ._guth import Guth
+    from ._guttman_lambda_a import GuttmanLambdaA
+    from ._guttman_lambda_b import GuttmanLambdaB
+    from ._gwet_ac import GwetAC
+    from ._hamann import Hamann
+    from ._hamming import Hamming
+    from ._harris_lahey import HarrisLahey
+    from ._hassanat import Hassanat
+    from ._hawkins_dotson import HawkinsDotson
+    from ._hellinger import Hellinger
+    from ._henderson_heron import HendersonHeron
+    from ._higuera_mico import HigueraMico
+    from ._horn_morisita import HornMorisita
+    from ._hurlbert import Hurlbert
+    from ._ident import Ident
+    from ._inclusion import Inclusion
+    from ._indel import Indel
+    from ._isg import ISG
+    from ._iterative_substring import IterativeSubString
+    from ._jaccard import Jaccard
+    from ._jaccard_nm import JaccardNM
+    from ._jaro_winkler import JaroWinkler
+    from ._jensen_shannon import JensenShannon
+    from ._johnson import Johnson
+    from ._kendall_tau import KendallTau
+    from ._kent_foster_i import KentFosterI
+    from ._kent_foster_ii import KentFosterII
+    from ._koppen_i import KoppenI
+    from ._koppen_ii import KoppenII
+    from ._kuder_richardson import KuderRichardson
+    from ._kuhns_i import KuhnsI
+    from ._kuhns_ii import KuhnsII
+    from ._kuhns_iii import KuhnsIII
+    from ._kuhns_iv import KuhnsIV
+    from ._kuhns_ix import KuhnsIX
+    from ._kuhns_v import KuhnsV
+    from ._kuhns_vi import KuhnsVI
+    from ._kuhns_vii import KuhnsVII
+    from ._kuhns_viii import KuhnsVIII
+    from ._kuhns_x import KuhnsX
+    from ._kuhns_xi import KuhnsXI
+    from ._kuhns_xii import KuhnsXII
+    from ._kulczynski_i import KulczynskiI
+    from ._kulczynski_ii import KulczynskiII
+    from ._lcprefix import LCPrefix
+    from ._lcsseq import LCSseq
+    from ._lcsstr import LCSstr
+    from ._lcsuffix import LCSuffix
+    from ._length import Length
+    from ._levenshtein import Levenshtein
+    from ._levenshtein_trie import LevenshteinTrie
+    from ._lig3 import LIG3
+    from ._lorentzian import Lorentzian
+    from ._maarel import Maarel
+    from ._manhattan import Manhattan
+    from ._marking import Marking
+    from ._marking_metric import MarkingMetric
+    from ._masi import MASI
+    from ._matusita import Matusita
+    from ._maxwell_pilliner import MaxwellPilliner
+    from ._mcconnaughey import McConnaughey
+    from ._mcewen_michael import McEwenMichael
+    from ._meta_levenshtein import MetaLevenshtein
+    from ._michelet import Michelet
+    from ._millar import Millar
+    from ._minhash import MinHash
+    from ._minhash_lsh import MinHashLSH
+    from ._minkowski import Minkowski
+    from ._mlipns import MLIPNS
+    from ._monge_elkan import MongeElkan
+    from ._morisita import Morisita
+    from ._mountford import Mountford
+    from ._mra import MRA
+    from ._ms_contingency import MSContingency
+    from ._mutual_information import MutualInformation
+    from ._ncd import _NCD
+    from ._ncd_arith import NCDarith
+    from ._ncd_bwtrle import NCDbwtrle
+    from ._ncd_bz2 import NCDbz2
+    from ._ncd_lzma import NCDlzma
+    from ._ncd_lzss import NCDlzss
+    from ._ncd_paq9a import NCDpaq9a
+    from ._ncd_rle import NCDrle
+    from ._ncd_zlib import NCDzlib
+    from ._needleman_wunsch import NeedlemanWunsch
+    from ._overlap import Overlap
+    from ._ozbay import Ozbay
+    from ._pattern import Pattern
+    from ._pearson_chi_squared import PearsonChiSquared
+    from ._pearson_heron_ii import PearsonHeronII
+    from ._pearson_ii import PearsonII
+    from ._pearson_iii import PearsonIII
+    from ._pearson_phi import PearsonPhi
+    from ._peirce import Peirce
+    from ._phonetic_distance import PhoneticDistance
+    from ._phonetic_edit_distance import PhoneticEditDistance
+    from ._positional_q_gram_dice import PositionalQGramDice
+    from ._positional_q_gram_jaccard import PositionalQGramJaccard
+    from ._positional_q_gram_overlap import PositionalQGramOverlap
+    from ._prefix import Prefix
+    from ._q_gram import QGram
+    from ._quantitative_cosine import QuantitativeCosine
+    from ._quantitative_dice import QuantitativeDice
+    from ._quantitative_jaccard import QuantitativeJaccard
+    from ._ratcliff_obershelp import RatcliffObershelp
+    from ._raup_crick import RaupCrick
+    from ._rees_levenshtein import ReesLevenshtein
+    from ._relaxed_hamming import RelaxedHamming
+    from ._roberts import Roberts
+    from ._rogers_tanimoto import RogersTanimoto
+    from ._rogot_goldberg import RogotGoldberg
+    from ._rouge_l import RougeL
+    from ._rouge_s import RougeS
+    from ._rouge_su import RougeSU
+    from ._rouge_w import RougeW
+    from ._russell_rao import RussellRao
+    from ._saps import SAPS
+    from ._scott_pi import ScottPi
+    from ._shape import Shape
+    from ._shapira_storer_i import ShapiraStorerI
+    from ._sift4 import Sift4
+    from ._sift4_extended import Sift4Extended
+    from ._sift4_simplest import Sift4Simplest
+    from ._similarity_join import SimilarityJoin
+    from ._single_linkage import SingleLinkage
+    from ._size import Size
+    from ._smith_waterman import SmithWaterman
+    from ._soft_cosine import SoftCosine
+    from ._softtf_idf import SoftTFIDF
+    from ._sokal_michener import SokalMichener
+    from ._sokal_sneath_i import SokalSneathI
+    from ._sokal_sneath_ii import SokalSneathII
+    from ._sokal_sneath_iii import SokalSneathIII
+    from ._sokal_sneath_iv import SokalSneathIV
+    from ._sokal_sneath_v import SokalSneathV
+    from ._sorgenfrei import Sorgenfrei
+    from ._ssk import SSK
+    from ._steffensen import Steffensen
+    from ._stiles import Stiles
+    from ._strcmp95 import Strcmp95
+    from ._stuart_tau import StuartTau
+    from ._suffix import Suffix
+    from ._synoname import Synoname
+    from ._tarantula import Tarantula
+    from ._tarwid import Tarwid
+    from ._tetrachoric import Tetrachoric
+    from ._tf_idf import TFIDF
+    from ._tichy import Tichy
+    from ._token_distance import _TokenDistance
+    from ._tulloss_r import TullossR
+    from ._tulloss_s import TullossS
+    from ._tulloss_t import TullossT
+    from ._tulloss_u import TullossU
+    from ._tversky import Tversky
+    from ._typo import Typo
+    from ._unigram_subtuple import UnigramSubtuple
+    from ._unknown_a import UnknownA
+    from ._unknown_b import UnknownB
+    from ._unknown_c import UnknownC
+    from ._unknown_d import UnknownD
+    from ._unknown_e import UnknownE
+    from ._unknown_f import UnknownF
+    from ._unknown_g import UnknownG
+    from ._unknown_h import UnknownH
+    from ._unknown_i import UnknownI
+    from ._unknown_j import UnknownJ
+    from ._unknown_k import UnknownK
+    from ._unknown_l import UnknownL
+    from ._unknown_m import UnknownM
+    from ._upholt import Upholt
+    from ._vps import VPS
+    from ._warrens_i import WarrensI
+    from ._warrens_ii import WarrensII
+    from ._warrens_iii import WarrensIII
+    from ._warrens_iv import WarrensIV
+    from ._warrens_v import WarrensV
+    from ._weighted_jaccard import WeightedJaccard
+    from ._whittaker import Whittaker
+    from ._yates_chi_squared import YatesChiSquared
+    from ._yjhhr import YJHHR
+    from ._yujian_bo import YujianBo
+    from ._yule_q import YuleQ
+    from ._yule_q_ii import YuleQII
+    from ._yule_y import YuleY
+
+# The module in which each member is defined. Members are imported on first
+# access (see __getattr__ below), so that importing this package does not
+# import every one of its modules.
+_MEMBER_MODULES = {
+    'ALINE': '_aline',
+    'AMPLE': '_ample',
+    'Anderberg': '_anderberg',
+    'AndresMarzoDelta': '_andres_marzo_delta',
+    'AverageLinkage': '_average_linkage',
+    'AZZOO': '_azzoo',
+    'Bag': '_bag',
+    'BaroniUrbaniBuserI': '_baroni_urbani_buser_i',
+    'BaroniUrbaniBuserII': '_baroni_urbani_buser_ii',
+    'BatageljBren': '_batagelj_bren',
+    'BaulieuI': '_baulieu_i',
+    'BaulieuII': '_baulieu_ii',
+    'BaulieuIII': '_baulieu_iii',
+    'BaulieuIV': '_baulieu_iv',
+    'BaulieuIX': '_baulieu_ix',
+    'BaulieuV': '_baulieu_v',
+    'BaulieuVI': '_baulieu_vi',
+    'BaulieuVII': '_baulieu_vii',
+    'BaulieuVIII': '_baulieu_viii',
+    'BaulieuX': '_baulieu_x',
+    'BaulieuXI': '_baulieu_xi',
+    'BaulieuXII': '_baulieu_xii',
+    'BaulieuXIII': '_baulieu_xiii',
+    'BaulieuXIV': '_baulieu_xiv',
+    'BaulieuXV': '_baulieu_xv',
+    'Baystat': '_baystat',
+    'BeniniI': '_benini_i',
+    'BeniniII': '_benini_ii',
+    'Bennet': '_bennet',
+    'Bhattacharyya': '_bhattacharyya',
+    'BISIM': '_bisim',
+    'BKTree': '_bk_tree',
+    'BLEU': '_bleu',
+    'BlockLevenshtein': '_block_levenshtein',
+    'BrainerdRobinson': '_brainerd_robinson',
+    'BraunBlanquet': '_braun_blanquet',
+    'Canberra': '_canberra',
+    'Cao': '_cao',
+    'ChaoDice': '_chao_dice',
+    'ChaoJaccard': '_chao_jaccard',
+    'Chebyshev': '_chebyshev',
+    'Chord': '_chord',
+    'Clark': '_clark',
+    'Clement': '_clement',
+    'CohenKappa': '_cohen_kappa',
+    'Cole': '_cole',
+    'CompleteLinkage': '_complete_linkage',
+    'ConsonniTodeschiniI': '_consonni_todeschini_i',
+    'ConsonniTodeschiniII': '_consonni_todeschini_ii',
+    'ConsonniTodeschiniIII': '_consonni_todeschini_iii',
+    'ConsonniTodeschiniIV': '_consonni_todeschini_iv',
+    'ConsonniTodeschiniV': '_consonni_todeschini_v',
+    'CormodeLZ': '_cormode_lz',
+    'Cosine': '_cosine',
+    'Covington': '_covington',
+    'DamerauLevenshtein': '_damerau_levenshtein',
+    'Dennis': '_dennis',
+    'Dice': '_dice',
+    'DiceAsymmetricI': '_dice_asymmetric_i',
+    'DiceAsymmetricII': '_dice_asymmetric_ii',
+    'Digby': '_digby',
+    'DiscountedLevenshtein': '_discounted_levenshtein',
+    'Dispersion': '_dispersion',
+    '_Distance': '_distance',
+    'Doolittle': '_doolittle',
+    'Dunning': '_dunning',
+    'Editex': '_editex',
+    'Euclidean': '_euclidean',
+    'Eudex': '_eudex',
+    'Eyraud': '_eyraud',
+    'FagerMcGowan': '_fager_mcgowan',
+    'Faith': '_faith',
+    'FellegiSunter': '_fellegi_sunter',
+    'Fidelity': '_fidelity',
+    'Fleiss': '_fleiss',
+    'FleissLevinPaik': '_fleiss_levin_paik',
+    'FlexMetric': '_flexmetric',
+    'ForbesI': '_forbes_i',
+    'ForbesII': '_forbes_ii',
+    'Fossum': '_fossum',
+    'FuzzyWuzzyPartialString': '_fuzzywuzzy_partial_string',
+    'FuzzyWuzzyTokenSet': '_fuzzywuzzy_token_set',
+    'FuzzyWuzzyTokenSort': '_fuzzywuzzy_token_sort',
+    'GeneralizedFleiss': '_generalized_fleiss',
+    'Gilbert': '_gilbert',
+    'GilbertWells': '_gilbert_wells',
+    'GiniI': '_gini_i',
+    'GiniII': '_gini_ii',
+    'Goodall': '_goodall',
+    'GoodmanKruskalLambda': '_goodman_kruskal_lambda',
+    'GoodmanKruskalLambdaR': '_goodman_kruskal_lambda_r',
+    'GoodmanKruskalTauA': '_goodman_kruskal_tau_a',
+    'GoodmanKruskalTauB': '_goodman_kruskal_tau_b',
+    'Gotoh': '_gotoh',
+    'GowerLegendre': '_gower_legendre',
+    'Guth': '_guth',
+    'GuttmanLambdaA': '_guttman_lambda_a',
+    'GuttmanLambdaB': '_guttman_lambda_b',
+    'GwetAC': '_gwet_ac',
+    'Hamann': '_hamann',
+    'Hamming': '_hamming',
+    'HarrisLahey': '_harris_lahey',
+    'Hassanat': '_hassanat',
+    'HawkinsDotson': '_hawkins_dotson',
+    'Hellinger': '_hellinger',
+    'HendersonHeron': '_henderson_heron',
+    'HigueraMico': '_higuera_mico',
+    'HornMorisita': '_horn_morisita',
+    'Hurlbert': '_hurlbert',
+    'Ident': '_ident',
+    'Inclusion': '_inclusion',
+    'Indel': '_indel',
+    'ISG': '_isg',
+    'IterativeSubString': '_iterative_substring',
+    'Jaccard': '_jaccard',
+    'JaccardNM': '_jaccard_nm',
+    'JaroWinkler': '_jaro_winkler',
+    'JensenShannon': '_jensen_shannon',
+    'Johnson': '_johnson',
+    'KendallTau': '_kendall_tau',
+    'KentFosterI': '_kent_foster_i',
+    'KentFosterII': '_kent_foster_ii',
+    'KoppenI': '_koppen_i',
+    'KoppenII': '_koppen_ii',
+    'KuderRichardson': '_kuder_richardson',
+    'KuhnsI': '_kuhns_i',
+    'KuhnsII': '_kuhns_ii',
+    'KuhnsIII': '_kuhns_iii',
+    'KuhnsIV': '_kuhns_iv',
+    'KuhnsIX': '_kuhns_ix',
+    'KuhnsV': '_kuhns_v',
+    'KuhnsVI': '_kuhns_vi',
+    'KuhnsVII': '_kuhns_vii',
+    'KuhnsVIII': '_kuhns_viii',
+    'KuhnsX': '_kuhns_x',
+    'KuhnsXI': '_kuhns_xi',
+    'KuhnsXII': '_kuhns_xii',
+    'KulczynskiI': '_kulczynski_i',
+    'KulczynskiII': '_kulczynski_ii',
+    'LCPrefix': '_lcprefix',
+    'LCSseq': '_lcsseq',
+    'LCSstr': '_lcsstr',
+    'LCSuffix': '_lcsuffix',
+    'Length': '_length',
+    'Levenshtein': '_levenshtein',
+    'LevenshteinTrie': '_levenshtein_trie',
+    'LIG3': '_lig3',
+    'Lorentzian': '_lorentzian',
+    'Maarel': '_maarel',
+    'Manhattan': '_manhattan',
+    'Marking': '_marking',
+    'MarkingMetric': '_marking_metric',
+    'MASI': '_masi',
+    'Matusita': '_matusita',
+    'MaxwellPilliner': '_maxwell_pilliner',
+    'McConnaughey': '_mcconnaughey',
+    'McEwenMichael': '_mcewen_michael',
+    'MetaLevenshtein': '_meta_levenshtein',
+    'Michelet': '_michelet',
+    'Millar': '_millar',
+    'MinHash': '_minhash',
+    'MinHashLSH': '_minhash_lsh',
+    'Minkowski': '_minkowski',
+    'MLIPNS': '_mlipns',
+    'MongeElkan': '_monge_elkan',
+    'Morisita': '_morisita',
+    'Mountford': '_mountford',
+    'MRA': '_mra',
+    'MSContingency': '_ms_contingency',
+    'MutualInformation': '_mutual_information',
+    '_NCD': '_ncd',
+    'NCDarith': '_ncd_arith',
+    'NCDbwtrle': '_ncd_bwtrle',
+    'NCDbz2': '_ncd_bz2',
+    'NCDlzma': '_ncd_lzma',
+    'NCDlzss': '_ncd_lzss',
+    'NCDpaq9a': '_ncd_paq9a',
+    'NCDrle': '_ncd_rle',
+    'NCDzlib': '_ncd_zlib',
+    'NeedlemanWunsch': '_needleman_wunsch',
+    'Overlap': '_overlap',
+    'Ozbay': '_ozbay',
+    'Pattern': '_pattern',
+    'PearsonChiSquared': '_pearson_chi_squared',
+    'PearsonHeronII': '_pearson_heron_ii',
+    'PearsonII': '_pearson_ii',
+    'PearsonIII': '_pearson_iii',
+    'PearsonPhi': '_pearson_phi',
+    'Peirce': '_peirce',
+    'PhoneticDistance': '_phonetic_distance',
+    'PhoneticEditDistance': '_phonetic_edit_distance',
+    'PositionalQGramDice': '_positional_q_gram_dice',
+    'PositionalQGramJaccard': '_positional_q_gram_jaccard',
+    'PositionalQGramOverlap': '_positional_q_gram_overlap',
+    'Prefix': '_prefix',
+    'QGram': '_q_gram',
+    'QuantitativeCosine': '_quantitative_cosine',
+    'QuantitativeDice': '_quantitative_dice',
+    'QuantitativeJaccard': '_quantitative_jaccard',
+    'RatcliffObershelp': '_ratcliff_obershelp',
+    'RaupCrick': '_raup_crick',
+    'ReesLevenshtein': '_rees_levenshtein',
+    'RelaxedHamming': '_relaxed_hamming',
+    'Roberts': '_roberts',
+    'RogersTanimoto': '_rogers_tanimoto',
+    'RogotGoldberg': '_rogot_goldberg',
+    'RougeL': '_rouge_l',
+    'RougeS': '_rouge_s',
+    'RougeSU': '_rouge_su',
+    'RougeW': '_rouge_w',
+    'RussellRao': '_russell_rao',
+    'SAPS': '_saps',
+    'ScottPi': '_scott_pi',
+    'Shape': '_shape',
+    'ShapiraStorerI': '_shapira_storer_i',
+    'Sift4': '_sift4',
+    'Sift4Extended': '_sift4_extended',
+    'Sift4Simplest': '_sift4_simplest',
+    'SimilarityJoin': '_similarity_join',
+    'SingleLinkage': '_single_linkage',
+    'Size': '_size',
+    'SmithWaterman': '_smith_waterman',
+    'SoftCosine': '_soft_cosine',
+    'SoftTFIDF': '_softtf_idf',
+    'SokalMichener': '_sokal_michener',
+    'SokalSneathI': '_sokal_sneath_i',
+    'SokalSneathII': '_sokal_sneath_ii',
+    'SokalSneathIII': '_sokal_sneath_iii',
+    'SokalSneathIV': '_sokal_sneath_iv',
+    'SokalSneathV': '_sokal_sneath_v',
+    'Sorgenfrei': '_sorgenfrei',
+    'SSK': '_ssk',
+    'Steffensen': '_steffensen',
+    'Stiles': '_stiles',
+    'Strcmp95': '_strcmp95',
+    'StuartTau': '_stuart_tau',
+    'Suffix': '_suffix',
+    'Synoname': '_synoname',
+    'Tarantula': '_tarantula',
+    'Tarwid': '_tarwid',
+    'Tetrachoric': '_tetrachoric',
+    'TFIDF': '_tf_idf',
+    'Tichy': '_tichy',
+    '_TokenDistance': '_token_distance',
+    'TullossR': '_tulloss_r',
+    'TullossS': '_tulloss_s',
+    'TullossT': '_tulloss_t',
+    'TullossU': '_tulloss_u',
+    'Tversky': '_tversky',
+    'Typo': '_typo',
+    'UnigramSubtuple': '_unigram_subtuple',
+    'UnknownA': '_unknown_a',
+    'UnknownB': '_unknown_b',
+    'UnknownC': '_unknown_c',
+    'UnknownD': '_unknown_d',
+    'UnknownE': '_unknown_e',
+    'UnknownF': '_unknown_f',
+    'UnknownG': '_unknown_g',
+    'UnknownH': '_unknown_h',
+    'UnknownI': '_unknown_i',
+    'UnknownJ': '_unknown_j',
+    'UnknownK': '_unknown_k',
+    'UnknownL': '_unknown_l',
+    'UnknownM': '_unknown_m',
+    'Upholt': '_upholt',
+    'VPS': '_vps',
+    'WarrensI': '_warrens_i',
+    'WarrensII': '_warrens_ii',
+    'WarrensIII': '_warrens_iii',
+    'WarrensIV': '_warrens_iv',
+    'WarrensV': '_warrens_v',
+    'WeightedJaccard': '_weighted_jaccard',
+    'Whittaker': '_whittaker',
+    'YatesChiSquared': '_yates_chi_squared',
+    'YJHHR': '_yjhhr',
+    'YujianBo': '_yujian_bo',
+    'YuleQ': '_yule_q',
+    'YuleQII': '_yule_q_ii',
+    'YuleY': '_yule_y',
+}
 
 __all__ = [
     '_Distance',
     '_TokenDistance',
+    '_NCD',
     'Levenshtein',
     'DamerauLevenshtein',
     'ShapiraStorerI',
@@ -921,9 +1260,61 @@ __all__ = [
     'VPS',
     'LIG3',
     'SSK',
+    'BKTree',
+    'LevenshteinTrie',
+    'SimilarityJoin',
+    'MinHashLSH',
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import and return a member of the package on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the member
+
+    Returns
+    -------
+    Any
+        The member
+
+    Raises
+    ------
+    AttributeError
+        module has no attribute
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if name in _MEMBER_MODULES:
+        module = import_module('.' + _MEMBER_MODULES[name], __name__)
+        member = getattr(module, name)
+        globals()[name] = member
+        return member
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name)
+    )
+
+
+def __dir__() -> List[str]:
+    """Return the names in the package, including those not yet imported.
+
+    .. versionadded:: 0.6.0
+
+    """
+    return sorted(set(globals()) | set(_MEMBER_MODULES))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module-level __getattr__ (PEP 562) requires Python 3.7, so earlier
+    # versions import every member up front.
+    for _name in _MEMBER_MODULES:
+        __getattr__(_name)
+
+
 if __name__ == '__main__':
     import doctest
 
@@ -110,17 +110,17 @@ class AverageLinkage(_TokenDistance):
         if not src and not tar:
             return 0.0
 
-        src = self.params['tokenizer'].tokenize(src).get_list()
-        tar = self.params['tokenizer'].tokenize(tar).get_list()
+        src_tok = self._token_list(src)
+        tar_tok = self._token_list(tar)
 
-        if not src or not tar:
+        if not src_tok or not tar_tok:
             return 1.0
 
         num = 0.0
-        den = len(src) * len(tar)
+        den = len(src_tok) * len(tar_tok)
 
-        for term_src in src:
-            for term_tar in tar:
+        for term_src in src_tok:
+            for term_tar in tar_tok:
                 num += self._metric.dist(term_src, term_tar)
 
         return num / den
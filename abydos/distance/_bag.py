@@ -123,8 +123,10 @@ class Bag(_TokenDistance):
         if tar == src:
             return 0
         elif not src:
+            self._check_tokens_available(tar)
             return len(tar)
         elif not tar:
+            self._check_tokens_available(src)
             return len(src)
 
         self._tokenize(src, tar)
@@ -0,0 +1,326 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._bk_tree.
+
+Burkhard-Keller tree index
+"""
+
+import pickle  # noqa: S403
+from heapq import heappop, heappush, heappushpop
+from inspect import signature
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._distance import _Distance
+from ._levenshtein import Levenshtein
+
+__all__ = ['BKTree']
+
+
+class BKTree:
+    """Burkhard-Keller tree.
+
+    A BK-tree :cite:`Burkhard:1973` indexes a set of strings by their
+    distances from one another under a metric, so that the strings within a
+    given distance of a query, or those nearest to it, can be found without
+    comparing the query to every string in the set.
+
+    Each node holds a string and has at most one child at each distance from
+    it. By the triangle inequality, only the children whose distance from a
+    node differs by at most k from the query's distance to that node can hold
+    strings within k of the query, so the remaining subtrees are skipped.
+
+    The measure used must be a metric with an integer-valued ``dist_abs``,
+    such as :py:class:`.Levenshtein`, :py:class:`.DamerauLevenshtein`,
+    :py:class:`.Hamming`, or :py:class:`.Indel`. (Levenshtein in OSA mode
+    does not satisfy the triangle inequality, so an index built with it may
+    miss some matches.)
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        words: Optional[Iterable[str]] = None,
+        metric: Optional[_Distance] = None,
+    ) -> None:
+        """Initialize BKTree instance.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The strings to add to the index
+        metric : _Distance
+            The metric used to index & search the strings. If None (the
+            default), Levenshtein distance is used.
+
+        Examples
+        --------
+        >>> tree = BKTree(['cat', 'hat', 'Niall', 'Neil', 'Nigel'])
+        >>> len(tree)
+        5
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._metric = metric if metric is not None else Levenshtein()
+
+        # The strings and, for each, a map from distance to the child at that
+        # distance, both indexed by node number. The root is node 0.
+        self._words = []  # type: List[str]
+        self._children = []  # type: List[Dict[int, int]]
+
+        self._bounded = (
+            'max_distance' in signature(self._metric.dist_abs).parameters
+        )
+
+        if words is not None:
+            for word in words:
+                self.add(word)
+
+    def __len__(self) -> int:
+        """Return the number of strings in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        """Return True if word is in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return bool(self.within(word, 0))
+
+    def add(self, word: str) -> None:
+        """Add a string to the index.
+
+        Strings that are already in the index (i.e. at distance 0 from a
+        string in the index) are not added again.
+
+        Parameters
+        ----------
+        word : str
+            The string to add
+
+        Examples
+        --------
+        >>> tree = BKTree(['cat', 'hat'])
+        >>> tree.add('Niall')
+        >>> tree.add('cat')
+        >>> len(tree)
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._words:
+            self._words.append(word)
+            self._children.append({})
+            return
+
+        node = 0
+        while True:
+            dist = int(self._metric.dist_abs(word, self._words[node]))
+            if dist == 0:
+                return
+            children = self._children[node]
+            if dist not in children:
+                children[dist] = len(self._words)
+                self._words.append(word)
+                self._children.append({})
+                return
+            node = children[dist]
+
+    def within(self, query: str, k: int) -> List[Tuple[str, int]]:
+        """Return the strings within distance k of query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        k : int
+            The greatest distance of strings to return
+
+        Returns
+        -------
+        list of tuple(str, int)
+            The strings within distance k of query & their distances, ordered
+            by distance
+
+        Examples
+        --------
+        >>> tree = BKTree(['cat', 'hat', 'Niall', 'Neil', 'Nigel'])
+        >>> tree.within('Neal', 2)
+        [('Neil', 1), ('Niall', 2)]
+        >>> tree.within('mat', 0)
+        []
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        matches = []  # type: List[Tuple[int, int]]
+        if not self._words:
+            return []
+
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            children = self._children[node]
+            dist = self._dist(query, node, k, children)
+            if dist <= k:
+                matches.append((dist, node))
+            for child_dist, child in children.items():
+                if dist - k <= child_dist <= dist + k:
+                    stack.append(child)
+
+        return [(self._words[node], dist) for dist, node in sorted(matches)]
+
+    def nearest(self, query: str, n: int = 1) -> List[Tuple[str, int]]:
+        """Return the n strings nearest to query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        n : int
+            The number of strings to return
+
+        Returns
+        -------
+        list of tuple(str, int)
+            The n strings nearest to query & their distances, ordered by
+            distance. Ties at the greatest distance returned are broken
+            arbitrarily.
+
+        Examples
+        --------
+        >>> tree = BKTree(['cat', 'hat', 'Niall', 'Neil', 'Nigel'])
+        >>> tree.nearest('Neal')
+        [('Neil', 1)]
+        >>> tree.nearest('mat', 2)
+        [('cat', 1), ('hat', 1)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if n < 1 or not self._words:
+            return []
+
+        # A max-heap (by negated distance) of the best n matches so far
+        best = []  # type: List[Tuple[int, int]]
+        # A min-heap of the subtrees yet to be searched, by the least distance
+        # that any string in each can be from the query
+        subtrees = [(0, 0)]
+        limit = None  # type: Optional[int]
+        while subtrees:
+            least, node = heappop(subtrees)
+            if limit is not None and least >= limit:
+                break
+            children = self._children[node]
+            dist = self._dist(query, node, limit, children)
+            if limit is None:
+                heappush(best, (-dist, -node))
+            elif dist < limit:
+                heappushpop(best, (-dist, -node))
+            if len(best) == n:
+                limit = -best[0][0]
+            for child_dist, child in children.items():
+                child_least = max(least, abs(child_dist - dist))
+                if limit is None or child_least < limit:
+                    heappush(subtrees, (child_least, child))
+
+        return [
+            (self._words[-node], -dist)
+            for dist, node in sorted(best, reverse=True)
+        ]
+
+    def save_tree(self, filename: str) -> None:
+        """Save the index to a file.
+
+        This employs pickle to save the index, including its metric.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the index to.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, mode='wb') as pkl:
+            pickle.dump((self._metric, self._words, self._children), pkl)
+
+    def load_tree(self, filename: str) -> None:
+        """Load the index from a file.
+
+        This employs pickle to load the index, replacing the current index and
+        its metric.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the index from.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, mode='rb') as pkl:
+            index = pickle.load(pkl)  # noqa: S301
+        self._metric, self._words, self._children = index
+        self._bounded = (
+            'max_distance' in signature(self._metric.dist_abs).parameters
+        )
+
+    def _dist(
+        self,
+        query: str,
+        node: int,
+        limit: Optional[int],
+        children: Dict[int, int],
+    ) -> int:
+        """Return the distance between query and a node's string.
+
+        If the metric supports a max_distance bound, the distance is computed
+        only as far as is needed to decide whether the node or any of its
+        children may be within limit of the query; beyond that a value
+        greater than limit plus the greatest distance to a child is returned.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._bounded and limit is not None:
+            bound = limit + max(children, default=0)
+            return int(
+                self._metric.dist_abs(  # type: ignore
+                    query, self._words[node], max_distance=bound
+                )
+            )
+        return int(self._metric.dist_abs(query, self._words[node]))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -19,7 +19,7 @@
 Levenshtein distance with block operations
 """
 
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from ._lcsstr import LCSstr
 from ._levenshtein import Levenshtein
@@ -53,6 +53,8 @@ class BlockLevenshtein(Levenshtein):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         super(BlockLevenshtein, self).__init__(
@@ -60,7 +62,9 @@ class BlockLevenshtein(Levenshtein):
         )
         self.lcs = LCSstr()
 
-    def dist_abs(self, src: str, tar: str) -> float:
+    def dist_abs(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the block Levenshtein edit distance between two strings.
 
         Parameters
@@ -69,6 +73,10 @@ class BlockLevenshtein(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, distances greater than this are not computed in full:
+            max_distance + 1 is returned instead, which is usually much faster
+            for dissimilar strings
 
         Returns
         -------
@@ -89,6 +97,8 @@ class BlockLevenshtein(Levenshtein):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         alphabet = set(src) | set(tar)
@@ -102,10 +112,12 @@ class BlockLevenshtein(Levenshtein):
             tar = tar.replace(p, chr(next_char))
             alphabet.add(chr(next_char))
             lcs = self.lcs.lcsstr(src, tar)
-        d = super(BlockLevenshtein, self).dist_abs(src, tar)
+        d = super(BlockLevenshtein, self).dist_abs(src, tar, max_distance)
         return d
 
-    def dist(self, src: str, tar: str) -> float:
+    def dist(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the normalized block Levenshtein distance between strings.
 
         Parameters
@@ -114,6 +126,9 @@ class BlockLevenshtein(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, normalized distances greater than this are not computed
+            in full: a value greater than max_distance is returned instead
 
         Returns
         -------
@@ -139,8 +154,14 @@ class BlockLevenshtein(Levenshtein):
         if src == tar:
             return 0.0
         ins_cost, del_cost = self._cost[:2]
-        return self.dist_abs(src, tar) / (
-            self._normalizer([len(src) * del_cost, len(tar) * ins_cost])
+        normalize_term = self._normalizer(
+            [len(src) * del_cost, len(tar) * ins_cost]
+        )
+        if max_distance is None:
+            return self.dist_abs(src, tar) / normalize_term
+        return (
+            self.dist_abs(src, tar, max_distance=max_distance * normalize_term)
+            / normalize_term
         )
 
 
@@ -161,8 +161,8 @@ class ChaoJaccard(_TokenDistance):
         src_card = self._src_card()  # n
         tar_card = self._tar_card()  # m
 
-        src_token_list = self.params['tokenizer'].tokenize(src).get_list()
-        tar_token_list = self.params['tokenizer'].tokenize(tar).get_list()
+        src_token_list = self._token_list(src)
+        tar_token_list = self._token_list(tar)
 
         src_sampled = Counter(choices(src_token_list, k=int(src_card)))
         tar_sampled = Counter(choices(tar_token_list, k=int(tar_card)))
@@ -20,10 +20,10 @@ Damerau-Levenshtein distance
 """
 
 from sys import maxsize
-from typing import Any, Callable, List, Tuple, cast
+from typing import Any, Callable, List, Optional, Tuple
 
+from numpy import full as np_full
 from numpy import int_ as np_int
-from numpy import zeros as np_zeros
 
 from ._distance import _Distance
 
@@ -70,7 +70,9 @@ class DamerauLevenshtein(_Distance):
         self._cost = cost
         self._normalizer = normalizer
 
-    def dist_abs(self, src: str, tar: str) -> float:
+    def dist_abs(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the Damerau-Levenshtein distance between two strings.
 
         Parameters
@@ -79,6 +81,10 @@ class DamerauLevenshtein(_Distance):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, distances greater than this are not computed in full:
+            max_distance + 1 is returned instead, which is usually much faster
+            for dissimilar strings
 
         Returns
         -------
@@ -102,21 +108,28 @@ class DamerauLevenshtein(_Distance):
         7
         >>> cmp.dist_abs('ATCG', 'TAGC')
         2
+        >>> cmp.dist_abs('aluminum', 'Catalan', max_distance=2)
+        3
 
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        src_len = len(src)
+        tar_len = len(tar)
 
         if src == tar:
             return 0
-        if not src:
-            return len(tar) * ins_cost
-        if not tar:
-            return len(src) * del_cost
+        if not src or not tar:
+            distance = tar_len * ins_cost if not src else src_len * del_cost
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
 
         if 2 * trans_cost < ins_cost + del_cost:
             raise ValueError(
@@ -124,13 +137,26 @@ class DamerauLevenshtein(_Distance):
                 + 'must not be less than the cost of an insert plus a delete.'
             )
 
-        d_mat = np_zeros((len(src), len(tar)), dtype=np_int)
-
-        if src[0] != tar[0]:
-            d_mat[0, 0] = min(sub_cost, ins_cost + del_cost)
+        # Reaching a cell off the diagonal by k takes at least k inserts or
+        # deletes, so if max_distance is set, only the cells in a band about
+        # the diagonal are computed :cite:`Ukkonen:1985`. The others are left
+        # at a value greater than max_distance.
+        band = max(src_len, tar_len)
+        out_of_band = 0
+        if max_distance is not None and min(ins_cost, del_cost) > 0:
+            band = int(max_distance // min(ins_cost, del_cost))
+            if abs(src_len - tar_len) > band:
+                return max_distance + 1
+            out_of_band = int(max_distance) + 1
+
+        d_mat = np_full((src_len, tar_len), out_of_band, dtype=np_int)
+
+        d_mat[0, 0] = (
+            0 if src[0] == tar[0] else min(sub_cost, ins_cost + del_cost)
+        )
 
         src_index_by_character = {src[0]: 0}
-        for i in range(1, len(src)):
+        for i in range(1, min(src_len, band + 1)):
             del_distance = d_mat[i - 1, 0] + del_cost
             ins_distance = (i + 1) * del_cost + ins_cost
             match_distance = i * del_cost + (
@@ -138,7 +164,7 @@ class DamerauLevenshtein(_Distance):
             )
             d_mat[i, 0] = min(del_distance, ins_distance, match_distance)
 
-        for j in range(1, len(tar)):
+        for j in range(1, min(tar_len, band + 1)):
             del_distance = (j + 1) * ins_cost + del_cost
             ins_distance = d_mat[0, j - 1] + ins_cost
             match_distance = j * ins_cost + (
@@ -146,9 +172,16 @@ class DamerauLevenshtein(_Distance):
             )
             d_mat[0, j] = min(del_distance, ins_distance, match_distance)
 
-        for i in range(1, len(src)):
-            max_src_letter_match_index = 0 if src[i] == tar[0] else -1
-            for j in range(1, len(tar)):
+        # A transposition from row a to a row below row i deletes at least
+        # i - a - 1 characters, so the least of d_mat[a].min() - a * del_cost
+        # over the rows above (and a virtual row -1 of zeros) bounds the
+        # distances reached that way.
+        jump_min = min(del_cost, d_mat[0].min())
+
+        for i in range(1, src_len):
+            first = max(1, i - band)
+            max_src_letter_match_index = tar.rfind(src[i], 0, first)
+            for j in range(first, min(tar_len, i + band + 1)):
                 candidate_swap_index = (
                     -1
                     if tar[j] not in src_index_by_character
@@ -186,9 +219,20 @@ class DamerauLevenshtein(_Distance):
                 )
             src_index_by_character[src[i]] = i
 
-        return cast(float, d_mat[len(src) - 1, len(tar) - 1])
+            if max_distance is not None:
+                row_min = d_mat[i].min()
+                if min(row_min, jump_min + (i - 1) * del_cost) > max_distance:
+                    return max_distance + 1
+                jump_min = min(jump_min, row_min - i * del_cost)
+
+        distance = d_mat[src_len - 1, tar_len - 1]
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
 
-    def dist(self, src: str, tar: str) -> float:
+    def dist(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the Damerau-Levenshtein similarity of two strings.
 
         Damerau-Levenshtein distance normalized to the interval [0, 1].
@@ -206,6 +250,9 @@ class DamerauLevenshtein(_Distance):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, normalized distances greater than this are not computed
+            in full: a value greater than max_distance is returned instead
 
         Returns
         -------
@@ -228,13 +275,21 @@ class DamerauLevenshtein(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         if src == tar:
             return 0.0
         ins_cost, del_cost = self._cost[:2]
-        return self.dist_abs(src, tar) / (
-            self._normalizer([len(src) * del_cost, len(tar) * ins_cost])
+        normalize_term = self._normalizer(
+            [len(src) * del_cost, len(tar) * ins_cost]
+        )
+        if max_distance is None:
+            return self.dist_abs(src, tar) / normalize_term
+        return (
+            self.dist_abs(src, tar, max_distance=max_distance * normalize_term)
+            / normalize_term
         )
 
 
@@ -20,7 +20,7 @@ Discounted Levenshtein edit distance
 """
 
 from math import log
-from typing import Any, Callable, List, Tuple, Union, cast
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -117,10 +117,8 @@ class DiscountedLevenshtein(Levenshtein):
     def _exp_discount(discounts: float) -> float:
         return 1 / (discounts + 1) ** 0.2
 
-    def _alignment_matrix(
-        self, src: str, tar: str, backtrace: bool = True
-    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
-        """Return the Levenshtein alignment matrix.
+    def _discount_positions(self, src: str, tar: str) -> List[int]:
+        """Return the positions in src & tar from which edits are discounted.
 
         Parameters
         ----------
@@ -128,21 +126,16 @@ class DiscountedLevenshtein(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
-        backtrace : bool
-            Return the backtrace matrix as well
 
         Returns
         -------
-        numpy.ndarray or tuple(numpy.ndarray, numpy.ndarray)
-            The alignment matrix and (optionally) the backtrace matrix
+        list of int
+            The positions in src & tar
 
 
-        .. versionadded:: 0.4.1
+        .. versionadded:: 0.6.0
 
         """
-        src_len = len(src)
-        tar_len = len(tar)
-
         if self._discount_from == 'coda':
             discount_from = [0, 0]
 
@@ -175,6 +168,118 @@ class DiscountedLevenshtein(Levenshtein):
         else:
             discount_from = [1, 1]
 
+        return discount_from
+
+    def _score(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
+        """Return the distance, computed without the full alignment matrix.
+
+        The matrix is computed one row at a time, keeping only the last two
+        rows (three in OSA mode), so memory use is linear in the length of
+        tar. If max_distance is set, computation stops once a row (or, in OSA
+        mode, two consecutive rows) holds no value of at most max_distance.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : float
+            The greatest distance of interest
+
+        Returns
+        -------
+        float
+            The distance between src & tar or, if it is greater than
+            max_distance, max_distance + 1
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_len = len(src)
+        tar_len = len(tar)
+        osa = self._mode == 'osa'
+
+        discount_from = self._discount_positions(src, tar)
+        tar_costs = [
+            self._discount_func(max(0, j - discount_from[1]))
+            for j in range(tar_len)
+        ]
+
+        prev_row = [0.0] * (tar_len + 1)
+        for j in range(1, tar_len + 1):
+            prev_row[j] = prev_row[j - 1] + self._discount_func(
+                max(0, j - discount_from[1])
+            )
+        prev_prev_row = prev_row
+
+        for i in range(src_len):
+            row = [0.0] * (tar_len + 1)
+            row[0] = prev_row[0] + self._discount_func(
+                max(0, i + 1 - discount_from[0])
+            )
+            i_extend = self._discount_func(max(0, i - discount_from[0]))
+            src_char = src[i]
+            for j in range(tar_len):
+                cost = min(i_extend, tar_costs[j])
+                row[j + 1] = min(
+                    row[j] + cost,  # ins
+                    prev_row[j + 1] + cost,  # del
+                    prev_row[j] + (cost if src_char != tar[j] else 0),  # sub
+                )
+                if (
+                    osa
+                    and i > 0
+                    and j > 0
+                    and src_char == tar[j - 1]
+                    and src[i - 1] == tar[j]
+                ):
+                    # transposition
+                    row[j + 1] = min(row[j + 1], prev_prev_row[j - 1] + cost)
+
+            if (
+                max_distance is not None
+                and min(row) > max_distance
+                and (not osa or min(prev_row) > max_distance)
+            ):
+                return max_distance + 1
+            prev_prev_row, prev_row = prev_row, row
+
+        if max_distance is not None and prev_row[tar_len] > max_distance:
+            return max_distance + 1
+        return prev_row[tar_len]
+
+    def _alignment_matrix(
+        self, src: str, tar: str, backtrace: bool = True
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Return the Levenshtein alignment matrix.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        backtrace : bool
+            Return the backtrace matrix as well
+
+        Returns
+        -------
+        numpy.ndarray or tuple(numpy.ndarray, numpy.ndarray)
+            The alignment matrix and (optionally) the backtrace matrix
+
+
+        .. versionadded:: 0.4.1
+
+        """
+        src_len = len(src)
+        tar_len = len(tar)
+
+        discount_from = self._discount_positions(src, tar)
+
         d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
         if backtrace:
             trace_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.int8)
@@ -224,7 +329,9 @@ class DiscountedLevenshtein(Levenshtein):
             return d_mat, trace_mat
         return d_mat
 
-    def dist_abs(self, src: str, tar: str) -> float:
+    def dist_abs(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the Levenshtein distance between two strings.
 
         Parameters
@@ -233,6 +340,10 @@ class DiscountedLevenshtein(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, distances greater than this are not computed in full:
+            max_distance + 1 is returned instead, which is usually much faster
+            for dissimilar strings
 
         Returns
         -------
@@ -259,6 +370,8 @@ class DiscountedLevenshtein(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         src_len = len(src)
@@ -273,26 +386,27 @@ class DiscountedLevenshtein(Levenshtein):
             discount_from = 1
 
         if not src:
-            return sum(
+            distance = sum(
                 self._discount_func(max(0, pos - discount_from))
                 for pos in range(tar_len)
             )
-        if not tar:
-            return sum(
+        elif not tar:
+            distance = sum(
                 self._discount_func(max(0, pos - discount_from))
                 for pos in range(src_len)
             )
-
-        d_mat = cast(
-            np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
-        )
-
-        if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
-            return int(d_mat[src_len, tar_len])
         else:
-            return cast(float, d_mat[src_len, tar_len])
+            distance = self._score(src, tar, max_distance)
+            if int(distance) == distance:
+                distance = int(distance)
 
-    def dist(self, src: str, tar: str) -> float:
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
+
+    def dist(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the normalized Levenshtein distance between two strings.
 
         The Levenshtein distance is normalized by dividing the Levenshtein
@@ -308,6 +422,9 @@ class DiscountedLevenshtein(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, normalized distances greater than this are not computed
+            in full: a value greater than max_distance is returned instead
 
         Returns
         -------
@@ -328,6 +445,8 @@ class DiscountedLevenshtein(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         if src == tar:
@@ -354,7 +473,12 @@ class DiscountedLevenshtein(Levenshtein):
             ]
         )
 
-        return self.dist_abs(src, tar) / normalize_term
+        if max_distance is None:
+            return self.dist_abs(src, tar) / normalize_term
+        return (
+            self.dist_abs(src, tar, max_distance=max_distance * normalize_term)
+            / normalize_term
+        )
 
 
 if __name__ == '__main__':
@@ -18,7 +18,9 @@
 
 The distance._distance module implements abstract class _Distance.
 """
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List, cast
+
+import numpy as np
 
 __all__ = ['_Distance']
 
@@ -122,6 +124,202 @@ class _Distance:
         """
         return self.dist(src, tar)
 
+    def pairwise(
+        self, srcs: Iterable[str], tars: Iterable[str], method: str = 'sim'
+    ) -> np.ndarray:
+        """Return the matrix of pairwise values between two collections.
+
+        Parameters
+        ----------
+        srcs : Iterable[str]
+            Source strings for comparison, one per row of the result
+        tars : Iterable[str]
+            Target strings for comparison, one per column of the result
+        method : str
+            The name of the measure to compute: ``sim`` (default), ``dist``,
+            or ``dist_abs``
+
+        Returns
+        -------
+        numpy.ndarray
+            A len(srcs) by len(tars) matrix, in which the value at [i, j] is
+            the value of method for srcs[i] and tars[j]
+
+        Raises
+        ------
+        ValueError
+            method must be one of 'sim', 'dist', or 'dist_abs'
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.pairwise(['cat', 'Niall'], ['hat', 'Neil', 'cat'], 'dist_abs')
+        array([[1., 4., 0.],
+               [4., 3., 4.]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        func = self._pairwise_func(method)
+        src_list = self._pairwise_prepare(srcs)
+        tar_list = self._pairwise_prepare(tars)
+
+        matrix = np.zeros((len(src_list), len(tar_list)), dtype=np.float_)
+        for i, src in enumerate(src_list):
+            matrix[i, :] = [func(src, tar) for tar in tar_list]
+        return matrix
+
+    def pairwise_self(
+        self,
+        strings: Iterable[str],
+        method: str = 'sim',
+        condensed: bool = False,
+    ) -> np.ndarray:
+        """Return the matrix of pairwise values within a collection.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings to compare with one another
+        method : str
+            The name of the measure to compute: ``sim`` (default), ``dist``,
+            or ``dist_abs``
+        condensed : bool
+            If True, only the values above the diagonal are computed and they
+            are returned as a flat array, in the same order as
+            scipy.spatial.distance.pdist (i.e. (0, 1), (0, 2), ... (1, 2), ...)
+            This assumes that the measure is symmetric.
+
+        Returns
+        -------
+        numpy.ndarray
+            A square matrix of the values of method for each pair of strings
+            or, if condensed is True, its upper triangle as a flat array
+
+        Raises
+        ------
+        ValueError
+            method must be one of 'sim', 'dist', or 'dist_abs'
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.pairwise_self(['Niall', 'Neal', 'Neil'], 'dist_abs')
+        array([[0., 2., 3.],
+               [2., 0., 1.],
+               [3., 1., 0.]])
+        >>> cmp.pairwise_self(['Niall', 'Neal', 'Neil'], 'dist_abs', True)
+        array([2., 3., 1.])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        func = self._pairwise_func(method)
+        str_list = self._pairwise_prepare(strings)
+        size = len(str_list)
+
+        if not condensed:
+            matrix = np.zeros((size, size), dtype=np.float_)
+            for i, src in enumerate(str_list):
+                matrix[i, :] = [func(src, tar) for tar in str_list]
+            return matrix
+
+        values = np.zeros(size * (size - 1) // 2, dtype=np.float_)
+        start = 0
+        for i in range(size - 1):
+            src = str_list[i]
+            row = [func(src, tar) for tar in str_list[i + 1 :]]
+            values[start : start + len(row)] = row
+            start += len(row)
+        return values
+
+    def sim_many(self, query: str, candidates: Iterable[str]) -> np.ndarray:
+        """Return the similarity of a string to each of a collection.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        candidates : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of query to each of candidates, in order
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.4, 0.6, 1. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.pairwise([query], candidates)[0]  # type: ignore
+
+    def _pairwise_func(self, method: str) -> Callable[[Any, Any], float]:
+        """Return the function used to score each pair in pairwise calls.
+
+        Subclasses may override this to supply a specialized kernel that
+        operates on the values returned by :py:meth:`_pairwise_prepare`.
+
+        Parameters
+        ----------
+        method : str
+            The name of the measure to compute: ``sim``, ``dist``, or
+            ``dist_abs``
+
+        Returns
+        -------
+        Callable
+            A function of two (prepared) strings
+
+        Raises
+        ------
+        ValueError
+            method must be one of 'sim', 'dist', or 'dist_abs'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if method not in {'sim', 'dist', 'dist_abs'}:
+            raise ValueError(
+                "method must be one of 'sim', 'dist', or 'dist_abs'"
+            )
+        return cast(Callable[[Any, Any], float], getattr(self, method))
+
+    def _pairwise_prepare(self, strings: Iterable[str]) -> List[Any]:
+        """Return the strings prepared for use by the pairwise kernel.
+
+        This is called once per collection, so that subclasses may perform
+        any per-string work (e.g. tokenization) once, rather than once per
+        pair.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings to prepare
+
+        Returns
+        -------
+        list
+            The prepared strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return list(strings)
+
 
 if __name__ == '__main__':
     import doctest
@@ -101,12 +101,8 @@ class FuzzyWuzzyTokenSort(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        src = ' '.join(
-            sorted(self.params['tokenizer'].tokenize(src).get_list())
-        )
-        tar = ' '.join(
-            sorted(self.params['tokenizer'].tokenize(tar).get_list())
-        )
+        src = ' '.join(sorted(self._token_list(src)))
+        tar = ' '.join(sorted(self._token_list(tar)))
 
         return SequenceMatcher(None, src, tar).ratio()
 
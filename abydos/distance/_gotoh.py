@@ -18,12 +18,11 @@
 
 Gotoh score
 """
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, cast
 
-from numpy import float_ as np_float
-from numpy import zeros as np_zeros
+import numpy as np
 
-from ._needleman_wunsch import NeedlemanWunsch
+from ._needleman_wunsch import NeedlemanWunsch, _diagonal_subst
 
 __all__ = ['Gotoh']
 
@@ -103,47 +102,7 @@ class Gotoh(NeedlemanWunsch):
             Encapsulated in class
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-        p_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-        q_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-
-        d_mat[0, 0] = 0
-        p_mat[0, 0] = float('-inf')
-        q_mat[0, 0] = float('-inf')
-        for i in range(1, len(src) + 1):
-            d_mat[i, 0] = float('-inf')
-            p_mat[i, 0] = -self._gap_open - self._gap_ext * (i - 1)
-            q_mat[i, 0] = float('-inf')
-            if len(tar) > 1:
-                q_mat[i, 1] = -self._gap_open
-        for j in range(1, len(tar) + 1):
-            d_mat[0, j] = float('-inf')
-            p_mat[0, j] = float('-inf')
-            if len(src) > 1:
-                p_mat[1, j] = -self._gap_open
-            q_mat[0, j] = -self._gap_open - self._gap_ext * (j - 1)
-
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                sim_val = self._sim_func(src[i - 1], tar[j - 1])
-                d_mat[i, j] = max(
-                    d_mat[i - 1, j - 1] + sim_val,
-                    p_mat[i - 1, j - 1] + sim_val,
-                    q_mat[i - 1, j - 1] + sim_val,
-                )
-
-                p_mat[i, j] = max(
-                    d_mat[i - 1, j] - self._gap_open,
-                    p_mat[i - 1, j] - self._gap_ext,
-                )
-
-                q_mat[i, j] = max(
-                    d_mat[i, j - 1] - self._gap_open,
-                    q_mat[i, j - 1] - self._gap_ext,
-                )
-
-        i, j = (n - 1 for n in d_mat.shape)
-        return cast(float, max(d_mat[i, j], p_mat[i, j], q_mat[i, j]))
+        return cast(float, self._scores([(src, tar)])[0])
 
     def sim(self, src: str, tar: str) -> float:
         """Return the normalized Gotoh score of two strings.
@@ -176,11 +135,79 @@ class Gotoh(NeedlemanWunsch):
         .. versionadded:: 0.4.1
 
         """
-        if src == tar:
-            return 1.0
-        return max(0.0, self.sim_score(src, tar)) / (
-            self.sim_score(src, src) ** 0.5 * self.sim_score(tar, tar) ** 0.5
-        )
+        return super(Gotoh, self).sim(src, tar)
+
+    def _align(
+        self,
+        subst: np.ndarray,
+        src_idx: np.ndarray,
+        tar_idx: np.ndarray,
+        src_lens: np.ndarray,
+        ends: Dict[int, List[int]],
+    ) -> np.ndarray:
+        """Return the alignment score of each pair of strings.
+
+        This is the anti-diagonal fill of :py:meth:`NeedlemanWunsch._align`,
+        over the three matrices of alignments ending in a match (d), a gap in
+        tar (p), and a gap in src (q).
+
+        .. versionadded:: 0.6.0
+
+        """
+        num_pairs, src_max = src_idx.shape
+        tar_max = tar_idx.shape[1]
+        gap_open = self._gap_open
+        gap_ext = self._gap_ext
+        scores = np.zeros(num_pairs, dtype=np.float_)
+        shape = (num_pairs, src_max + 1)
+
+        d_cur = np.zeros(shape, dtype=np.float_)
+        p_cur = np.full(shape, float('-inf'))
+        q_cur = np.full(shape, float('-inf'))
+        d_prev = p_prev = q_prev = d_cur
+        for diag in range(src_max + tar_max + 1):
+            if diag:
+                d_prev_2, p_prev_2, q_prev_2 = d_prev, p_prev, q_prev
+                d_prev, p_prev, q_prev = d_cur, p_cur, q_cur
+                d_cur = np.empty(shape, dtype=np.float_)
+                p_cur = np.empty(shape, dtype=np.float_)
+                q_cur = np.empty(shape, dtype=np.float_)
+                first = max(1, diag - tar_max)
+                last = min(src_max, diag - 1)
+                if first <= last:
+                    sim_val = _diagonal_subst(
+                        subst, src_idx, tar_idx, diag, first, last
+                    )
+                    d_cur[:, first : last + 1] = np.maximum(
+                        np.maximum(
+                            d_prev_2[:, first - 1 : last] + sim_val,
+                            p_prev_2[:, first - 1 : last] + sim_val,
+                        ),
+                        q_prev_2[:, first - 1 : last] + sim_val,
+                    )
+                    p_cur[:, first : last + 1] = np.maximum(
+                        d_prev[:, first - 1 : last] - gap_open,
+                        p_prev[:, first - 1 : last] - gap_ext,
+                    )
+                    q_cur[:, first : last + 1] = np.maximum(
+                        d_prev[:, first : last + 1] - gap_open,
+                        q_prev[:, first : last + 1] - gap_ext,
+                    )
+                gap = -gap_open - gap_ext * (diag - 1)
+                if diag <= tar_max:
+                    d_cur[:, 0] = p_cur[:, 0] = float('-inf')
+                    q_cur[:, 0] = gap
+                if diag <= src_max:
+                    d_cur[:, diag] = q_cur[:, diag] = float('-inf')
+                    p_cur[:, diag] = gap
+            if diag in ends:
+                nums = ends[diag]
+                cols = src_lens[nums]
+                scores[nums] = np.maximum(
+                    np.maximum(d_cur[nums, cols], p_cur[nums, cols]),
+                    q_cur[nums, cols],
+                )
+        return scores
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@
 Indel distance
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from ._levenshtein import Levenshtein
 
@@ -52,7 +52,9 @@ class Indel(Levenshtein):
             mode='lev', cost=(1, 1, float('inf'), float('inf')), **kwargs
         )
 
-    def dist(self, src: str, tar: str) -> float:
+    def dist(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the normalized indel distance between two strings.
 
         This is equivalent to normalized Levenshtein distance, when only
@@ -64,6 +66,9 @@ class Indel(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, normalized distances greater than this are not computed
+            in full: a value greater than max_distance is returned instead
 
         Returns
         -------
@@ -84,11 +89,19 @@ class Indel(Levenshtein):
 
 
         .. versionadded:: 0.3.6
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         if src == tar:
             return 0.0
-        return self.dist_abs(src, tar) / (len(src) + len(tar))
+        normalize_term = len(src) + len(tar)
+        if max_distance is None:
+            return self.dist_abs(src, tar) / normalize_term
+        return (
+            self.dist_abs(src, tar, max_distance=max_distance * normalize_term)
+            / normalize_term
+        )
 
 
 if __name__ == '__main__':
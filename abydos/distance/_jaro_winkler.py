@@ -23,7 +23,8 @@ The distance._JaroWinkler module implements distance metrics based on
     - Jaro-Winkler distance
 """
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
 
 from ._distance import _Distance
 from ..tokenizer import QGrams
@@ -31,6 +32,85 @@ from ..tokenizer import QGrams
 __all__ = ['JaroWinkler']
 
 
+@lru_cache(maxsize=4096)
+def _match_masks(tokens: Sequence[str]) -> Dict[str, int]:
+    """Return the positions of each token in a sequence, as bits of an int.
+
+    Parameters
+    ----------
+    tokens : Sequence[str]
+        A string or a tuple of tokens
+
+    Returns
+    -------
+    dict
+        A mapping of each token to an int with bit i set for each position i
+        at which the token occurs
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    masks = {}  # type: Dict[str, int]
+    bit = 1
+    for token in tokens:
+        masks[token] = masks.get(token, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _match_counts(
+    src: Sequence[str], tar: Sequence[str], search_range: int
+) -> Tuple[int, int]:
+    """Return the numbers of common tokens & of transpositions.
+
+    Each token of tar is matched with the first unmatched equal token of src
+    within search_range of its position. The candidates are found with the
+    bits of src's match masks, rather than by scanning the window.
+
+    Parameters
+    ----------
+    src : Sequence[str]
+        The source tokens
+    tar : Sequence[str]
+        The target tokens
+    search_range : int
+        The greatest distance between the positions of matched tokens
+
+    Returns
+    -------
+    tuple of int
+        The number of common tokens & the number of transpositions
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    masks = _match_masks(src)
+    last = len(src) - 1
+    src_flags = 0
+    tar_matched = []  # type: List[str]
+    for j, token in enumerate(tar):
+        mask = masks.get(token)
+        if mask is None:
+            continue
+        low_lim = j - search_range if j > search_range else 0
+        candidates = (mask & ~src_flags) >> low_lim
+        if candidates:
+            i = (candidates & -candidates).bit_length() - 1 + low_lim
+            if i <= last and i <= j + search_range:
+                src_flags |= 1 << i
+                tar_matched.append(token)
+
+    n_trans = 0
+    for token in tar_matched:
+        bit = src_flags & -src_flags
+        src_flags ^= bit
+        if src[bit.bit_length() - 1] != token:
+            n_trans += 1
+    return len(tar_matched), n_trans // 2
+
+
 class JaroWinkler(_Distance):
     """Jaro-Winkler distance.
 
@@ -144,6 +224,39 @@ class JaroWinkler(_Distance):
         .. versionchanged:: 0.3.6
             Encapsulated in class
 
+        """
+        self._check_params()
+        return self._sim_tokens(src, tar, self._tokens(src), self._tokens(tar))
+
+    def _pairwise_func(self, method: str) -> Callable[[Any, Any], float]:
+        """Return the kernel for pairwise calls, comparing prepared q-grams.
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(JaroWinkler, self)._pairwise_func(method)
+        self._check_params()
+
+        def _sim(src: Tuple[str, Sequence[str]], tar: Any) -> float:
+            return self._sim_tokens(src[0], tar[0], src[1], tar[1])
+
+        if method == 'sim':
+            return _sim
+        return lambda src, tar: 1.0 - _sim(src, tar)
+
+    def _pairwise_prepare(self, strings: Iterable[str]) -> List[Any]:
+        """Return each string paired with its q-grams.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [(string, self._tokens(string)) for string in strings]
+
+    def _check_params(self) -> None:
+        """Raise ValueError if the Winkler parameters are out of range.
+
+        .. versionadded:: 0.6.0
+
         """
         if self._mode == 'winkler':
             if self._boost_threshold > 1 or self._boost_threshold < 0:
@@ -157,15 +270,52 @@ class JaroWinkler(_Distance):
                     + 'scaling_factor must be between 0 and 0.25.'
                 )
 
+    def _tokens(self, string: str) -> Sequence[str]:
+        """Return the q-grams of a string, stripped of surrounding whitespace.
+
+        For the default q of 1, the stripped string itself is the sequence of
+        its q-grams.
+
+        .. versionadded:: 0.6.0
+
+        """
+        string = string.strip()
+        if self._qval == 1:
+            return string
+        return tuple(QGrams(self._qval).tokenize(string).get_list())
+
+    def _sim_tokens(
+        self,
+        src: str,
+        tar: str,
+        src_list: Sequence[str],
+        tar_list: Sequence[str],
+    ) -> float:
+        """Return the Jaro or Jaro-Winkler similarity of two strings' q-grams.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        src_list : Sequence[str]
+            The q-grams of src
+        tar_list : Sequence[str]
+            The q-grams of tar
+
+        Returns
+        -------
+        float
+            Jaro or Jaro-Winkler similarity
+
+
+        .. versionadded:: 0.6.0
+
+        """
         if src == tar:
             return 1.0
 
-        tokenizer = QGrams(self._qval)
-        tokenizer.tokenize(src.strip())
-        src_list = tokenizer.get_list()
-        tokenizer.tokenize(tar.strip())
-        tar_list = tokenizer.get_list()
-
         lens = len(src_list)
         lent = len(tar_list)
 
@@ -180,42 +330,16 @@ class JaroWinkler(_Distance):
             search_range = lent
             minv = lens
 
-        # Zero out the flags
-        src_flag = [0] * search_range
-        tar_flag = [0] * search_range
-        search_range = max(0, search_range // 2 - 1)
-
-        # Looking only within the search range,
-        # count and flag the matched pairs.
-        num_com = 0
-        yl1 = lent - 1
-        for i in range(lens):
-            low_lim = (i - search_range) if (i >= search_range) else 0
-            hi_lim = (i + search_range) if ((i + search_range) <= yl1) else yl1
-            for j in range(low_lim, hi_lim + 1):
-                if (tar_flag[j] == 0) and (tar_list[j] == src_list[i]):
-                    tar_flag[j] = 1
-                    src_flag[i] = 1
-                    num_com += 1
-                    break
+        # Looking only within the search range, count the matched pairs and
+        # the transpositions among them.
+        num_com, n_trans = _match_counts(
+            src_list, tar_list, max(0, search_range // 2 - 1)
+        )
 
         # If no characters in common - return
         if num_com == 0:
             return 0.0
 
-        # Count the number of transpositions
-        k = n_trans = 0
-        for i in range(lens):
-            if src_flag[i] != 0:
-                j = 0
-                for j in range(k, lent):  # pragma: no branch
-                    if tar_flag[j] != 0:
-                        k = j + 1
-                        break
-                if src_list[i] != tar_list[j]:
-                    n_trans += 1
-        n_trans //= 2
-
         # Main weight computation for Jaro distance
         weight = (
             num_com / lens + num_com / lent + (num_com - n_trans) / num_com
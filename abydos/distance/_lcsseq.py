@@ -19,7 +19,7 @@
 Longest common subsequence
 """
 
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List
 
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
@@ -127,6 +127,64 @@ class LCSseq(_Distance):
                 j -= 1
         return result
 
+    def lcsseq_len(self, src: str, tar: str) -> int:
+        """Return the length of the longest common subsequence of two strings.
+
+        This is the bit-vector algorithm of :cite:`Allison:1986`, in the form
+        given by :cite:`Hyyro:2004`, which computes the length without
+        building the full table. Each row of the table is represented by the
+        bits of its horizontal deltas. Since Python ints have arbitrary
+        precision, a single int holds the row for a string of any length.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        int
+            The length of the longest common subsequence
+
+        Examples
+        --------
+        >>> sseq = LCSseq()
+        >>> sseq.lcsseq_len('cat', 'hat')
+        2
+        >>> sseq.lcsseq_len('Niall', 'Neil')
+        3
+        >>> sseq.lcsseq_len('aluminum', 'Catalan')
+        3
+        >>> sseq.lcsseq_len('ATCG', 'TAGC')
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # The longer string forms the bit-vectors, so that the loop below runs
+        # over the shorter.
+        if len(src) < len(tar):
+            src, tar = tar, src
+
+        match_masks = {}  # type: Dict[str, int]
+        bit = 1
+        for char in src:
+            match_masks[char] = match_masks.get(char, 0) | bit
+            bit <<= 1
+        mask = bit - 1
+
+        # The zero bits of row mark the positions at which the LCS grows.
+        row = mask
+        for char in tar:
+            match = match_masks.get(char)
+            if match is not None:
+                matched = row & match
+                row = ((row + matched) | (row - matched)) & mask
+        return len(src) - bin(row).count('1')
+
     def sim(self, src: str, tar: str) -> float:
         r"""Return the longest common subsequence similarity of two strings.
 
@@ -170,7 +228,7 @@ class LCSseq(_Distance):
             return 1.0
         elif not src or not tar:
             return 0.0
-        return len(self.lcsseq(src, tar)) / self._normalizer(
+        return self.lcsseq_len(src, tar) / self._normalizer(
             [len(src), len(tar)]
         )
 
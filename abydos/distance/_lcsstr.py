@@ -19,16 +19,92 @@
 Longest common substring
 """
 
-from typing import Any, Callable, List
-
-from numpy import int_ as np_int
-from numpy import zeros as np_zeros
+from typing import Any, Callable, Dict, List, Tuple
 
 from ._distance import _Distance
 
 __all__ = ['LCSstr']
 
 
+def _lcsstr_stl(src: str, tar: str) -> Tuple[int, int, int]:
+    """Return start positions & length of the longest common substring.
+
+    A suffix automaton of tar :cite:`Blumer:1985` is built, and src is run
+    through it, tracking the longest suffix of each prefix of src that occurs
+    in tar. This takes time linear in the lengths of the strings, rather than
+    proportional to their product.
+
+    Of the longest common substrings, the one returned is the first to end in
+    src, at its first occurrence in tar.
+
+    Parameters
+    ----------
+    src : str
+        Source string for comparison
+    tar : str
+        Target string for comparison
+
+    Returns
+    -------
+    tuple
+        The start position in the source string, start position in the
+        target string, and length of the longest common substring of
+        strings src and tar.
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # The transitions, suffix link, length of the longest string, & end
+    # position of the first occurrence of each state. The root is state 0.
+    trans = [{}]  # type: List[Dict[str, int]]
+    link = [-1]
+    length = [0]
+    first_end = [0]
+
+    last = 0
+    for pos, char in enumerate(tar, 1):
+        cur = len(length)
+        trans.append({})
+        link.append(0)
+        length.append(length[last] + 1)
+        first_end.append(pos)
+        state = last
+        while state != -1 and char not in trans[state]:
+            trans[state][char] = cur
+            state = link[state]
+        if state != -1:
+            nxt = trans[state][char]
+            if length[state] + 1 == length[nxt]:
+                link[cur] = nxt
+            else:
+                clone = len(length)
+                trans.append(dict(trans[nxt]))
+                link.append(link[nxt])
+                length.append(length[state] + 1)
+                first_end.append(first_end[nxt])
+                while state != -1 and trans[state].get(char) == nxt:
+                    trans[state][char] = clone
+                    state = link[state]
+                link[nxt] = link[cur] = clone
+        last = cur
+
+    longest, src_longest, tar_longest = 0, 0, 0
+    state = matched = 0
+    for pos, char in enumerate(src, 1):
+        while state and char not in trans[state]:
+            state = link[state]
+            matched = length[state]
+        if char in trans[state]:
+            state = trans[state][char]
+            matched += 1
+            if matched > longest:
+                longest = matched
+                src_longest = pos
+                tar_longest = first_end[state]
+    return src_longest - longest, tar_longest - longest, longest
+
+
 class LCSstr(_Distance):
     """Longest common substring.
 
@@ -63,14 +139,11 @@ class LCSstr(_Distance):
 
         Longest common substring (LCSstr).
 
-        Based on the code from
+        This employs a suffix automaton of tar :cite:`Blumer:1985`, which
+        takes linear time, in place of the dynamic programming table of
         https://en.wikibooks.org/wiki/Algorithm_Implementation/Strings/Longest_common_substring
-        :cite:`Wikibooks:2018`.
-        This is licensed Creative Commons: Attribution-ShareAlike 3.0.
-
-        Modifications include:
-
-            - conversion to a numpy array in place of a list of lists
+        :cite:`Wikibooks:2018`. Of the longest common substrings, the first to
+        end in src is returned.
 
         Parameters
         ----------
@@ -102,18 +175,8 @@ class LCSstr(_Distance):
             Encapsulated in class
 
         """
-        lengths = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
-        longest, i_longest = 0, 0
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                if src[i - 1] == tar[j - 1]:
-                    lengths[i, j] = lengths[i - 1, j - 1] + 1
-                    if lengths[i, j] > longest:
-                        longest = lengths[i, j]
-                        i_longest = i
-                else:
-                    lengths[i, j] = 0
-        return src[i_longest - longest : i_longest]
+        start, _, longest = _lcsstr_stl(src, tar)
+        return src[start : start + longest]
 
     def sim(self, src: str, tar: str) -> float:
         r"""Return the longest common substring similarity of two strings.
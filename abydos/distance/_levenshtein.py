@@ -24,8 +24,9 @@ based on Levenshtein distance, including:
 """
 
 import unicodedata
+from functools import lru_cache
 from sys import float_info
-from typing import Any, Callable, List, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -34,6 +35,173 @@ from ._distance import _Distance
 __all__ = ['Levenshtein']
 
 
+@lru_cache(maxsize=None)
+def _is_vowel(char: str) -> bool:
+    """Return True if char is a vowel (ignoring case & diacritics).
+
+    Since the alphabet of any text is small, each character's classification
+    is cached after its first use.
+
+    Parameters
+    ----------
+    char : str
+        The character to classify
+
+    Returns
+    -------
+    bool
+        True if char is a vowel
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # follow BERT in using NFD
+    # setup from https://stackoverflow.com/a/517974
+    char = ''.join(
+        [
+            c
+            for c in unicodedata.normalize('NFD', char)
+            if not unicodedata.combining(c)
+        ]
+    )
+    return char.lower() in ('a', 'e', 'i', 'o', 'u')
+
+
+@lru_cache(maxsize=4096)
+def _vowel_mask(string: str) -> Tuple[bool, ...]:
+    """Return whether each character of string is a vowel.
+
+    Parameters
+    ----------
+    string : str
+        The string to classify
+
+    Returns
+    -------
+    tuple of bool
+        True for each vowel in string, False for each other character
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return tuple(map(_is_vowel, string))
+
+
+@lru_cache(maxsize=4096)
+def _remove_vowels(string: str) -> str:
+    """Return string without its vowels.
+
+    .. versionadded:: 0.6.0
+
+    """
+    return ''.join(c for c in string if not _is_vowel(c))
+
+
+@lru_cache(maxsize=4096)
+def _fold_vowels(string: str) -> str:
+    """Return string with each of its vowels replaced by 'a'.
+
+    .. versionadded:: 0.6.0
+
+    """
+    return ''.join('a' if _is_vowel(c) else c for c in string)
+
+
+def _bit_parallel_dist(
+    src: str,
+    tar: str,
+    osa: bool = False,
+    max_distance: Optional[float] = None,
+) -> int:
+    """Return the unit-cost Levenshtein or OSA distance between two strings.
+
+    This is the bit-vector algorithm of :cite:`Myers:1999`, in the form given
+    by :cite:`Hyyro:2003`, which also supports the Optimal String Alignment
+    distance. Each column of the dynamic programming matrix is represented by
+    the bits of its vertical deltas. Since Python ints have arbitrary
+    precision, a single int holds the column for a string of any length, in
+    place of the multi-word blocks of the original algorithm.
+
+    Parameters
+    ----------
+    src : str
+        Source string for comparison
+    tar : str
+        Target string for comparison
+    osa : bool
+        Compute the Optimal String Alignment distance, rather than the
+        Levenshtein distance
+    max_distance : float
+        If set, computation stops as soon as the distance is known to be
+        greater than this
+
+    Returns
+    -------
+    int
+        The distance between src & tar or, if computation stopped early, a
+        lower bound on it that is greater than max_distance
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # The longer string forms the bit-vectors, so that the loop below runs
+    # over the shorter.
+    if len(src) < len(tar):
+        src, tar = tar, src
+    if not tar or (
+        max_distance is not None and len(src) - len(tar) > max_distance
+    ):
+        return len(src) - len(tar)
+
+    match_masks = {}  # type: Dict[str, int]
+    bit = 1
+    for char in src:
+        match_masks[char] = match_masks.get(char, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1
+
+    pos_vec = mask
+    neg_vec = 0
+    diag = 0
+    prev_match = 0
+    dist = len(src)
+    # The last row of the matrix changes by at most 1 per column, so the
+    # distance is at least dist minus the number of columns remaining.
+    limit = len(tar) + (
+        max_distance if max_distance is not None else float('inf')
+    )
+    for processed, char in enumerate(tar, 1):
+        match = match_masks.get(char, 0)
+        if osa:
+            diag = (
+                ((((~diag) & match) << 1) & prev_match)
+                | (((match & pos_vec) + pos_vec) ^ pos_vec)
+                | match
+                | neg_vec
+            )
+            prev_match = match
+        else:
+            diag = (((match & pos_vec) + pos_vec) ^ pos_vec) | match | neg_vec
+        pos_hor = neg_vec | ~(diag | pos_vec)
+        neg_hor = pos_vec & diag
+        if pos_hor & last:
+            dist += 1
+        elif neg_hor & last:
+            dist -= 1
+        pos_hor = ((pos_hor << 1) | 1) & mask
+        neg_hor = (neg_hor << 1) & mask
+        pos_vec = (neg_hor | ~(diag | pos_hor)) & mask
+        neg_vec = pos_hor & diag
+        if dist + processed > limit:
+            return dist + processed - len(tar)
+
+    return dist
+
+
 class Levenshtein(_Distance):
     """Levenshtein distance.
 
@@ -48,11 +216,16 @@ class Levenshtein(_Distance):
     :cite:`Wagner:1974`.
 
     Levenshtein edit distance ordinarily has unit insertion, deletion, and
-    substitution costs.
+    substitution costs. With these (and a unit transposition cost for Optimal
+    String Alignment), and without tapering or vowel options, the distance
+    is computed with the bit-parallel algorithm of :cite:`Myers:1999` and
+    :cite:`Hyyro:2003`.
 
     .. versionadded:: 0.3.6
     .. versionchanged:: 0.4.0
         Added taper option
+    .. versionchanged:: 0.6.0
+        Added bit-parallel computation of unit-cost distances
     """
 
     def __init__(
@@ -118,18 +291,59 @@ class Levenshtein(_Distance):
             else 1
         )
 
+    def _bit_parallel(self) -> bool:
+        """Return True if the bit-parallel algorithm may be used.
+
+        This is checked on each call, since Synoname varies _cost.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        if not ins_cost == del_cost == sub_cost == 1 or self._taper_enabled:
+            return False
+        if self._vowel_ignorance or self._vowel_ignorance_ins_del:
+            # See _bit_parallel_strings; this does not hold for OSA, since
+            # it would permit transpositions of distinct vowels.
+            return self._mode == 'lev'
+        return self._mode == 'lev' or (self._mode == 'osa' and trans_cost == 1)
+
+    def _bit_parallel_strings(self, src: str, tar: str) -> Tuple[str, str]:
+        """Return the strings to compare with the bit-parallel algorithm.
+
+        When vowels may be inserted & deleted freely, the (unit-cost)
+        distance is the distance between the strings without their vowels,
+        since substituting a vowel never costs less than deleting it and
+        inserting its replacement. When vowels may be substituted for each
+        other freely, it is the distance between the strings with all vowels
+        replaced by the same vowel.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        tuple of str
+            The strings to compare
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._vowel_ignorance_ins_del:
+            return _remove_vowels(src), _remove_vowels(tar)
+        if self._vowel_ignorance:
+            return _fold_vowels(src), _fold_vowels(tar)
+        return src, tar
+
     @staticmethod
     def _is_vowel(char: str) -> bool:
-        # follow BERT in using NFD
-        # setup from https://stackoverflow.com/a/517974
-        char = "".join(
-            [
-                c
-                for c in unicodedata.normalize("NFD", char)
-                if not unicodedata.combining(c)
-            ]
-        )
-        return char.lower() in ('a', 'e', 'i', 'o', 'u')
+        return _is_vowel(char)
 
     def _alignment_matrix(
         self, src: str, tar: str, backtrace: bool = True
@@ -157,19 +371,21 @@ class Levenshtein(_Distance):
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
 
         if self._no_vowels:
-            src = ''.join(c for c in src if not self._is_vowel(c))
-            tar = ''.join(c for c in tar if not self._is_vowel(c))
+            src = _remove_vowels(src)
+            tar = _remove_vowels(tar)
 
         src_len = len(src)
         tar_len = len(tar)
         max_len = max(src_len, tar_len)
 
+        src_is_vowel = _vowel_mask(src)
+        tar_is_vowel = _vowel_mask(tar)
         if self._vowel_ignorance_ins_del:
-            src_vow = [self._is_vowel(c) for c in src]
-            tar_vow = [self._is_vowel(c) for c in tar]
+            src_vow = src_is_vowel
+            tar_vow = tar_is_vowel
         else:
-            src_vow = [False for _ in src]
-            tar_vow = [False for _ in tar]
+            src_vow = (False,) * src_len
+            tar_vow = (False,) * tar_len
 
         d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
         if backtrace:
@@ -203,10 +419,7 @@ class Levenshtein(_Distance):
                         (
                             sub_cost
                             if not self._vowel_ignorance
-                            or not (
-                                self._is_vowel(src[i])
-                                and self._is_vowel(tar[j])
-                            )
+                            or not (src_is_vowel[i] and tar_is_vowel[j])
                             else 0
                         )
                         * self._taper(1 + max(i, j), max_len)
@@ -238,6 +451,120 @@ class Levenshtein(_Distance):
             return d_mat, trace_mat
         return d_mat
 
+    def _score(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
+        """Return the distance, computed without the full alignment matrix.
+
+        The matrix is computed one row at a time, keeping only the last two
+        rows (three in OSA mode), so memory use is linear in the length of
+        tar.
+
+        If max_distance is set, only the cells in the diagonal band that may
+        hold values of at most max_distance are computed :cite:`Ukkonen:1985`,
+        and computation stops once a row (or, in OSA mode, two consecutive
+        rows) holds no such value.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : float
+            The greatest distance of interest
+
+        Returns
+        -------
+        float
+            The distance between src & tar or, if it is greater than
+            max_distance, max_distance + 1
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        src_len = len(src)
+        tar_len = len(tar)
+        max_len = max(src_len, tar_len)
+        osa = self._mode == 'osa'
+
+        src_is_vowel = _vowel_mask(src)
+        tar_is_vowel = _vowel_mask(tar)
+        if self._vowel_ignorance_ins_del:
+            src_del = [0 if vowel else del_cost for vowel in src_is_vowel]
+            tar_ins = [0 if vowel else ins_cost for vowel in tar_is_vowel]
+        else:
+            src_del = [del_cost] * src_len
+            tar_ins = [ins_cost] * tar_len
+
+        # Reaching a cell off the diagonal by k takes at least k inserts or
+        # deletes, and tapering only increases their costs.
+        band = max_len
+        min_indel = min(src_del + tar_ins)
+        if max_distance is not None and min_indel > 0:
+            band = int(max_distance // min_indel)
+            if abs(src_len - tar_len) > band:
+                return max_distance + 1
+
+        inf = float('inf')
+        prev_row = [inf] * (tar_len + 1)
+        prev_row[0] = 0
+        for j in range(1, min(tar_len, band) + 1):
+            prev_row[j] = (
+                prev_row[j - 1] + self._taper(j, max_len) * tar_ins[j - 1]
+            )
+        prev_prev_row = prev_row
+        first_col = 0.0
+
+        for i in range(1, src_len + 1):
+            row = [inf] * (tar_len + 1)
+            first_col += self._taper(i, max_len) * src_del[i - 1]
+            if i <= band:
+                row[0] = first_col
+            src_char = src[i - 1]
+            for j in range(max(1, i - band), min(tar_len, i + band) + 1):
+                tar_char = tar[j - 1]
+                taper = self._taper(max(i, j), max_len)
+                if src_char == tar_char or (
+                    self._vowel_ignorance
+                    and src_is_vowel[i - 1]
+                    and tar_is_vowel[j - 1]
+                ):
+                    sub = prev_row[j - 1]
+                else:
+                    sub = prev_row[j - 1] + sub_cost * taper
+                row[j] = min(
+                    row[j - 1] + tar_ins[j - 1] * taper,
+                    prev_row[j] + src_del[i - 1] * taper,
+                    sub,
+                )
+                if (
+                    osa
+                    and i > 1
+                    and j > 1
+                    and src_char == tar[j - 2]
+                    and src[i - 2] == tar_char
+                ):
+                    row[j] = min(
+                        row[j], prev_prev_row[j - 2] + trans_cost * taper
+                    )
+
+            # Every path to the last row passes through this row or, by a
+            # transposition, the previous one.
+            if (
+                max_distance is not None
+                and min(row) > max_distance
+                and (not osa or min(prev_row) > max_distance)
+            ):
+                return max_distance + 1
+            prev_prev_row, prev_row = prev_row, row
+
+        if max_distance is not None and prev_row[tar_len] > max_distance:
+            return max_distance + 1
+        return prev_row[tar_len]
+
     def alignment(self, src: str, tar: str) -> Tuple[float, str, str]:
         """Return the Levenshtein alignment of two strings.
 
@@ -277,8 +604,8 @@ class Levenshtein(_Distance):
 
         """
         if self._no_vowels:
-            src = ''.join(c for c in src if not self._is_vowel(c))
-            tar = ''.join(c for c in tar if not self._is_vowel(c))
+            src = _remove_vowels(src)
+            tar = _remove_vowels(tar)
         d_mat, trace_mat = self._alignment_matrix(src, tar, backtrace=True)
 
         src_aligned = []
@@ -318,7 +645,9 @@ class Levenshtein(_Distance):
 
         return distance, ''.join(src_aligned[::-1]), ''.join(tar_aligned[::-1])
 
-    def dist_abs(self, src: str, tar: str) -> float:
+    def dist_abs(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the Levenshtein distance between two strings.
 
         Parameters
@@ -327,6 +656,10 @@ class Levenshtein(_Distance):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, distances greater than this are not computed in full:
+            max_distance + 1 is returned instead, which is usually much faster
+            for dissimilar strings
 
         Returns
         -------
@@ -351,16 +684,24 @@ class Levenshtein(_Distance):
         >>> cmp.dist_abs('ACTG', 'TAGC')
         4
 
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_abs('Niall', 'Neil', max_distance=2)
+        3
+        >>> cmp.dist_abs('aluminum', 'Catalan', max_distance=2)
+        3
+
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
         if self._no_vowels:
-            src = ''.join(c for c in src if not self._is_vowel(c))
-            tar = ''.join(c for c in tar if not self._is_vowel(c))
+            src = _remove_vowels(src)
+            tar = _remove_vowels(tar)
 
         src_len = len(src)
         tar_len = len(tar)
@@ -369,24 +710,31 @@ class Levenshtein(_Distance):
         if src == tar:
             return 0
         if not src:
-            return sum(
+            distance = sum(
                 ins_cost * self._taper(pos, max_len) for pos in range(tar_len)
             )
-        if not tar:
-            return sum(
+        elif not tar:
+            distance = sum(
                 del_cost * self._taper(pos, max_len) for pos in range(src_len)
             )
-
-        d_mat = cast(
-            np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
-        )
-
-        if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
-            return int(d_mat[src_len, tar_len])
+        elif self._bit_parallel():
+            distance = _bit_parallel_dist(
+                *self._bit_parallel_strings(src, tar),
+                osa=self._mode == 'osa',
+                max_distance=max_distance
+            )
         else:
-            return cast(float, d_mat[src_len, tar_len])
+            distance = self._score(src, tar, max_distance)
+            if int(distance) == distance:
+                distance = int(distance)
+
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
 
-    def dist(self, src: str, tar: str) -> float:
+    def dist(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the normalized Levenshtein distance between two strings.
 
         The Levenshtein distance is normalized by dividing the Levenshtein
@@ -402,6 +750,9 @@ class Levenshtein(_Distance):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, normalized distances greater than this are not computed
+            in full: a value greater than max_distance is returned instead
 
         Returns
         -------
@@ -419,19 +770,23 @@ class Levenshtein(_Distance):
         0.875
         >>> cmp.dist('ATCG', 'TAGC')
         0.75
+        >>> cmp.dist('aluminum', 'Catalan', max_distance=0.25)
+        0.375
 
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         if src == tar:
             return 0.0
         ins_cost, del_cost = self._cost[:2]
         if self._no_vowels:
-            src = ''.join(c for c in src if not self._is_vowel(c))
-            tar = ''.join(c for c in tar if not self._is_vowel(c))
+            src = _remove_vowels(src)
+            tar = _remove_vowels(tar)
 
         src_len = len(src)
         tar_len = len(tar)
@@ -454,7 +809,12 @@ class Levenshtein(_Distance):
                 [src_len * del_cost, tar_len * ins_cost]
             )
 
-        abs_dist = self.dist_abs(src, tar)
+        if max_distance is None:
+            abs_dist = self.dist_abs(src, tar)
+        else:
+            abs_dist = self.dist_abs(
+                src, tar, max_distance=max_distance * normalize_term
+            )
         if normalize_term == 0:
             assert abs_dist == 0
             return 0
@@ -0,0 +1,420 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._levenshtein_trie.
+
+Levenshtein trie index
+"""
+
+import pickle  # noqa: S403
+from heapq import heappop, heappush
+from typing import Dict, Iterable, List, Optional, Tuple
+
+__all__ = ['LevenshteinTrie']
+
+
+class LevenshteinTrie:
+    """Levenshtein trie.
+
+    A trie of a lexicon that is searched for the words within a given
+    Levenshtein (or Optimal String Alignment) distance of a query, or those
+    nearest to it :cite:`Shang:1996`.
+
+    Walking the trie computes one row of the Levenshtein matrix per node, so
+    the rows for a prefix are computed once for all of the words sharing it.
+    A subtree is abandoned once no cell of its row is within the distance
+    searched for, since no word beneath it can then be within that distance.
+
+    Distances are those of :py:class:`.Levenshtein` with the same mode & cost
+    from the query to each word.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        words: Optional[Iterable[str]] = None,
+        mode: str = 'lev',
+        cost: Tuple[float, float, float, float] = (1, 1, 1, 1),
+    ) -> None:
+        """Initialize LevenshteinTrie instance.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words to add to the index
+        mode : str
+            Specifies a mode for computing the Levenshtein distance:
+
+                - ``lev`` (default) computes the ordinary Levenshtein distance,
+                  in which edits may include inserts, deletes, and
+                  substitutions
+                - ``osa`` computes the Optimal String Alignment distance, in
+                  which edits may include inserts, deletes, substitutions, and
+                  transpositions but substrings may only be edited once
+
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+            (by default: (1, 1, 1, 1))
+
+        Examples
+        --------
+        >>> trie = LevenshteinTrie(['cat', 'hat', 'Niall', 'Neil', 'Nigel'])
+        >>> len(trie)
+        5
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._mode = mode
+        self._cost = cost
+
+        # The children of each node, by character, and the word ending at
+        # each node (if any), both indexed by node number. The root is node 0.
+        self._children = [{}]  # type: List[Dict[str, int]]
+        self._words = [None]  # type: List[Optional[str]]
+        self._size = 0
+
+        if words is not None:
+            for word in words:
+                self.add(word)
+
+    def __len__(self) -> int:
+        """Return the number of words in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        """Return True if word is in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        node = 0
+        for char in word:
+            if char not in self._children[node]:
+                return False
+            node = self._children[node][char]
+        return self._words[node] is not None
+
+    def add(self, word: str) -> None:
+        """Add a word to the index.
+
+        Parameters
+        ----------
+        word : str
+            The word to add
+
+        Examples
+        --------
+        >>> trie = LevenshteinTrie(['cat', 'hat'])
+        >>> trie.add('Niall')
+        >>> trie.add('cat')
+        >>> len(trie)
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        node = 0
+        for char in word:
+            children = self._children[node]
+            if char not in children:
+                children[char] = len(self._children)
+                self._children.append({})
+                self._words.append(None)
+            node = children[char]
+        if self._words[node] is None:
+            self._words[node] = word
+            self._size += 1
+
+    def within(self, query: str, k: float) -> List[Tuple[str, float]]:
+        """Return the words within distance k of query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        k : float
+            The greatest distance of words to return
+
+        Returns
+        -------
+        list of tuple(str, float)
+            The words within distance k of query & their distances, ordered
+            by distance
+
+        Examples
+        --------
+        >>> trie = LevenshteinTrie(['cat', 'hat', 'Niall', 'Neil', 'Nigel'])
+        >>> trie.within('Neal', 2)
+        [('Neil', 1), ('Niall', 2)]
+        >>> trie.within('mat', 0)
+        []
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        matches = []  # type: List[Tuple[float, str]]
+
+        # Reaching a cell off the diagonal by d takes at least d inserts (to
+        # its left) or deletes (to its right), so only the cells in a band
+        # around the diagonal can be within k.
+        ins_cost, del_cost = self._cost[:2]
+        query_len = len(query)
+        left = int(k // ins_cost) if ins_cost > 0 else len(self._children)
+        right = int(k // del_cost) if del_cost > 0 else query_len
+
+        # Each entry holds a node, its depth & character, its row, & its
+        # parent's row
+        first_row = self._first_row(query)
+        stack = [(0, 0, '', first_row, first_row)]
+        while stack:
+            node, depth, char, row, prev_row = stack.pop()
+            word = self._words[node]
+            if word is not None and row[-1] <= k:
+                matches.append((row[-1], word))
+            depth += 1
+            first = max(1, depth - left)
+            last = min(query_len, depth + right)
+            for child_char, child in self._children[node].items():
+                child_row = self._next_row(
+                    query, child_char, char, row, prev_row, first, last
+                )
+                if self._bound(child_row, row) <= k:
+                    stack.append((child, depth, child_char, child_row, row))
+
+        return [(word, dist) for dist, word in sorted(matches)]
+
+    def nearest(self, query: str, n: int = 1) -> List[Tuple[str, float]]:
+        """Return the n words nearest to query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        n : int
+            The number of words to return
+
+        Returns
+        -------
+        list of tuple(str, float)
+            The n words nearest to query & their distances, ordered by
+            distance. Words at equal distances are in no particular order.
+
+        Examples
+        --------
+        >>> trie = LevenshteinTrie(['cat', 'hat', 'Niall', 'Neil', 'Nigel'])
+        >>> trie.nearest('Neal')
+        [('Neil', 1)]
+        >>> trie.nearest('mat', 2)
+        [('cat', 1), ('hat', 1)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        nearest = []  # type: List[Tuple[str, float]]
+        if n < 1:
+            return nearest
+
+        # A best-first search: each entry of the heap is either a subtree,
+        # keyed by the least distance of any word in it, or a word, keyed by
+        # its distance. Since a word's distance is no less than the key of
+        # any subtree holding it, words leave the heap in order of distance.
+        # Words (with order -1) leave before subtrees with the same key.
+        first_row = self._first_row(query)
+        heap = [
+            (self._bound(first_row, first_row), 0, 0, '', first_row, first_row)
+        ]  # type: List[Tuple[float, int, int, str, List[float], List[float]]]
+        while heap and len(nearest) < n:
+            key, order, node, char, row, prev_row = heappop(heap)
+            if order < 0:
+                nearest.append((char, key))
+                continue
+            word = self._words[node]
+            if word is not None:
+                heappush(heap, (row[-1], -1, node, word, row, prev_row))
+            for child_char, child in self._children[node].items():
+                child_row = self._next_row(
+                    query, child_char, char, row, prev_row
+                )
+                heappush(
+                    heap,
+                    (
+                        self._bound(child_row, row),
+                        child,
+                        child,
+                        child_char,
+                        child_row,
+                        row,
+                    ),
+                )
+
+        return nearest
+
+    def save_tree(self, filename: str) -> None:
+        """Save the index to a file.
+
+        This employs pickle to save the index, including its mode & cost.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the index to.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, mode='wb') as pkl:
+            pickle.dump(
+                (self._mode, self._cost, self._children, self._words), pkl
+            )
+
+    def load_tree(self, filename: str) -> None:
+        """Load the index from a file.
+
+        This employs pickle to load the index, replacing the current index and
+        its mode & cost.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the index from.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, mode='rb') as pkl:
+            index = pickle.load(pkl)  # noqa: S301
+        self._mode, self._cost, self._children, self._words = index
+        self._size = sum(word is not None for word in self._words)
+
+    def _first_row(self, query: str) -> List[float]:
+        """Return the row of the root, i.e. the distances to the empty word.
+
+        .. versionadded:: 0.6.0
+
+        """
+        del_cost = self._cost[1]
+        return [j * del_cost for j in range(len(query) + 1)]
+
+    def _next_row(
+        self,
+        query: str,
+        char: str,
+        prev_char: str,
+        row: List[float],
+        prev_row: List[float],
+        first: int = 1,
+        last: Optional[int] = None,
+    ) -> List[float]:
+        """Return the row of a node's child.
+
+        Only the cells from first to last are computed; the rest are set to
+        infinity.
+
+        Parameters
+        ----------
+        query : str
+            The string being searched for
+        char : str
+            The character of the child
+        prev_char : str
+            The character of the node (or '' for the root)
+        row : list of float
+            The node's row
+        prev_row : list of float
+            The row of the node's parent
+        first : int
+            The first cell of the row to compute (after the 0th)
+        last : int
+            The last cell of the row to compute, or None for the last
+
+        Returns
+        -------
+        list of float
+            The child's row
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        if last is None:
+            last = len(query)
+        inf = float('inf')
+        next_row = [row[0] + ins_cost]
+        if first > 1:
+            next_row += [inf] * (first - 1)
+        dist = next_row[-1]
+
+        if self._mode != 'osa' or prev_char not in query or char not in query:
+            for query_char, diag, above in zip(
+                query[first - 1 : last], row[first - 1 : last], row[first:]
+            ):
+                dist += del_cost
+                above += ins_cost
+                if above < dist:
+                    dist = above
+                if query_char != char:
+                    diag += sub_cost
+                if diag < dist:
+                    dist = diag
+                next_row.append(dist)
+        else:
+            for j in range(first, last + 1):
+                query_char = query[j - 1]
+                dist = min(
+                    dist + del_cost,
+                    row[j] + ins_cost,
+                    row[j - 1] + (0 if query_char == char else sub_cost),
+                )
+                if j > 1 and query_char == prev_char and query[j - 2] == char:
+                    dist = min(dist, prev_row[j - 2] + trans_cost)
+                next_row.append(dist)
+
+        if last < len(query):
+            next_row += [inf] * (len(query) - last)
+        return next_row
+
+    def _bound(self, row: List[float], prev_row: List[float]) -> float:
+        """Return the least distance of any word beneath a node.
+
+        Each row after a node's is computed from that node's row or, by a
+        transposition, its parent's.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._mode == 'osa':
+            return min(min(row), min(prev_row) + self._cost[3])
+        return min(row)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
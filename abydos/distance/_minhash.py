@@ -19,19 +19,52 @@
 MinHash similarity
 """
 
-from hashlib import sha512
-from typing import Any, Optional, cast
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Tuple
 
 import numpy as np
 
 from ._distance import _Distance
 from ..tokenizer import QGrams, WhitespaceTokenizer, _Tokenizer
+from ..tokenizer._tokenizer import _hash_tokens
 
 __all__ = ['MinHash']
 
 
-_MININT = np.iinfo(np.int64).min
-_MAXINT = np.iinfo(np.int64).max
+_MAXHASH = np.iinfo(np.uint64).max
+
+
+@lru_cache(maxsize=16)
+def _hash_params(seed: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the multipliers & increments of k hash functions.
+
+    Each hash function maps a 64-bit token hash x to (a * x + b) mod 2^64,
+    with a odd, which is a permutation of the 64-bit integers.
+
+    Parameters
+    ----------
+    seed : int
+        A seed value for the random functions
+    k : int
+        The number of hash functions
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The multipliers & the increments
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    params = np.frombuffer(
+        np.random.RandomState(seed=seed).bytes(16 * k), dtype='<u8'
+    ).astype(np.uint64)
+    multipliers = params[:k] | np.uint64(1)
+    increments = params[k:]
+    multipliers.flags.writeable = False
+    increments.flags.writeable = False
+    return multipliers, increments
 
 
 class MinHash(_Distance):
@@ -109,11 +142,11 @@ class MinHash(_Distance):
         >>> cmp.sim('cat', 'hat')
         0.75
         >>> cmp.sim('Niall', 'Neil')
-        1.0
+        0.16666666666666666
         >>> cmp.sim('aluminum', 'Catalan')
-        0.5
+        0.125
         >>> cmp.sim('ATCG', 'TAGC')
-        0.6
+        0.0
 
 
         .. versionadded:: 0.4.0
@@ -126,31 +159,90 @@ class MinHash(_Distance):
         tar_tokens = self.params['tokenizer'].tokenize(tar).get_set()
 
         k = self._k if self._k else max(len(src_tokens), len(tar_tokens))
+        if not k:
+            return 1.0
 
-        masks = np.random.RandomState(seed=self._seed).randint(
-            _MININT, _MAXINT, k, dtype=np.int64
+        return float(
+            np.mean(
+                self._signature(src_tokens, k)
+                == self._signature(tar_tokens, k)
+            )
         )
 
-        hashes_src = np.full(k, _MAXINT, dtype=np.int64)
-        hashes_tar = np.full(k, _MAXINT, dtype=np.int64)
+    def signature(self, src: str) -> np.ndarray:
+        """Return the MinHash signature of a string.
 
-        for tok in src_tokens:
-            hashes_src = np.minimum(
-                hashes_src,
-                np.bitwise_xor(
-                    masks, int(sha512(tok.encode()).hexdigest(), 16)
-                ),
-            )
+        The signature holds, for each of the k hash functions, the least hash
+        of any of the string's tokens (or the greatest 64-bit integer if it
+        has none). The proportion of positions at which the signatures of two
+        strings agree estimates the Jaccard similarity of their token sets.
+
+        Parameters
+        ----------
+        src : str
+            The string to compute the signature of
+
+        Returns
+        -------
+        numpy.ndarray
+            The signature, an array of k unsigned 64-bit integers
+
+        Raises
+        ------
+        ValueError
+            Signatures require a fixed number of hash functions (k > 0)
 
-        for tok in tar_tokens:
-            hashes_tar = np.minimum(
-                hashes_tar,
-                np.bitwise_xor(
-                    masks, int(sha512(tok.encode()).hexdigest(), 16)
-                ),
+        Examples
+        --------
+        >>> cmp = MinHash(k=64)
+        >>> sig = cmp.signature('Niall')
+        >>> sig.shape, sig.dtype
+        ((64,), dtype('uint64'))
+        >>> float(np.mean(sig == cmp.signature('Neil')))
+        0.1875
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._k:
+            raise ValueError(
+                'Signatures require a fixed number of hash functions (k > 0)'
             )
+        return self._signature(
+            self.params['tokenizer'].tokenize(src).get_set(), self._k
+        )
+
+    def _signature(self, tokens: Iterable[str], k: int) -> np.ndarray:
+        """Return the MinHash signature of a set of tokens.
 
-        return cast(float, (hashes_src == hashes_tar).sum() / k)
+        Parameters
+        ----------
+        tokens : Iterable[str]
+            The tokens
+        k : int
+            The number of hash functions
+
+        Returns
+        -------
+        numpy.ndarray
+            The signature
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        hashes = _hash_tokens(tokens)
+        if not len(hashes):
+            return np.full(  # type: ignore
+                k, _MAXHASH, dtype=np.uint64
+            )
+        multipliers, increments = _hash_params(self._seed, k)
+        # uint64 arithmetic wraps, i.e. it is computed mod 2^64
+        signature = (hashes[:, np.newaxis] * multipliers + increments).min(
+            axis=0
+        )  # type: np.ndarray
+        return signature
 
 
 if __name__ == '__main__':
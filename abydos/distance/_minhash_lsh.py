@@ -0,0 +1,205 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._minhash_lsh.
+
+MinHash locality-sensitive hashing index
+"""
+
+from collections import defaultdict
+from typing import Any, DefaultDict, Hashable, List, Optional
+
+import numpy as np
+
+from ._minhash import MinHash
+from ..tokenizer import _Tokenizer
+
+__all__ = ['MinHashLSH']
+
+
+class MinHashLSH:
+    """MinHash locality-sensitive hashing index.
+
+    An index of strings by their :py:class:`.MinHash` signatures, which finds
+    the strings likely to have a high Jaccard similarity to a query without
+    comparing it to every string in the index :cite:`Leskovec:2014`.
+
+    Each signature of bands * rows hashes is divided into bands of rows
+    hashes, and strings whose signatures agree in every row of any one band
+    share a bucket. Two strings with Jaccard similarity s share a bucket with
+    probability 1 - (1 - s^rows)^bands, which rises steeply around the
+    threshold (1 / bands)^(1 / rows): about 0.71 with the default 16 bands of
+    8 rows. More bands lower the threshold (finding more true matches) and
+    more rows raise it (returning fewer false candidates).
+
+    The candidates returned by a query should be verified with the similarity
+    measure itself.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        bands: int = 16,
+        rows: int = 8,
+        tokenizer: Optional[_Tokenizer] = None,
+        seed: int = 10,
+        **kwargs: Any
+    ) -> None:
+        """Initialize MinHashLSH instance.
+
+        Parameters
+        ----------
+        bands : int
+            The number of bands into which each signature is divided
+        rows : int
+            The number of hashes in each band
+        tokenizer : _Tokenizer
+            A tokenizer instance from the :py:mod:`abydos.tokenizer` package
+        seed : int
+            A seed value for the random functions
+        **kwargs
+            Arbitrary keyword arguments
+
+        Other Parameters
+        ----------------
+        qval : int
+            The length of each q-gram. Using this parameter and tokenizer=None
+            will cause the instance to use the QGram tokenizer with this
+            q value.
+
+        Raises
+        ------
+        ValueError
+            bands and rows must be at least 1
+
+        Examples
+        --------
+        >>> lsh = MinHashLSH(bands=32, rows=4)
+        >>> len(lsh)
+        0
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if bands < 1 or rows < 1:
+            raise ValueError('bands and rows must be at least 1')
+        self._bands = bands
+        self._rows = rows
+        self._minhash = MinHash(
+            tokenizer=tokenizer, k=bands * rows, seed=seed, **kwargs
+        )
+
+        # Each band's hashes are combined into a single 64-bit key by a
+        # random linear combination (mod 2^64).
+        self._coefs = np.frombuffer(
+            np.random.RandomState(seed=seed).bytes(8 * rows), dtype='<u8'
+        ).astype(np.uint64) | np.uint64(1)
+
+        # The numbers of the strings in each bucket of each band, & the key of
+        # each string, by number
+        self._buckets = [
+            defaultdict(list) for _ in range(bands)
+        ]  # type: List[DefaultDict[int, List[int]]]
+        self._keys = []  # type: List[Hashable]
+
+    def __len__(self) -> int:
+        """Return the number of strings in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._keys)
+
+    def insert(self, key: Hashable, src: str) -> None:
+        """Add a string to the index.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to return for the string in the results of queries, such
+            as the string itself or a record number
+        src : str
+            The string to index
+
+        Examples
+        --------
+        >>> lsh = MinHashLSH()
+        >>> lsh.insert(0, 'Christopher')
+        >>> lsh.insert(1, 'Kristopher')
+        >>> len(lsh)
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        num = len(self._keys)
+        self._keys.append(key)
+        for buckets, band in zip(self._buckets, self._band_keys(src)):
+            buckets[band].append(num)
+
+    def query(self, src: str) -> List[Hashable]:
+        """Return the keys of the strings sharing a bucket with a string.
+
+        Parameters
+        ----------
+        src : str
+            The string to search for
+
+        Returns
+        -------
+        list
+            The keys of the candidate strings, in the order they were inserted
+
+        Examples
+        --------
+        >>> lsh = MinHashLSH(bands=32, rows=2)
+        >>> lsh.insert('a', 'Christopher')
+        >>> lsh.insert('b', 'Kristopher')
+        >>> lsh.insert('c', 'Niall')
+        >>> lsh.query('Christophe')
+        ['a', 'b']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        nums = set()
+        for buckets, band in zip(self._buckets, self._band_keys(src)):
+            if band in buckets:
+                nums.update(buckets[band])
+        return [self._keys[num] for num in sorted(nums)]
+
+    def _band_keys(self, src: str) -> List[int]:
+        """Return the key of each band of a string's signature.
+
+        .. versionadded:: 0.6.0
+
+        """
+        signature = self._minhash.signature(src).reshape(
+            self._bands, self._rows
+        )
+        # uint64 arithmetic wraps, i.e. it is computed mod 2^64
+        keys = (signature * self._coefs).sum(axis=1, dtype=np.uint64)
+        return keys.tolist()  # type: ignore
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,249 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._ncd.
+
+The distance._ncd module implements abstract class _NCD.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable
+
+import numpy as np
+
+from ._distance import _Distance
+
+__all__ = ['_NCD']
+
+
+class _NCD(_Distance):
+    """Abstract Normalized Compression Distance class.
+
+    Normalized compression distance (NCD) :cite:`Cilibrasi:2005` compares the
+    compressed lengths of two strings with the compressed length of their
+    concatenation.
+
+    Subclasses supply the compressed length of a string. The compressed
+    lengths of the strings themselves (but not of their concatenations) are
+    kept in a bounded cache, so that a string compared with many others is
+    compressed only once. The cache is guarded by a lock, so an instance may
+    be shared among threads.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, cache_size: int = 1024, **kwargs: Any) -> None:
+        """Initialize _NCD instance.
+
+        Parameters
+        ----------
+        cache_size : int
+            The number of strings whose compressed lengths are cached. The
+            least recently used are dropped first. If 0, nothing is cached.
+        **kwargs
+            Arbitrary keyword arguments
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super().__init__(**kwargs)
+        self._cache_size = cache_size
+        self._cache = OrderedDict()  # type: OrderedDict[str, float]
+        self._lock = Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state of the instance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the instance from its pickled state.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def dist(self, src: str, tar: str) -> float:
+        """Return the NCD between two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            Compression distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src == tar:
+            return 0.0
+        return self._ncd(src, tar, self._compressed_len(src + tar))
+
+    def dist_many(self, query: str, candidates: Iterable[str]) -> np.ndarray:
+        """Return the NCD between a string and each of a collection.
+
+        The compressed length of query is computed once, and subclasses may
+        also reuse the work of compressing query as the start of each
+        concatenation.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        candidates : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The compression distance from query to each of candidates, in
+            order
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        query_first = self._prefixed_len(query)
+        return np.array(
+            [
+                0.0
+                if tar == query
+                else self._ncd(query, tar, query_first(tar))
+                for tar in candidates
+            ],
+            dtype=np.float_,
+        )
+
+    def sim_many(self, query: str, candidates: Iterable[str]) -> np.ndarray:
+        """Return the NCD similarity of a string to each of a collection.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        candidates : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The compression similarity of query to each of candidates, in
+            order
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.dist_many(query, candidates)  # type: ignore
+
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
+
+        Subclasses override this with the length compressed by their
+        compressor, not counting any bytes that every compressed string
+        includes (e.g. a header). By default, the string is not compressed &
+        this is the length of its UTF-8 encoding.
+
+        Parameters
+        ----------
+        src : str
+            The string to compress
+
+        Returns
+        -------
+        float
+            The compressed length
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(src.encode('utf-8'))
+
+    def _prefixed_len(self, prefix: str) -> Callable[[str], float]:
+        """Return a function of the compressed length of prefix + a string.
+
+        Subclasses whose compressors can be copied mid-stream may override
+        this to compress prefix only once.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of each string to compress
+
+        Returns
+        -------
+        Callable
+            A function returning the compressed length of prefix followed by
+            its argument
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return lambda suffix: self._compressed_len(prefix + suffix)
+
+    def _cached_len(self, src: str) -> float:
+        """Return the compressed length of a string, from the cache if known.
+
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            if src in self._cache:
+                self._cache.move_to_end(src)
+                return self._cache[src]
+        # compress outside the lock, so that threads compress concurrently
+        length = self._compressed_len(src)
+        if self._cache_size > 0:
+            with self._lock:
+                self._cache[src] = length
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return length
+
+    def _ncd(self, src: str, tar: str, src_tar_len: float) -> float:
+        """Return the NCD, given the compressed length of src + tar.
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_len = self._cached_len(src)
+        tar_len = self._cached_len(tar)
+        concat_len = min(src_tar_len, self._compressed_len(tar + src))
+        return (concat_len - min(src_len, tar_len)) / max(src_len, tar_len)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -20,15 +20,17 @@ NCD using Arithmetic Coding
 """
 
 from fractions import Fraction
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from ._distance import _Distance
+import numpy as np
+
+from ._ncd import _NCD
 from ..compression import Arithmetic
 
 __all__ = ['NCDarith']
 
 
-class NCDarith(_Distance):
+class NCDarith(_NCD):
     """Normalized Compression Distance using arithmetic coding.
 
     Cf. https://en.wikipedia.org/wiki/Arithmetic_coding
@@ -41,6 +43,7 @@ class NCDarith(_Distance):
     def __init__(
         self,
         probs: Optional[Dict[str, Tuple[Fraction, Fraction]]] = None,
+        cache_size: int = 1024,
         **kwargs: Any
     ) -> None:
         """Initialize the arithmetic coder object.
@@ -49,16 +52,26 @@ class NCDarith(_Distance):
         ----------
         probs : dict
             A dictionary trained with :py:meth:`Arithmetic.train`
+        cache_size : int
+            The number of strings whose compressed lengths are cached. If
+            probs is None, the coder is trained on each pair of strings, so
+            nothing is cached.
 
 
         .. versionadded:: 0.3.6
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added cache_size parameter
 
         """
-        super(NCDarith, self).__init__(**kwargs)
+        super(NCDarith, self).__init__(
+            cache_size=cache_size if probs is not None else 0, **kwargs
+        )
         self._coder = Arithmetic()
         self._probs = probs
+        if probs is not None:
+            self._coder.set_probs(probs)
 
     def dist(self, src: str, tar: str) -> float:
         """Return the NCD between two strings using arithmetic coding.
@@ -93,23 +106,53 @@ class NCDarith(_Distance):
             Encapsulated in class
 
         """
-        if src == tar:
-            return 0.0
-
-        if self._probs is None:
+        if src != tar and self._probs is None:
             # lacking a reasonable dictionary, train on the strings themselves
             self._coder.train(src + tar)
-        else:
-            self._coder.set_probs(self._probs)
+        return super().dist(src, tar)
 
-        src_comp = self._coder.encode(src)[1]
-        tar_comp = self._coder.encode(tar)[1]
-        concat_comp = self._coder.encode(src + tar)[1]
-        concat_comp2 = self._coder.encode(tar + src)[1]
+    def dist_many(self, query: str, candidates: Iterable[str]) -> np.ndarray:
+        """Return the NCD between a string and each of a collection.
 
-        return (
-            min(concat_comp, concat_comp2) - min(src_comp, tar_comp)
-        ) / max(src_comp, tar_comp)
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        candidates : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The compression distance from query to each of candidates, in
+            order
+
+        Examples
+        --------
+        >>> from abydos.compression import Arithmetic
+        >>> coder = Arithmetic('Niall Neil Nigel Neal Nail')
+        >>> cmp = NCDarith(coder.get_probs())
+        >>> cmp.dist_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.63157895, 0.68181818, 0.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._probs is None:
+            # the coder is trained on each pair, so each is compressed anew
+            return np.array(
+                [self.dist(query, tar) for tar in candidates], dtype=np.float_
+            )
+        return super().dist_many(query, candidates)
+
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._coder.encoded_len(src)
 
 
 if __name__ == '__main__':
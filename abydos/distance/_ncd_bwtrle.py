@@ -70,18 +70,15 @@ class NCDbwtrle(NCDrle):
             Encapsulated in class
 
         """
-        if src == tar:
-            return 0.0
-
-        src_comp = self._rle.encode(self._bwt.encode(src))
-        tar_comp = self._rle.encode(self._bwt.encode(tar))
-        concat_comp = self._rle.encode(self._bwt.encode(src + tar))
-        concat_comp2 = self._rle.encode(self._bwt.encode(tar + src))
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super().dist(src, tar)
+
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._rle.encode(self._bwt.encode(src)))
 
 
 if __name__ == '__main__':
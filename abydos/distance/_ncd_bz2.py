@@ -23,12 +23,12 @@ import bz2
 
 from typing import Any
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 __all__ = ['NCDbz2']
 
 
-class NCDbz2(_Distance):
+class NCDbz2(_NCD):
     """Normalized Compression Distance using bzip2 compression.
 
     Cf. https://en.wikipedia.org/wiki/Bzip2
@@ -40,21 +40,27 @@ class NCDbz2(_Distance):
 
     _level = 9
 
-    def __init__(self, level: int = 9, **kwargs: Any) -> None:
+    def __init__(
+        self, level: int = 9, cache_size: int = 1024, **kwargs: Any
+    ) -> None:
         """Initialize bzip2 compressor.
 
         Parameters
         ----------
         level : int
             The compression level (0 to 9)
+        cache_size : int
+            The number of strings whose compressed lengths are cached
 
 
         .. versionadded:: 0.3.6
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added cache_size parameter
 
         """
-        super().__init__(**kwargs)
+        super().__init__(cache_size=cache_size, **kwargs)
         self._level = level
 
     def dist(self, src: str, tar: str) -> float:
@@ -90,21 +96,16 @@ class NCDbz2(_Distance):
             Encapsulated in class
 
         """
-        if src == tar:
-            return 0.0
+        return super().dist(src, tar)
 
-        src_b = src.encode('utf-8')
-        tar_b = tar.encode('utf-8')
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
 
-        src_comp = bz2.compress(src_b, self._level)[10:]
-        tar_comp = bz2.compress(tar_b, self._level)[10:]
-        concat_comp = bz2.compress(src_b + tar_b, self._level)[10:]
-        concat_comp2 = bz2.compress(tar_b + src_b, self._level)[10:]
+        .. versionadded:: 0.6.0
 
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        """
+        # The 10-byte header is not counted.
+        return len(bz2.compress(src.encode('utf-8'), self._level)) - 10
 
 
 if __name__ == '__main__':
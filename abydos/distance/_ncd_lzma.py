@@ -23,13 +23,13 @@ import lzma
 
 from typing import Any
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 
 __all__ = ['NCDlzma']
 
 
-class NCDlzma(_Distance):
+class NCDlzma(_NCD):
     """Normalized Compression Distance using LZMA compression.
 
     Cf. https://en.wikipedia.org/wiki/Lempel-Ziv-Markov_chain_algorithm
@@ -41,19 +41,25 @@ class NCDlzma(_Distance):
 
     _level = 6
 
-    def __init__(self, level: int = 6, **kwargs: Any) -> None:
+    def __init__(
+        self, level: int = 6, cache_size: int = 1024, **kwargs: Any
+    ) -> None:
         """Initialize LZMA compressor.
 
         Parameters
         ----------
         level : int
             The compression level (0 to 9)
+        cache_size : int
+            The number of strings whose compressed lengths are cached
 
 
         .. versionadded:: 0.5.0
+        .. versionchanged:: 0.6.0
+            Added cache_size parameter
 
         """
-        super().__init__(**kwargs)
+        super().__init__(cache_size=cache_size, **kwargs)
         self._level = level
 
     def dist(self, src: str, tar: str) -> float:
@@ -89,21 +95,16 @@ class NCDlzma(_Distance):
             Encapsulated in class
 
         """
-        if src == tar:
-            return 0.0
+        return super().dist(src, tar)
 
-        src_b = src.encode('utf-8')
-        tar_b = tar.encode('utf-8')
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
 
-        src_comp = lzma.compress(src_b, preset=self._level)[14:]
-        tar_comp = lzma.compress(tar_b, preset=self._level)[14:]
-        concat_comp = lzma.compress(src_b + tar_b, preset=self._level)[14:]
-        concat_comp2 = lzma.compress(tar_b + src_b, preset=self._level)[14:]
+        .. versionadded:: 0.6.0
 
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        """
+        # The 14-byte header is not counted.
+        return len(lzma.compress(src.encode('utf-8'), preset=self._level)) - 14
 
 
 if __name__ == '__main__':
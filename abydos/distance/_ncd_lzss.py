@@ -19,7 +19,7 @@
 NCD using LZSS
 """
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 try:
     import lzss
@@ -31,7 +31,7 @@ except ImportError:  # pragma: no cover
 __all__ = ['NCDlzss']
 
 
-class NCDlzss(_Distance):
+class NCDlzss(_NCD):
     """Normalized Compression Distance using LZSS compression.
 
     Cf. https://en.wikipedia.org/wiki/Lempel-Ziv-Storer-Szymanski
@@ -77,21 +77,17 @@ class NCDlzss(_Distance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 0.0
-
-        if lzss is not None:
-            src_comp = lzss.encode(src)
-            tar_comp = lzss.encode(tar)
-            concat_comp = lzss.encode(src + tar)
-            concat_comp2 = lzss.encode(tar + src)
-        else:  # pragma: no cover
-            raise ValueError('Install the PyLZSS module in order to use LZSS')
+        return super().dist(src, tar)
+
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
+
+        .. versionadded:: 0.6.0
 
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        """
+        if lzss is None:  # pragma: no cover
+            raise ValueError('Install the PyLZSS module in order to use LZSS')
+        return len(lzss.encode(src))
 
 
 if __name__ == '__main__':
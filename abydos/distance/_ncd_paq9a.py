@@ -19,7 +19,7 @@
 NCD using PAQ9A
 """
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 try:
     import paq
@@ -31,7 +31,7 @@ except ImportError:  # pragma: no cover
 __all__ = ['NCDpaq9a']
 
 
-class NCDpaq9a(_Distance):
+class NCDpaq9a(_NCD):
     """Normalized Compression Distance using PAQ9A compression.
 
     Cf. http://mattmahoney.net/dc/#paq9a
@@ -77,28 +77,21 @@ class NCDpaq9a(_Distance):
         .. versionadded:: 0.4.0
 
         """
-        if src == tar:
-            return 0.0
-
-        src_b = src.encode('utf-8')
-        tar_b = tar.encode('utf-8')
-
-        if paq is not None:
-            src_comp = paq.compress(src_b)
-            tar_comp = paq.compress(tar_b)
-            concat_comp = paq.compress(src_b + tar_b)
-            concat_comp2 = paq.compress(tar_b + src_b)
-        else:  # pragma: no cover
-            raise ValueError('Install the paq module in order to use PAQ9A')
+        return super().dist(src, tar)
+
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
+
+        .. versionadded:: 0.6.0
 
+        """
+        if paq is None:  # pragma: no cover
+            raise ValueError('Install the paq module in order to use PAQ9A')
         # Each string returned by PAQ9A's compressor has 4 header bytes
         # followed by a byte of information then 3 null bytes. And it is
         # concluded with 3 bytes of \xff. So 4+3+3 invariant bytes are
         # subtracted here.
-        return (
-            (min(len(concat_comp), len(concat_comp2)) - 10)
-            - (min(len(src_comp), len(tar_comp)) - 10)
-        ) / (max(len(src_comp), len(tar_comp)) - 10)
+        return len(paq.compress(src.encode('utf-8'))) - 10
 
 
 if __name__ == '__main__':
@@ -21,14 +21,16 @@ NCD using zlib
 
 import zlib
 
-from typing import Any
+from typing import Any, Callable, Iterable
 
-from ._distance import _Distance
+import numpy as np
+
+from ._ncd import _NCD
 
 __all__ = ['NCDzlib']
 
 
-class NCDzlib(_Distance):
+class NCDzlib(_NCD):
     """Normalized Compression Distance using zlib compression.
 
     Cf. https://zlib.net/
@@ -39,7 +41,10 @@ class NCDzlib(_Distance):
     """
 
     def __init__(
-        self, level: int = zlib.Z_DEFAULT_COMPRESSION, **kwargs: Any
+        self,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        cache_size: int = 1024,
+        **kwargs: Any
     ) -> None:
         """Initialize zlib compressor.
 
@@ -47,12 +52,16 @@ class NCDzlib(_Distance):
         ----------
         level : int
             The compression level (0 to 9)
+        cache_size : int
+            The number of strings whose compressed lengths are cached
 
 
         .. versionadded:: 0.3.6
+        .. versionchanged:: 0.6.0
+            Added cache_size parameter
 
         """
-        super().__init__(**kwargs)
+        super().__init__(cache_size=cache_size, **kwargs)
         self._level = level
 
     def dist(self, src: str, tar: str) -> float:
@@ -88,21 +97,66 @@ class NCDzlib(_Distance):
             Encapsulated in class
 
         """
-        if src == tar:
-            return 0.0
+        return super().dist(src, tar)
+
+    def dist_many(self, query: str, candidates: Iterable[str]) -> np.ndarray:
+        """Return the NCD between a string and each of a collection.
+
+        The compressor state after query is copied to compress query followed
+        by each candidate.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        candidates : Iterable[str]
+            Target strings for comparison
 
-        src_b = src.encode('utf-8')
-        tar_b = tar.encode('utf-8')
+        Returns
+        -------
+        numpy.ndarray
+            The compression distance from query to each of candidates, in
+            order
 
-        src_comp = zlib.compress(src_b, self._level)
-        tar_comp = zlib.compress(tar_b, self._level)
-        concat_comp = zlib.compress(src_b + tar_b, self._level)
-        concat_comp2 = zlib.compress(tar_b + src_b, self._level)
+        Examples
+        --------
+        >>> cmp = NCDzlib()
+        >>> cmp.dist_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.45454545, 0.45454545, 0.        ])
 
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - (min(len(src_comp), len(tar_comp)))
-        ) / (max(len(src_comp), len(tar_comp)) - 2)
+
+        .. versionadded:: 0.6.0
+
+        """
+        return super().dist_many(query, candidates)
+
+    def _compressed_len(self, src: str) -> float:
+        """Return the compressed length of a string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        # Only the 2-byte zlib header is not counted.
+        return len(zlib.compress(src.encode('utf-8'), self._level)) - 2
+
+    def _prefixed_len(self, prefix: str) -> Callable[[str], float]:
+        """Return a function of the compressed length of prefix + a string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        primed = zlib.compressobj(self._level)
+        prefix_len = len(primed.compress(prefix.encode('utf-8'))) - 2
+
+        def _prefixed(suffix: str) -> float:
+            comp = primed.copy()
+            return (
+                prefix_len
+                + len(comp.compress(suffix.encode('utf-8')))
+                + len(comp.flush())
+            )
+
+        return _prefixed
 
 
 if __name__ == '__main__':
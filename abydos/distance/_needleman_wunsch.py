@@ -19,16 +19,68 @@
 Needleman-Wunsch score
 """
 
-from typing import Any, Callable, Dict, Optional, Tuple, cast
-
-from numpy import float_ as np_float
-from numpy import zeros as np_zeros
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import numpy as np
 
 from ._distance import _Distance
 
 __all__ = ['NeedlemanWunsch']
 
 
+def _diagonal_subst(
+    subst: np.ndarray,
+    src_idx: np.ndarray,
+    tar_idx: np.ndarray,
+    diag: int,
+    first: int,
+    last: int,
+) -> np.ndarray:
+    """Return the substitution scores of cells along an anti-diagonal.
+
+    Parameters
+    ----------
+    subst : numpy.ndarray
+        The substitution score of each pair of symbols, by their indices
+    src_idx : numpy.ndarray
+        The symbol indices of each source string, one string per row
+    tar_idx : numpy.ndarray
+        The symbol indices of each target string, one string per row
+    diag : int
+        The anti-diagonal (i + j) of the cells
+    first : int
+        The row (i) of the first cell
+    last : int
+        The row (i) of the last cell
+
+    Returns
+    -------
+    numpy.ndarray
+        The score of aligning src[i - 1] with tar[j - 1] for each cell (i, j)
+        from first to last, one pair of strings per row
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return subst[  # type: ignore
+        src_idx[:, first - 1 : last],
+        tar_idx[:, diag - last - 1 : diag - first][:, ::-1],
+    ]
+
+
 class NeedlemanWunsch(_Distance):
     """Needleman-Wunsch score.
 
@@ -186,21 +238,7 @@ class NeedlemanWunsch(_Distance):
             Encapsulated in class
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-
-        for i in range(len(src) + 1):
-            d_mat[i, 0] = -(i * self._gap_cost)
-        for j in range(len(tar) + 1):
-            d_mat[0, j] = -(j * self._gap_cost)
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                match = d_mat[i - 1, j - 1] + self._sim_func(
-                    src[i - 1], tar[j - 1]
-                )
-                delete = d_mat[i - 1, j] - self._gap_cost
-                insert = d_mat[i, j - 1] - self._gap_cost
-                d_mat[i, j] = max(match, delete, insert)
-        return cast(float, d_mat[d_mat.shape[0] - 1, d_mat.shape[1] - 1])
+        return cast(float, self._scores([(src, tar)])[0])
 
     def sim(self, src: str, tar: str) -> float:
         """Return the normalized Needleman-Wunsch score of two strings.
@@ -235,9 +273,217 @@ class NeedlemanWunsch(_Distance):
         """
         if src == tar:
             return 1.0
-        return max(0.0, self.sim_score(src, tar)) / (
-            self.sim_score(src, src) ** 0.5 * self.sim_score(tar, tar) ** 0.5
+        score, src_score, tar_score = self._scores(
+            [(src, tar), (src, src), (tar, tar)]
+        )
+        return cast(
+            float, max(0.0, score) / (src_score ** 0.5 * tar_score ** 0.5)
+        )
+
+    def sim_score_many(
+        self, query: str, candidates: Iterable[str]
+    ) -> np.ndarray:
+        """Return the scores of a string with each of a collection.
+
+        The alignments are computed together, so this is much faster than
+        calling sim_score for each candidate.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        candidates : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The score of query with each of candidates, in order
+
+        Examples
+        --------
+        >>> cmp = NeedlemanWunsch()
+        >>> cmp.sim_score_many('cat', ['hat', 'Niall', 'cat'])
+        array([ 2., -1.,  3.])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._scores([(query, tar) for tar in candidates])
+
+    def sim_many(self, query: str, candidates: Iterable[str]) -> np.ndarray:
+        """Return the normalized scores of a string with each of a collection.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        candidates : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized score of query with each of candidates, in order
+
+        Examples
+        --------
+        >>> cmp = NeedlemanWunsch()
+        >>> cmp.sim_many('cat', ['hat', 'Niall', 'cat'])
+        array([0.66666667, 0.        , 1.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tars = list(candidates)
+        scores = self._scores(
+            [(query, query)]
+            + [(query, tar) for tar in tars]
+            + [(tar, tar) for tar in tars]
+        )
+        query_norm = scores[0] ** 0.5
+        return np.array(
+            [
+                1.0
+                if query == tar
+                else max(0.0, score) / (query_norm * tar_score ** 0.5)
+                for tar, score, tar_score in zip(
+                    tars, scores[1 : len(tars) + 1], scores[len(tars) + 1 :]
+                )
+            ],
+            dtype=np.float_,
+        )
+
+    def _scores(self, pairs: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """Return the alignment score of each pair of strings.
+
+        The similarity of each pair of symbols is computed once, and all of
+        the pairs of strings are aligned together.
+
+        Parameters
+        ----------
+        pairs : Sequence[tuple(str, str)]
+            The (src, tar) pairs to align
+
+        Returns
+        -------
+        numpy.ndarray
+            The score of each pair
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_symbols = {}  # type: Dict[str, int]
+        tar_symbols = {}  # type: Dict[str, int]
+        for src, tar in pairs:
+            for char in src:
+                src_symbols.setdefault(char, len(src_symbols))
+            for char in tar:
+                tar_symbols.setdefault(char, len(tar_symbols))
+
+        # The last row & column, with scores of 0, are for the padding of
+        # strings shorter than the longest.
+        subst = np.zeros(
+            (len(src_symbols) + 1, len(tar_symbols) + 1), dtype=np.float_
+        )
+        for src_char, i in src_symbols.items():
+            for tar_char, j in tar_symbols.items():
+                subst[i, j] = self._sim_func(src_char, tar_char)
+
+        src_lens = np.array([len(src) for src, _ in pairs], dtype=np.int_)
+        tar_lens = np.array([len(tar) for _, tar in pairs], dtype=np.int_)
+        src_idx = np.full(
+            (len(pairs), max(src_lens, default=0)),
+            len(src_symbols),
+            dtype=np.int_,
         )
+        tar_idx = np.full(
+            (len(pairs), max(tar_lens, default=0)),
+            len(tar_symbols),
+            dtype=np.int_,
+        )
+        for num, (src, tar) in enumerate(pairs):
+            src_idx[num, : len(src)] = [src_symbols[char] for char in src]
+            tar_idx[num, : len(tar)] = [tar_symbols[char] for char in tar]
+
+        # The pairs whose final cell lies on each anti-diagonal
+        ends = defaultdict(list)  # type: DefaultDict[int, List[int]]
+        for num, end in enumerate((src_lens + tar_lens).tolist()):
+            ends[end].append(num)
+
+        return self._align(subst, src_idx, tar_idx, src_lens, ends)
+
+    def _align(
+        self,
+        subst: np.ndarray,
+        src_idx: np.ndarray,
+        tar_idx: np.ndarray,
+        src_lens: np.ndarray,
+        ends: Dict[int, List[int]],
+    ) -> np.ndarray:
+        """Return the alignment score of each pair of strings.
+
+        The matrix is filled one anti-diagonal at a time, since each cell
+        depends only on cells of the previous two anti-diagonals. Each
+        anti-diagonal is held as an array indexed by row (i), with one row per
+        pair of strings.
+
+        Parameters
+        ----------
+        subst : numpy.ndarray
+            The substitution score of each pair of symbols, by their indices
+        src_idx : numpy.ndarray
+            The symbol indices of each source string, one string per row
+        tar_idx : numpy.ndarray
+            The symbol indices of each target string, one string per row
+        src_lens : numpy.ndarray
+            The length of each source string
+        ends : dict
+            The pairs whose final cell lies on each anti-diagonal
+
+        Returns
+        -------
+        numpy.ndarray
+            The score of each pair
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        num_pairs, src_max = src_idx.shape
+        tar_max = tar_idx.shape[1]
+        gap_cost = self._gap_cost
+        scores = np.zeros(num_pairs, dtype=np.float_)
+
+        prev = cur = np.zeros((num_pairs, src_max + 1), dtype=np.float_)
+        for diag in range(src_max + tar_max + 1):
+            if diag:
+                prev_2, prev = prev, cur
+                cur = np.empty_like(prev)
+                first = max(1, diag - tar_max)
+                last = min(src_max, diag - 1)
+                if first <= last:
+                    cur[:, first : last + 1] = np.maximum(
+                        np.maximum(
+                            prev_2[:, first - 1 : last]
+                            + _diagonal_subst(
+                                subst, src_idx, tar_idx, diag, first, last
+                            ),
+                            prev[:, first - 1 : last] - gap_cost,
+                        ),
+                        prev[:, first : last + 1] - gap_cost,
+                    )
+                if diag <= tar_max:
+                    cur[:, 0] = -(diag * gap_cost)
+                if diag <= src_max:
+                    cur[:, diag] = -(diag * gap_cost)
+            if diag in ends:
+                nums = ends[diag]
+                scores[nums] = cur[nums, src_lens[nums]]
+        return scores
 
 
 if __name__ == '__main__':
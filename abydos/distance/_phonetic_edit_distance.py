@@ -279,7 +279,9 @@ class PhoneticEditDistance(Levenshtein):
         else:
             return cast(float, d_mat[src_len, tar_len]), src_len, tar_len
 
-    def dist_abs(self, src: str, tar: str) -> float:
+    def dist_abs(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the phonetic edit distance between two strings.
 
         Parameters
@@ -288,6 +290,9 @@ class PhoneticEditDistance(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, distances greater than this are returned as
+            max_distance + 1
 
         Returns
         -------
@@ -314,11 +319,18 @@ class PhoneticEditDistance(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
-        return self._dist_abs(src, tar)[0]
-
-    def dist(self, src: str, tar: str) -> float:
+        distance = self._dist_abs(src, tar)[0]
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
+
+    def dist(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the normalized phonetic edit distance between two strings.
 
         The edit distance is normalized by dividing the edit distance
@@ -334,6 +346,9 @@ class PhoneticEditDistance(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            Accepted for compatibility with Levenshtein.dist; the distance is
+            always computed in full
 
         Returns
         -------
@@ -354,6 +369,8 @@ class PhoneticEditDistance(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         if src == tar:
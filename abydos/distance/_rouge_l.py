@@ -89,7 +89,7 @@ class RougeL(_Distance):
         if not src or not tar:
             return 0.0
 
-        lcs_len = len(self._lcs.lcsseq(src, tar))
+        lcs_len = self._lcs.lcsseq_len(src, tar)
         r_lcs = lcs_len / len(src)
         p_lcs = lcs_len / len(tar)
         beta_sq = beta * beta
@@ -0,0 +1,431 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._similarity_join.
+
+Token-based similarity join
+"""
+
+from collections import Counter, defaultdict
+from math import ceil, sqrt
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ._cosine import Cosine
+from ._jaccard import Jaccard
+from ._overlap import Overlap
+from ._token_distance import _TokenDistance
+from ._tversky import Tversky
+
+__all__ = ['SimilarityJoin']
+
+
+class SimilarityJoin:
+    """Similarity join.
+
+    A similarity join finds the pairs of strings, one from each of two
+    collections (or both from one collection), whose similarity under a
+    token-based measure meets a threshold, without comparing every pair.
+
+    The measure's tokens are ordered from least to most frequent and each
+    string is indexed by the prefix of its tokens in that order. Any two
+    strings with enough tokens in common to meet the threshold share a token
+    among their prefixes, so only those pairs are candidates
+    :cite:`Bayardo:2007`. Candidates are further filtered by their sizes and
+    by the positions at which their prefixes match :cite:`Xiao:2008`. The
+    remaining candidates are compared with the measure itself.
+
+    The supported measures are :py:class:`.Tversky` (without a bias) and its
+    subclasses :py:class:`.Jaccard` and :py:class:`.Dice`,
+    :py:class:`.Cosine`, and :py:class:`.Overlap`, using the default crisp
+    intersection, no normalizer, and a tokenizer that produces whole-number
+    token counts.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, measure: Optional[_TokenDistance] = None) -> None:
+        """Initialize SimilarityJoin instance.
+
+        Parameters
+        ----------
+        measure : _TokenDistance
+            The similarity measure to join by. If None (the default), Jaccard
+            similarity is used.
+
+        Raises
+        ------
+        ValueError
+            Unsupported measure
+
+        Examples
+        --------
+        >>> from abydos.distance import Dice
+        >>> sj = SimilarityJoin(Dice())
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._measure = measure if measure is not None else Jaccard()
+
+        params = self._measure.params
+        if (
+            params.get('intersection_type', 'crisp') != 'crisp'
+            or params.get('normalizer') is not None
+        ):
+            raise ValueError(
+                'The measure must use the crisp intersection and no '
+                + 'normalizer.'
+            )
+        if isinstance(self._measure, Tversky):
+            if params['bias'] is not None:
+                raise ValueError('Tversky bias is not supported.')
+        elif not isinstance(self._measure, (Cosine, Overlap)):
+            raise ValueError(
+                'Unsupported measure; supported measures are Tversky, '
+                + 'Jaccard, Dice, Cosine, and Overlap.'
+            )
+
+    def join(
+        self,
+        left: Iterable[str],
+        right: Optional[Iterable[str]] = None,
+        threshold: float = 0.8,
+    ) -> List[Tuple[int, int, float]]:
+        """Return the pairs of strings with similarity of at least threshold.
+
+        Parameters
+        ----------
+        left : Iterable[str]
+            The strings to join, whose similarities are computed as the
+            measure's src
+        right : Iterable[str]
+            The strings to join with left, whose similarities are computed as
+            the measure's tar. If None (the default), the strings of left are
+            joined with one another, and only pairs (i, j) with i < j are
+            returned.
+        threshold : float
+            The least similarity of pairs to return, which must be greater
+            than 0
+
+        Returns
+        -------
+        list of tuple(int, int, float)
+            The index in left & the index in right of each pair of strings
+            with a similarity of at least threshold, and their similarity, in
+            order of their indices
+
+        Raises
+        ------
+        ValueError
+            threshold must be greater than 0
+
+        Examples
+        --------
+        >>> sj = SimilarityJoin()
+        >>> sj.join(['Niall', 'Neil', 'Nigel'], ['Neal', 'Nail', 'Niall'], 0.5)
+        [(0, 2, 1.0)]
+        >>> sj.join(['Niall', 'Neil', 'Nail', 'Neal', 'Neil'], threshold=0.4)
+        [(1, 2, 0.42857142857142855), (1, 3, 0.42857142857142855), (1, 4, 1.0),
+         (2, 4, 0.42857142857142855), (3, 4, 0.42857142857142855)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if threshold <= 0:
+            raise ValueError('threshold must be greater than 0')
+
+        measure = self._measure
+        left_strs = measure._pairwise_prepare(left)
+        self_join = right is None
+        right_strs = (
+            left_strs if right is None else measure._pairwise_prepare(right)
+        )
+
+        left_tokens = [self._get_tokens(string) for string in left_strs]
+        right_tokens = (
+            left_tokens
+            if self_join
+            else [self._get_tokens(string) for string in right_strs]
+        )
+
+        # Each occurrence of a token (e.g. the second 'an' in 'banana') is a
+        # distinct element, so that multiset intersections are counted by
+        # set intersections. Elements are ranked from least to most frequent.
+        frequency = Counter()  # type: TCounter[Tuple[str, int]]
+        for tokens in left_tokens if self_join else left_tokens + right_tokens:
+            frequency.update(self._elements(tokens))
+        rank = {
+            element: num
+            for num, element in enumerate(
+                sorted(frequency, key=lambda _: (frequency[_], _))
+            )
+        }
+        left_elements = [
+            sorted(rank[element] for element in self._elements(tokens))
+            for tokens in left_tokens
+        ]
+        right_elements = (
+            left_elements
+            if self_join
+            else [
+                sorted(rank[element] for element in self._elements(tokens))
+                for tokens in right_tokens
+            ]
+        )
+
+        max_size = max(
+            (len(elements) for elements in left_elements + right_elements),
+            default=0,
+        )
+        min_overlap = _MinOverlap(self._overlap_needed, threshold, max_size)
+
+        matches = []  # type: List[Tuple[int, int, float]]
+
+        def _verify(src_num: int, tar_num: int) -> None:
+            sim = measure.sim(left_strs[src_num], right_strs[tar_num])
+            if sim >= threshold:
+                matches.append((src_num, tar_num, sim))
+
+        # Strings without tokens can only match equal strings.
+        left_empty = [
+            num for num, elements in enumerate(left_elements) if not elements
+        ]
+        right_empty = [
+            num for num, elements in enumerate(right_elements) if not elements
+        ]
+        for src_num in left_empty:
+            for tar_num in right_empty:
+                if not self_join or src_num < tar_num:
+                    _verify(src_num, tar_num)
+
+        # The index of the prefix elements of each string of right, giving
+        # the string's number & the element's position within the string
+        index = defaultdict(
+            list
+        )  # type: DefaultDict[int, List[Tuple[int, int]]]
+
+        if not self_join:
+            for tar_num, elements in enumerate(right_elements):
+                for pos in range(min_overlap.prefix(len(elements))):
+                    index[elements[pos]].append((tar_num, pos))
+            order = range(len(left_elements))  # type: Iterable[int]
+        else:
+            # Strings are indexed after they are probed, in order of size, so
+            # each pair is probed once.
+            order = sorted(
+                range(len(left_elements)),
+                key=lambda num: len(left_elements[num]),
+            )
+
+        for src_num in order:
+            src_elements = left_elements[src_num]
+            src_size = len(src_elements)
+            if not src_size:
+                continue
+            prefix = min_overlap.prefix(src_size)
+
+            # The overlap within the prefixes of each candidate so far, or -1
+            # once the candidate is pruned
+            overlaps = {}  # type: Dict[int, int]
+            for src_pos in range(prefix):
+                for tar_num, tar_pos in index.get(src_elements[src_pos], ()):
+                    overlap = overlaps.get(tar_num, 0)
+                    if overlap < 0:
+                        continue
+                    tar_size = len(right_elements[tar_num])
+                    needed = min_overlap(src_size, tar_size)
+                    if (
+                        needed > min(src_size, tar_size)
+                        or overlap
+                        + min(src_size - src_pos, tar_size - tar_pos)
+                        < needed
+                    ):
+                        overlaps[tar_num] = -1
+                    else:
+                        overlaps[tar_num] = overlap + 1
+
+            src_set = set(src_elements)
+            for tar_num, overlap in overlaps.items():
+                if overlap < 0:
+                    continue
+                tar_elements = right_elements[tar_num]
+                needed = min_overlap(src_size, len(tar_elements))
+                if len(src_set.intersection(tar_elements)) < needed:
+                    continue
+                if self_join and tar_num < src_num:
+                    _verify(tar_num, src_num)
+                else:
+                    _verify(src_num, tar_num)
+
+            if self_join:
+                for pos in range(prefix):
+                    index[src_elements[pos]].append((src_num, pos))
+
+        return sorted(matches)
+
+    def _overlap_needed(
+        self, src_size: int, tar_size: int, threshold: float
+    ) -> float:
+        """Return the least overlap for which the measure meets threshold.
+
+        Parameters
+        ----------
+        src_size : int
+            The number of tokens of src
+        tar_size : int
+            The number of tokens of tar
+        threshold : float
+            The least similarity
+
+        Returns
+        -------
+        float
+            The least number of tokens src & tar must have in common
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(self._measure, Tversky):
+            # o / (o + alpha * (a - o) + beta * (b - o)) >= t
+            alpha = self._measure.params['alpha']  # type: float
+            beta = self._measure.params['beta']  # type: float
+            return (
+                threshold
+                * (alpha * src_size + beta * tar_size)
+                / (1 - threshold + threshold * (alpha + beta))
+            )
+        if isinstance(self._measure, Cosine):
+            return threshold * sqrt(src_size * tar_size)
+        return threshold * min(src_size, tar_size)
+
+    def _get_tokens(self, string: Any) -> TCounter[str]:
+        """Return the tokens of a prepared string (or Counter).
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(string, Counter):
+            tokens = string  # type: TCounter[str]
+        elif string.tokens is not None:
+            tokens = string.tokens
+        else:
+            # the measure compares hashed tokens
+            tokens = self._measure.params['tokenizer'].tokenize_to_counter(
+                string
+            )
+        if any(count != int(count) for count in tokens.values()):
+            raise ValueError(
+                'The measure must use a tokenizer that produces whole-number '
+                + 'token counts.'
+            )
+        return tokens
+
+    @staticmethod
+    def _elements(tokens: TCounter[str]) -> List[Tuple[str, int]]:
+        """Return each occurrence of each token as a distinct element.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [
+            (token, occurrence)
+            for token, count in tokens.items()
+            for occurrence in range(int(count))
+        ]
+
+
+class _MinOverlap:
+    """The least overlap needed for pairs of strings to meet the threshold.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        func: Callable[[int, int, float], float],
+        threshold: float,
+        max_size: int,
+    ) -> None:
+        self._func = func
+        self._threshold = threshold
+        self._max_size = max_size
+        self._needed = {}  # type: Dict[Tuple[int, int], int]
+        self._prefixes = {}  # type: Dict[int, int]
+
+    def __call__(self, src_size: int, tar_size: int) -> int:
+        """Return the least overlap needed between strings of these sizes.
+
+        Since the measures may be asymmetric, the lesser of the values for the
+        strings in either order is returned.
+
+        .. versionadded:: 0.6.0
+
+        """
+        key = (src_size, tar_size)
+        if key not in self._needed:
+            needed = min(
+                self._func(src_size, tar_size, self._threshold),
+                self._func(tar_size, src_size, self._threshold),
+            )
+            # No overlap gives a similarity of 0, and a little leeway is
+            # allowed for floating point error.
+            self._needed[key] = max(1, ceil(needed - 1e-9))
+        return self._needed[key]
+
+    def prefix(self, size: int) -> int:
+        """Return the length of the prefix to index for a string of size.
+
+        Two strings with at least a given overlap, whose elements are
+        ordered alike, share an element among their first size - overlap + 1
+        elements. The overlap used is the least needed with a string of any
+        size.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if size not in self._prefixes:
+            least = min(
+                (
+                    needed
+                    for needed, other in (
+                        (self(size, other), other)
+                        for other in range(1, self._max_size + 1)
+                    )
+                    if needed <= min(size, other)
+                ),
+                default=size + 1,
+            )
+            self._prefixes[size] = max(0, size - least + 1)
+        return self._prefixes[size]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
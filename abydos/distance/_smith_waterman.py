@@ -19,12 +19,11 @@
 Smith-Waterman score
 """
 
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, cast
 
-from numpy import float_ as np_float
-from numpy import zeros as np_zeros
+import numpy as np
 
-from ._needleman_wunsch import NeedlemanWunsch
+from ._needleman_wunsch import NeedlemanWunsch, _diagonal_subst
 
 __all__ = ['SmithWaterman']
 
@@ -101,17 +100,7 @@ class SmithWaterman(NeedlemanWunsch):
             Encapsulated in class
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                match = d_mat[i - 1, j - 1] + self._sim_func(
-                    src[i - 1], tar[j - 1]
-                )
-                delete = d_mat[i - 1, j] - self._gap_cost
-                insert = d_mat[i, j - 1] - self._gap_cost
-                d_mat[i, j] = max(0, match, delete, insert)
-        return cast(float, d_mat[d_mat.shape[0] - 1, d_mat.shape[1] - 1])
+        return cast(float, self._scores([(src, tar)])[0])
 
     def sim(self, src: str, tar: str) -> float:
         """Return the normalized Smith-Waterman score of two strings.
@@ -144,11 +133,54 @@ class SmithWaterman(NeedlemanWunsch):
         .. versionadded:: 0.4.1
 
         """
-        if src == tar:
-            return 1.0
-        return max(0.0, self.sim_score(src, tar)) / (
-            self.sim_score(src, src) ** 0.5 * self.sim_score(tar, tar) ** 0.5
-        )
+        return super(SmithWaterman, self).sim(src, tar)
+
+    def _align(
+        self,
+        subst: np.ndarray,
+        src_idx: np.ndarray,
+        tar_idx: np.ndarray,
+        src_lens: np.ndarray,
+        ends: Dict[int, List[int]],
+    ) -> np.ndarray:
+        """Return the alignment score of each pair of strings.
+
+        This is the anti-diagonal fill of :py:meth:`NeedlemanWunsch._align`,
+        with scores floored at 0.
+
+        .. versionadded:: 0.6.0
+
+        """
+        num_pairs, src_max = src_idx.shape
+        tar_max = tar_idx.shape[1]
+        gap_cost = self._gap_cost
+        scores = np.zeros(num_pairs, dtype=np.float_)
+
+        prev = cur = np.zeros((num_pairs, src_max + 1), dtype=np.float_)
+        for diag in range(src_max + tar_max + 1):
+            if diag:
+                prev_2, prev = prev, cur
+                cur = np.zeros_like(prev)
+                first = max(1, diag - tar_max)
+                last = min(src_max, diag - 1)
+                if first <= last:
+                    cur[:, first : last + 1] = np.maximum(
+                        np.maximum(
+                            np.maximum(
+                                0.0,
+                                prev_2[:, first - 1 : last]
+                                + _diagonal_subst(
+                                    subst, src_idx, tar_idx, diag, first, last
+                                ),
+                            ),
+                            prev[:, first - 1 : last] - gap_cost,
+                        ),
+                        prev[:, first : last + 1] - gap_cost,
+                    )
+            if diag in ends:
+                nums = ends[diag]
+                scores[nums] = cur[nums, src_lens[nums]]
+        return scores
 
 
 if __name__ == '__main__':
@@ -152,9 +152,11 @@ class SoftTFIDF(_TokenDistance):
         sims = defaultdict(float)  # type: DefaultDict[Tuple[str, str], float]
         s_toks = set(self._src_only().keys())
         t_toks = set(self._tar_only().keys())
+        t_list = list(t_toks)
         for s_tok in s_toks:
-            for t_tok in t_toks:
-                sim = self._metric.sim(s_tok, t_tok)
+            for t_tok, sim in zip(
+                t_list, self._metric.sim_many(s_tok, t_list).tolist()
+            ):
                 if sim > self._threshold:
                     sims[(s_tok, t_tok)] = sim
         for tokens, value in sorted(
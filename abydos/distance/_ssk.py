@@ -101,11 +101,11 @@ class SSK(_TokenDistance):
         >>> cmp.dist_abs('cat', 'hat')
         0.6441281138790036
         >>> cmp.dist_abs('Niall', 'Neil')
-        0.5290992177869402
+        0.5290992177869401
         >>> cmp.dist_abs('aluminum', 'Catalan')
         0.862398428061774
         >>> cmp.dist_abs('ATCG', 'TAGC')
-        0.38591004719395017
+        0.38591004719395006
 
 
         .. versionadded:: 0.4.1
@@ -143,11 +143,11 @@ class SSK(_TokenDistance):
         >>> cmp.sim('cat', 'hat')
         0.3558718861209964
         >>> cmp.sim('Niall', 'Neil')
-        0.4709007822130597
+        0.47090078221305987
         >>> cmp.sim('aluminum', 'Catalan')
         0.13760157193822603
         >>> cmp.sim('ATCG', 'TAGC')
-        0.6140899528060498
+        0.6140899528060499
 
 
         .. versionadded:: 0.4.1
@@ -23,10 +23,14 @@ _TokenDistance.
 from collections import Counter, OrderedDict
 from itertools import product
 from math import exp, log1p
+from threading import local
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
+    Dict,
+    Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -45,6 +49,131 @@ from ..tokenizer import QGrams, QSkipgrams, WhitespaceTokenizer, _Tokenizer
 __all__ = ['_TokenDistance']
 
 
+class _TokenizedStr(str):
+    """A str that carries its own tokens.
+
+    Instances are created by :py:meth:`_TokenDistance._pairwise_prepare` so
+    that each string is tokenized once per pairwise call, rather than once per
+    pair. Since they are still strings, measures that perform their own
+    string processing are unaffected.
+
+    Either tokens or, if the measure compares hashed tokens, hashes is set.
+
+    .. versionadded:: 0.6.0
+    """
+
+    tokens = None  # type: Optional[TCounter[str]]
+    hashes = None  # type: Optional[Tuple[np.ndarray, np.ndarray]]
+
+
+class _CardTable:
+    """A stand-in for src or tar, which carries the cardinalities of a pair.
+
+    Instances are created by :py:meth:`_TokenDistance.from_cards`, which
+    passes them to a measure in place of the strings, so that the measure
+    takes its cardinalities from the table. Since some measures compare src or
+    tar with itself, each also carries the cardinalities of that comparison.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = ('cards', 'own_cards')
+
+    def __init__(
+        self, cards: Dict[str, float], own_cards: Dict[str, float]
+    ) -> None:
+        """Initialize _CardTable instance.
+
+        Parameters
+        ----------
+        cards : dict
+            The crisp cardinalities (as floats or arrays) of src & tar
+        own_cards : dict
+            The crisp cardinalities of this side compared with itself
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.cards = cards
+        self.own_cards = own_cards
+
+    def __bool__(self) -> bool:
+        """Return whether this side has any tokens, as a string would.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return bool(np.all(self.own_cards['src']))
+
+
+class _TokenContext:
+    """The state of a single _TokenDistance comparison.
+
+    A new context is created by each call to :py:meth:`_TokenDistance._tokenize`
+    and is stored per-thread, so that a single _TokenDistance instance may be
+    shared among threads.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = (
+        'src_orig',
+        'tar_orig',
+        'src_tokens',
+        'tar_tokens',
+        'cards',
+        'population_card_value',
+        'soft_intersection_precalc',
+        'soft_src_only',
+        'soft_tar_only',
+    )
+
+    def __init__(
+        self,
+        src_orig: Union[str, TCounter[str], _CardTable] = '',
+        tar_orig: Union[str, TCounter[str], _CardTable] = '',
+        src_tokens: Optional[TCounter[str]] = None,
+        tar_tokens: Optional[TCounter[str]] = None,
+        cards: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Initialize _TokenContext instance.
+
+        Parameters
+        ----------
+        src_orig : str, Counter, or _CardTable
+            Source string (or Counter) for comparison
+        tar_orig : str, Counter, or _CardTable
+            Target string (or Counter) for comparison
+        src_tokens : Counter
+            The tokens of src
+        tar_tokens : Counter
+            The tokens of tar
+        cards : dict
+            The crisp cardinalities, computed from the hashed tokens of src &
+            tar or taken from a _CardTable. If these are supplied, src_tokens
+            & tar_tokens are computed only if they are needed.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.src_orig = src_orig
+        self.tar_orig = tar_orig
+        if cards is None:
+            src_tokens = src_tokens if src_tokens is not None else Counter()
+            tar_tokens = tar_tokens if tar_tokens is not None else Counter()
+        self.src_tokens = src_tokens  # type: Optional[TCounter[str]]
+        self.tar_tokens = tar_tokens  # type: Optional[TCounter[str]]
+        self.cards = cards
+        self.population_card_value = 0  # type: float
+
+        # values for soft intersection
+        self.soft_intersection_precalc = Counter()  # type: TCounter[str]
+        self.soft_src_only = Counter()  # type: TCounter[str]
+        self.soft_tar_only = Counter()  # type: TCounter[str]
+
+
 class _TokenDistance(_Distance):
     r"""Abstract Token Distance class.
 
@@ -235,14 +364,13 @@ class _TokenDistance(_Distance):
         else:
             self._intersection = self._crisp_intersection  # type: ignore
 
-        self._src_tokens = Counter()  # type: TCounter[str]
-        self._tar_tokens = Counter()  # type: TCounter[str]
-        self._population_card_value = 0  # type: float
-
-        # initialize normalizer
-        self.normalizer = (
-            self._norm_none
-        )  # type: Callable[[float, int, float], float]  # noqa: E501
+        # The crisp cardinalities may be computed from sorted arrays of token
+        # hashes, if the tokenizer is set to supply them.
+        self._hashed = (
+            intersection_type == 'crisp'
+            and getattr(self.params['tokenizer'], 'hashed', False)
+            and not isinstance(self.params['alphabet'], Counter)
+        )
 
         self._norm_dict = {
             'proportional': self._norm_proportional,
@@ -251,12 +379,125 @@ class _TokenDistance(_Distance):
             'laplace': self._norm_laplace,
             'inverse': self._norm_inverse,
             'complement': self._norm_complement,
-        }
+        }  # type: Dict[str, Callable[[float, int, float], float]]
+
+        # The state of each comparison is held in a _TokenContext, stored
+        # per-thread.
+        self._local = local()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state of the instance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
 
-        # initialize values for soft intersection
-        self._soft_intersection_precalc = Counter()  # type: TCounter[str]
-        self._soft_src_only = Counter()  # type: TCounter[str]
-        self._soft_tar_only = Counter()  # type: TCounter[str]
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the instance from its pickled state.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._local = local()
+
+    @property
+    def _context(self) -> _TokenContext:
+        """Return the current thread's comparison context."""
+        try:
+            context = self._local.context  # type: _TokenContext
+        except AttributeError:
+            context = self._local.context = _TokenContext()
+        return context
+
+    @property
+    def _src_tokens(self) -> TCounter[str]:
+        context = self._context
+        if context.src_tokens is None:
+            self._check_tokens_available(context.src_orig)
+            context.src_tokens = self.params['tokenizer'].tokenize_to_counter(
+                context.src_orig
+            )
+        return context.src_tokens
+
+    @property
+    def _tar_tokens(self) -> TCounter[str]:
+        context = self._context
+        if context.tar_tokens is None:
+            self._check_tokens_available(context.tar_orig)
+            context.tar_tokens = self.params['tokenizer'].tokenize_to_counter(
+                context.tar_orig
+            )
+        return context.tar_tokens
+
+    @property
+    def _cards(self) -> Optional[Dict[str, float]]:
+        return self._context.cards
+
+    @staticmethod
+    def _check_tokens_available(
+        string: Union[str, TCounter[str], _CardTable]
+    ) -> None:
+        if isinstance(string, _CardTable):
+            raise ValueError(
+                'This measure requires the tokens themselves, so it cannot '
+                + 'be computed from cardinalities alone.'
+            )
+
+    def _token_list(self, string: str) -> List[str]:
+        """Return the tokens of src or tar, in order.
+
+        Measures that need the order of the tokens should use this, rather
+        than the tokenizer itself, so that they cannot be computed from
+        cardinalities by :py:meth:`from_cards`.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_tokens_available(string)
+        return cast(
+            List[str], self.params['tokenizer'].tokenize_to_list(string)
+        )
+
+    @property
+    def _src_orig(self) -> Union[str, TCounter[str], _CardTable]:
+        return self._context.src_orig
+
+    @property
+    def _tar_orig(self) -> Union[str, TCounter[str], _CardTable]:
+        return self._context.tar_orig
+
+    @property
+    def _population_card_value(self) -> float:
+        return self._context.population_card_value
+
+    @property
+    def _soft_intersection_precalc(self) -> TCounter[str]:
+        return self._context.soft_intersection_precalc
+
+    @property
+    def _soft_src_only(self) -> TCounter[str]:
+        return self._context.soft_src_only
+
+    @property
+    def _soft_tar_only(self) -> TCounter[str]:
+        return self._context.soft_tar_only
+
+    @property
+    def normalizer(self) -> Callable[[float, int, float], float]:
+        """Return the normalizer function specified by the parameters.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if 'normalizer' in self.params:
+            return self._norm_dict.get(
+                self.params['normalizer'], self._norm_none
+            )
+        return self._norm_none
 
     @staticmethod
     def _norm_none(x: float, _squares: int, _pop: float) -> float:
@@ -286,6 +527,238 @@ class _TokenDistance(_Distance):
     def _norm_complement(x: float, _squares: int, pop: float) -> float:
         return pop - x
 
+    def from_cards(
+        self,
+        intersection: Any,
+        src_only: Any,
+        tar_only: Any,
+        population: Any = None,
+        method: str = 'sim',
+    ) -> np.ndarray:
+        """Return the measure's values for arrays of cardinalities.
+
+        Most token measures are functions of the 2x2 contingency table of two
+        token sets alone: their intersection (a), the tokens only in src (b),
+        the tokens only in tar (c), and the population (n = a+b+c+d). Given
+        these cardinalities for many pairs, e.g. from a
+        :py:class:`abydos.tokenizer.TokenMatrix`, this computes the measure for
+        all of them without any tokenization, and many measures can be
+        computed from the same cardinalities.
+
+        The measure's formula is applied to whole arrays where it can be. Pairs
+        in which src or tar is empty, or all pairs if the formula cannot be
+        applied to arrays (e.g. because it depends on comparisons of the
+        cardinalities), are computed once for each distinct table, whose
+        cardinalities are passed as ints if they are all integral. Pairs in
+        which src & tar are both empty are treated as pairs of empty strings,
+        but other checks that measures make on the strings themselves (e.g.
+        that src & tar are identical) are not made.
+
+        Parameters
+        ----------
+        intersection : array_like
+            The cardinalities of the intersections of src & tar
+        src_only : array_like
+            The cardinalities of the tokens only in src
+        tar_only : array_like
+            The cardinalities of the tokens only in tar
+        population : array_like
+            The cardinalities of the populations, or None if the population is
+            just the union of src & tar
+        method : str
+            The name of the measure to compute: ``sim`` (default), ``dist``,
+            or ``dist_abs``
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of the measure, in the (broadcast) shape of the
+            cardinalities
+
+        Raises
+        ------
+        ValueError
+            This measure requires the tokens themselves, so it cannot be
+            computed from cardinalities alone.
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard, SokalMichener
+        >>> from abydos.tokenizer import Vectorizer
+        >>> names = Vectorizer().fit_transform(['Niall', 'Neil', 'Nigel'])
+        >>> a = names.intersection()
+        >>> b = names.row_sums()[:, np.newaxis] - a
+        >>> c = names.row_sums() - a
+        >>> Jaccard().from_cards(a, b, c)
+        array([[1.        , 0.22222222, 0.33333333],
+               [0.22222222, 1.        , 0.22222222],
+               [0.33333333, 0.22222222, 1.        ]])
+        >>> SokalMichener().from_cards(a, b, c, 784)
+        array([[1.        , 0.99107143, 0.99234694],
+               [0.99107143, 1.        , 0.99107143],
+               [0.99234694, 0.99107143, 1.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        func = self._pairwise_func(method)
+        a, b, c = np.broadcast_arrays(
+            np.asarray(intersection, dtype=np.float_),
+            np.asarray(src_only, dtype=np.float_),
+            np.asarray(tar_only, dtype=np.float_),
+        )
+        if population is None:
+            d = np.zeros_like(a)
+        else:
+            d = np.asarray(population, dtype=np.float_) - a - b - c
+        shape = a.shape
+        a, b, c, d = (np.ravel(_) for _ in (a, b, c, d))
+
+        values = np.zeros(a.size, dtype=np.float_)
+        # pairs of empty token sets are pairs of empty strings
+        both_empty = a + b + c == 0
+        if both_empty.any():
+            values[both_empty] = func('', '')
+        singly = ((a + b == 0) | (a + c == 0)) & ~both_empty
+        rest = ~(singly | both_empty)
+        if rest.any():
+            try:
+                with np.errstate(divide='raise', invalid='raise'):
+                    rest_values = func(
+                        *self._card_tables(a[rest], b[rest], c[rest], d[rest])
+                    )
+                if np.shape(rest_values) != (np.count_nonzero(rest),):
+                    raise TypeError
+                values[rest] = rest_values
+            except (ArithmeticError, TypeError, ValueError):
+                singly = ~both_empty
+        if singly.any():
+            # each distinct table is evaluated once
+            tables = np.stack((a, b, c, d), axis=1)[singly]
+            first, inverse = self._distinct_rows(tables)
+            table_values = np.zeros(len(first), dtype=np.float_)
+            for i, table in enumerate(tables[first].tolist()):
+                # integral tables are passed as ints, as Counters' are
+                if all(card.is_integer() for card in table):
+                    table = [int(card) for card in table]
+                table_values[i] = func(*self._card_tables(*table))
+            values[singly] = table_values[inverse]
+        return values.reshape(shape)
+
+    @staticmethod
+    def _distinct_rows(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the distinct rows of a 2-D array.
+
+        This is equivalent to np.unique(rows, axis=0), but much faster for
+        many rows, since each column is sorted separately & the rows are
+        identified by integer keys.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The rows
+
+        Returns
+        -------
+        tuple
+            The index of the first instance of each distinct row, and the
+            index of each row among the distinct rows
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        keys = np.zeros(len(rows), dtype=np.int64)
+        n_keys = 1
+        for column in rows.T:
+            values, codes = np.unique(column, return_inverse=True)
+            if n_keys * len(values) >= 1 << 62:
+                keys = np.unique(keys, return_inverse=True)[1]
+                n_keys = int(keys.max()) + 1
+            keys = keys * len(values) + codes
+            n_keys *= len(values)
+        _, first, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+        return first, inverse
+
+    @staticmethod
+    def _card_tables(
+        a: float, b: float, c: float, d: float
+    ) -> Tuple[_CardTable, _CardTable]:
+        """Return stand-ins for src & tar with the given cardinalities.
+
+        Parameters
+        ----------
+        a : float or numpy.ndarray
+            The cardinality of the intersection
+        b : float or numpy.ndarray
+            The cardinality of the tokens only in src
+        c : float or numpy.ndarray
+            The cardinality of the tokens only in tar
+        d : float or numpy.ndarray
+            The cardinality of the complement of the union
+
+        Returns
+        -------
+        tuple
+            Two distinct _CardTable objects, to pass as src & tar
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        cards = {
+            'src_unique': a + b,
+            'tar_unique': a + c,
+            'src': a + b,
+            'tar': a + c,
+            'intersection': a,
+            'src_only': b,
+            'tar_only': c,
+            'total': 2 * a + b + c,
+            'union': a + b + c,
+            'total_complement': d,
+        }
+        return (
+            _CardTable(cards, _TokenDistance._own_cards(a + b, a + b + c + d)),
+            _CardTable(cards, _TokenDistance._own_cards(a + c, a + b + c + d)),
+        )
+
+    @staticmethod
+    def _own_cards(card: float, population: float) -> Dict[str, float]:
+        """Return the cardinalities of a token set compared with itself.
+
+        Parameters
+        ----------
+        card : float or numpy.ndarray
+            The cardinality of the set
+        population : float or numpy.ndarray
+            The cardinality of the population
+
+        Returns
+        -------
+        dict
+            The crisp cardinalities
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {
+            'src_unique': card,
+            'tar_unique': card,
+            'src': card,
+            'tar': card,
+            'intersection': card,
+            'src_only': 0 * card,
+            'tar_only': 0 * card,
+            'total': 2 * card,
+            'union': card,
+            'total_complement': population - card,
+        }
+
     def _tokenize(
         self, src: Union[str, TCounter[str]], tar: Union[str, TCounter[str]]
     ) -> '_TokenDistance':
@@ -316,44 +789,219 @@ class _TokenDistance(_Distance):
             Encapsulated in class
 
         """
-        self._src_orig = src
-        self._tar_orig = tar
-
-        if isinstance(src, Counter):
-            self._src_tokens = src
-        else:
-            self._src_tokens = (
-                self.params['tokenizer'].tokenize(src).get_counter()
+        if isinstance(src, _CardTable):
+            context = _TokenContext(
+                src, tar, cards=src.own_cards if src is tar else src.cards
             )
-        if isinstance(tar, Counter):
-            self._tar_tokens = tar
         else:
-            self._tar_tokens = (
-                self.params['tokenizer'].tokenize(tar).get_counter()
+            context = self._tokenize_context(src, tar)
+        self._local.context = context
+        context.population_card_value = self._calc_population_card()
+
+        return self
+
+    def _tokenize_context(
+        self, src: Union[str, TCounter[str]], tar: Union[str, TCounter[str]]
+    ) -> _TokenContext:
+        """Return a new comparison context for the tokens of src & tar.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or QGrams/Counter objects) for comparison
+        tar : str
+            Target string (or QGrams/Counter objects) for comparison
+
+        Returns
+        -------
+        _TokenContext
+            The context, holding either the tokens of src & tar or the
+            cardinalities computed from their hashes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_tokens, src_hashes = self._get_tokens_or_hashes(src)
+        tar_tokens, tar_hashes = self._get_tokens_or_hashes(tar)
+
+        if src_hashes is not None and tar_hashes is not None:
+            return _TokenContext(
+                src,
+                tar,
+                src_tokens,
+                tar_tokens,
+                self._calc_hashed_cards(src_hashes, tar_hashes),
             )
 
-        self._population_card_value = self._calc_population_card()
+        # Counters are needed for both, e.g. if only one was a Counter
+        if src_tokens is None:
+            src_tokens = self.params['tokenizer'].tokenize_to_counter(src)
+        if tar_tokens is None:
+            tar_tokens = self.params['tokenizer'].tokenize_to_counter(tar)
+        return _TokenContext(src, tar, src_tokens, tar_tokens)
+
+    def _get_tokens_or_hashes(
+        self, string: Union[str, TCounter[str]]
+    ) -> Tuple[
+        Optional[TCounter[str]], Optional[Tuple[np.ndarray, np.ndarray]]
+    ]:
+        """Return the tokens of a string, or their hashes.
 
-        # Set up the normalizer, a function of two variables:
-        # x is the value in the contingency table square(s)
-        # n is the number of squares that x represents
-        if (
-            'normalizer' in self.params
-            and self.params['normalizer'] in self._norm_dict
-        ):
-            self.normalizer = self._norm_dict[self.params['normalizer']]
+        Parameters
+        ----------
+        string : str
+            A string (or _TokenizedStr/Counter object)
 
-        # clear values for soft intersection
-        self._soft_intersection_precalc = Counter()
-        self._soft_src_only = Counter()
-        self._soft_tar_only = Counter()
+        Returns
+        -------
+        tuple
+            The Counter of tokens (or None), and the hashes & counts of tokens
+            (or None). Only hashes are computed if the measure compares hashed
+            tokens and string is not a Counter.
 
-        return self
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(string, Counter):
+            return string, None
+        if isinstance(string, _TokenizedStr):
+            return string.tokens, string.hashes
+        if self._hashed:
+            return None, self.params['tokenizer'].tokenize_to_hashes(string)
+        return self.params['tokenizer'].tokenize_to_counter(string), None
+
+    def _calc_hashed_cards(
+        self,
+        src_hashes: Tuple[np.ndarray, np.ndarray],
+        tar_hashes: Tuple[np.ndarray, np.ndarray],
+    ) -> Dict[str, float]:
+        """Return the crisp cardinalities of two sets of hashed tokens.
+
+        These are the values that the Counter operations would produce, so
+        that non-positive counts are dropped in the same way (e.g. only
+        positive minima count towards the intersection).
+
+        Parameters
+        ----------
+        src_hashes : tuple
+            The sorted hashes & counts of the source tokens
+        tar_hashes : tuple
+            The sorted hashes & counts of the target tokens
+
+        Returns
+        -------
+        dict
+            The (unnormalized) cardinalities
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_hash, src_count = src_hashes
+        tar_hash, tar_count = tar_hashes
+
+        # Find the source hashes among the (sorted) target hashes.
+        pos = np.searchsorted(tar_hash, src_hash)
+        if len(tar_hash):
+            src_in = tar_hash.take(pos, mode='clip') == src_hash
+        else:
+            src_in = np.zeros(len(src_hash), dtype=np.bool_)
+        tar_ix = pos[src_in]
+        tar_in = np.zeros(len(tar_hash), dtype=np.bool_)
+        tar_in[tar_ix] = True
+
+        src_common = src_count[src_in]
+        tar_common = tar_count[tar_ix]
+        intersection = np.maximum(np.minimum(src_common, tar_common), 0)
+        common_total = src_common + tar_common
+        src_rest = np.maximum(src_count[~src_in], 0)
+        tar_rest = np.maximum(tar_count[~tar_in], 0)
+        src_pos = src_rest.sum()
+        tar_pos = tar_rest.sum()
+        total_len = (
+            np.count_nonzero(src_rest)
+            + np.count_nonzero(tar_rest)
+            + np.count_nonzero(common_total > 0)
+        )
+
+        # .item() gives Python ints for integer counts, as the Counters do
+        alphabet = self.params['alphabet']
+        return {
+            'src_unique': len(src_hash),
+            'tar_unique': len(tar_hash),
+            'src': np.abs(src_count).sum().item(),
+            'tar': np.abs(tar_count).sum().item(),
+            'intersection': intersection.sum().item(),
+            'src_only': (
+                src_pos + np.maximum(src_common - intersection, 0).sum()
+            ).item(),
+            'tar_only': (
+                tar_pos + np.maximum(tar_common - intersection, 0).sum()
+            ).item(),
+            'total': (
+                src_pos + tar_pos + np.maximum(common_total, 0).sum()
+            ).item(),
+            'union': (
+                src_pos
+                + tar_pos
+                + np.maximum(common_total - intersection, 0).sum()
+            ).item(),
+            'total_complement': 0
+            if alphabet is None
+            else max(0, alphabet - int(total_len)),
+        }
+
+    def _pairwise_prepare(self, strings: Iterable[str]) -> List[Any]:
+        """Return the strings, each carrying its tokens.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings to prepare
+
+        Returns
+        -------
+        list
+            The strings as _TokenizedStr objects (or the original objects, if
+            they are already Counters)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        prepared = []  # type: List[Any]
+        for string in cast(Iterable[Any], strings):
+            if isinstance(string, Counter):
+                prepared.append(string)
+                continue
+            tok_str = _TokenizedStr(string)
+            if self._hashed:
+                tok_str.hashes = self.params['tokenizer'].tokenize_to_hashes(
+                    string
+                )
+            else:
+                tok_str.tokens = self.params['tokenizer'].tokenize_to_counter(
+                    string
+                )
+            prepared.append(tok_str)
+        return prepared
 
     def _get_tokens(self) -> Tuple[TCounter[str], TCounter[str]]:
         """Return the src and tar tokens as a tuple."""
         return self._src_tokens, self._tar_tokens
 
+    def _either_empty(self) -> bool:
+        """Return True if src or tar has no tokens."""
+        if self._cards is not None:
+            # np.all, so that this also holds for arrays of cardinalities
+            # with no empty src or tar (see from_cards)
+            return not np.all(self._cards['src_unique']) or not np.all(
+                self._cards['tar_unique']
+            )
+        return not self._src_tokens or not self._tar_tokens
+
     def _src_card(self) -> float:
         r"""Return the cardinality of the tokens in the source set."""
         if self.params['intersection_type'] == 'soft':
@@ -369,6 +1017,10 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['src'], 2, self._population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._src_tokens.values()),
             2,
@@ -391,6 +1043,10 @@ class _TokenDistance(_Distance):
 
     def _src_only_card(self) -> float:
         """Return the cardinality of the tokens only in the source set."""
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['src_only'], 1, self._population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._src_only().values()),
             1,
@@ -412,6 +1068,10 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['tar'], 2, self._population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._tar_tokens.values()),
             2,
@@ -434,6 +1094,10 @@ class _TokenDistance(_Distance):
 
     def _tar_only_card(self) -> float:
         """Return the cardinality of the tokens only in the target set."""
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['tar_only'], 1, self._population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._tar_only().values()),
             1,
@@ -449,6 +1113,12 @@ class _TokenDistance(_Distance):
 
     def _symmetric_difference_card(self) -> float:
         """Return the cardinality of the symmetric difference."""
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['src_only'] + self._cards['tar_only'],
+                2,
+                self._population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._symmetric_difference().values()),
             2,
@@ -476,6 +1146,10 @@ class _TokenDistance(_Distance):
 
     def _total_card(self) -> float:
         """Return the cardinality of the complement of the total."""
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['total'], 3, self._population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._total().values()),
             3,
@@ -484,38 +1158,40 @@ class _TokenDistance(_Distance):
 
     def _total_complement_card(self) -> float:
         """Return the cardinality of the complement of the total."""
-        if self.params['alphabet'] is None:
-            return self.normalizer(0, 1, self._population_card_value)
-        elif isinstance(self.params['alphabet'], Counter):
+        if self._cards is not None:
             return self.normalizer(
-                max(
-                    0,
-                    sum(
-                        abs(val)
-                        for val in (
-                            self.params['alphabet'] - self._total()
-                        ).values()
-                    ),
-                ),
+                self._cards['total_complement'],
                 1,
                 self._population_card_value,
             )
         return self.normalizer(
-            max(0, self.params['alphabet'] - len(self._total().values())),
+            self._total_complement(self._total()),
             1,
             self._population_card_value,
         )
 
+    def _total_complement(self, total: TCounter[str]) -> float:
+        """Return the unnormalized cardinality of the complement of total."""
+        if self.params['alphabet'] is None:
+            return 0
+        elif isinstance(self.params['alphabet'], Counter):
+            return max(
+                0,
+                sum(
+                    abs(val)
+                    for val in (self.params['alphabet'] - total).values()
+                ),
+            )
+        return cast(float, max(0, self.params['alphabet'] - len(total)))
+
     def _calc_population_card(self) -> float:
         """Return the cardinality of the population."""
-        save_normalizer = self.normalizer
-        self.normalizer = self._norm_none
-        save_intersection = self.params['intersection_type']
-        self.params['intersection_type'] = 'crisp'
-        pop = self._total_card() + self._total_complement_card()
-        self.normalizer = save_normalizer
-        self.params['intersection_type'] = save_intersection
-        return pop
+        if self._cards is not None:
+            return self._cards['total'] + self._cards['total_complement']
+        total = self._src_tokens + self._tar_tokens
+        return sum(
+            abs(val) for val in total.values()
+        ) + self._total_complement(total)
 
     def _population_card(self) -> float:
         """Return the cardinality of the population."""
@@ -551,6 +1227,10 @@ class _TokenDistance(_Distance):
 
     def _union_card(self) -> float:
         """Return the cardinality of the union."""
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['union'], 3, self._population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._union().values()),
             3,
@@ -686,10 +1366,11 @@ member function, such as Levenshtein."
         src_only += src_new
         tar_only += tar_new
 
-        # Save src_only/tar_only to the instance for retrieval later.
-        self._soft_src_only = src_only
-        self._soft_tar_only = tar_only
-        self._soft_intersection_precalc = intersection
+        # Save src_only/tar_only to the context for retrieval later.
+        context = self._context
+        context.soft_src_only = src_only
+        context.soft_tar_only = tar_only
+        context.soft_intersection_precalc = intersection
 
         return intersection
 
@@ -966,6 +1647,10 @@ member function, such as Levenshtein."
 
     def _intersection_card(self) -> float:
         """Return the cardinality of the intersection."""
+        if self._cards is not None:
+            return self.normalizer(
+                self._cards['intersection'], 1, self._population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._intersection().values()),
             1,
@@ -171,7 +171,7 @@ class Tversky(_TokenDistance):
         q_tar_mag = self._tar_only_card()
         q_intersection_mag = self._intersection_card()
 
-        if not self._src_tokens or not self._tar_tokens:
+        if self._either_empty():
             return 0.0
 
         if self.params['bias'] is None:
@@ -19,7 +19,7 @@
 Yujian-Bo normalized Levenshtein distance
 """
 
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 from ._levenshtein import Levenshtein
 
@@ -57,11 +57,15 @@ class YujianBo(Levenshtein):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
         super(YujianBo, self).__init__(cost=cost, **kwargs)
 
-    def dist_abs(self, src: str, tar: str) -> float:
+    def dist_abs(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the Yujian-Bo normalized edit distance between two strings.
 
         Parameters
@@ -70,6 +74,9 @@ class YujianBo(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, normalized distances greater than this are not computed
+            in full: a value greater than max_distance is returned instead
 
         Returns
         -------
@@ -90,11 +97,15 @@ class YujianBo(Levenshtein):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance parameter
 
         """
-        return self.dist(src, tar)
+        return self.dist(src, tar, max_distance)
 
-    def dist(self, src: str, tar: str) -> float:
+    def dist(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
         """Return the Yujian-Bo normalized edit distance between strings.
 
         Parameters
@@ -103,6 +114,9 @@ class YujianBo(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, normalized distances greater than this are not computed
+            in full: a value greater than max_distance is returned instead
 
         Returns
         -------
@@ -129,7 +143,19 @@ class YujianBo(Levenshtein):
             return 0.0
 
         ins_cost, del_cost = self._cost[:2]
-        gld = super(YujianBo, self).dist_abs(src, tar)
+        if max_distance is None or max_distance >= 2:
+            gld = super(YujianBo, self).dist_abs(src, tar)
+        else:
+            # The normalized distance 2g / (n + g) is at most max_distance
+            # iff the generalized Levenshtein distance g is at most
+            # max_distance * n / (2 - max_distance).
+            gld = super(YujianBo, self).dist_abs(
+                src,
+                tar,
+                max_distance=max_distance
+                * (len(src) * del_cost + len(tar) * ins_cost)
+                / (2 - max_distance),
+            )
         return 2 * gld / (len(src) * del_cost + len(tar) * ins_cost + gld)
 
 
@@ -91,6 +91,7 @@ Classes for which ``encode`` returns a numeric value generally have an
 ``encode_alpha`` method that returns an alphabetic version of the phonetic
 encoding, as demonstrated below:
 
+>>> from abydos.phonetic import RussellIndex
 >>> rus = RussellIndex()
 >>> rus.encode('Abramson')
 '128637'
@@ -101,50 +102,107 @@ encoding, as demonstrated below:
 
 """
 
-from ._ainsworth import Ainsworth
-from ._alpha_sis import AlphaSIS
-from ._beider_morse import BeiderMorse
-from ._caverphone import Caverphone
-from ._daitch_mokotoff import DaitchMokotoff
-from ._davidson import Davidson
-from ._dolby import Dolby
-from ._double_metaphone import DoubleMetaphone
-from ._eudex import Eudex
-from ._fonem import FONEM
-from ._fuzzy_soundex import FuzzySoundex
-from ._haase import Haase
-from ._henry_early import HenryEarly
-from ._koelner import Koelner
-from ._lein import LEIN
-from ._meta_soundex import MetaSoundex
-from ._metaphone import Metaphone
-from ._mra import MRA
-from ._norphone import Norphone
-from ._nrl import NRL
-from ._nysiis import NYSIIS
-from ._onca import ONCA
-from ._parmar_kumbharana import ParmarKumbharana
-from ._phonem import Phonem
-from ._phonet import Phonet
-from ._phonetic import _Phonetic
-from ._phonetic_spanish import PhoneticSpanish
-from ._phonex import Phonex
-from ._phonic import PHONIC
-from ._phonix import Phonix
-from ._pshp_soundex_first import PSHPSoundexFirst
-from ._pshp_soundex_last import PSHPSoundexLast
-from ._refined_soundex import RefinedSoundex
-from ._reth_schek import RethSchek
-from ._roger_root import RogerRoot
-from ._russell_index import RussellIndex
-from ._sfinx_bis import SfinxBis
-from ._sound_d import SoundD
-from ._soundex import Soundex
-from ._soundex_br import SoundexBR
-from ._spanish_metaphone import SpanishMetaphone
-from ._spfc import SPFC
-from ._statistics_canada import StatisticsCanada
-from ._waahlin import Waahlin
+import sys
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    # Type checkers do not follow __getattr__, so members are imported
+    # explicitly for them.
+    from ._ainsworth import Ainsworth
+    from ._alpha_sis import AlphaSIS
+    from ._beider_morse import BeiderMorse
+    from ._caverphone import Caverphone
+    from ._daitch_mokotoff import DaitchMokotoff
+    from ._davidson import Davidson
+    from ._dolby import Dolby
+    from ._double_metaphone import DoubleMetaphone
+    from ._eudex import Eudex
+    from ._fonem import FONEM
+    from ._fuzzy_soundex import FuzzySoundex
+    from ._haase import Haase
+    from ._henry_early import HenryEarly
+    from ._koelner import Koelner
+    from ._lein import LEIN
+    from ._meta_soundex import MetaSoundex
+    from ._metaphone import Metaphone
+    from ._mra import MRA
+    from ._norphone import Norphone
+    from ._nrl import NRL
+    from ._nysiis import NYSIIS
+    from ._onca import ONCA
+    from ._parmar_kumbharana import ParmarKumbharana
+    from ._phonem import Phonem
+    from ._phonet import Phonet
+    from ._phonetic import _Phonetic
+    from ._phonetic_spanish import PhoneticSpanish
+    from ._phonex import Phonex
+    from ._phonic import PHONIC
+    from ._phonix import Phonix
+    from ._pshp_soundex_first import PSHPSoundexFirst
+    from ._pshp_soundex_last import PSHPSoundexLast
+    from ._refined_soundex import RefinedSoundex
+    from ._reth_schek import RethSchek
+    from ._roger_root import RogerRoot
+    from ._russell_index import RussellIndex
+    from ._sfinx_bis import SfinxBis
+    from ._sound_d import SoundD
+    from ._soundex import Soundex
+    from ._soundex_br import SoundexBR
+    from ._spanish_metaphone import SpanishMetaphone
+    from ._spfc import SPFC
+    from ._statistics_canada import StatisticsCanada
+    from ._waahlin import Waahlin
+
+# The module in which each member is defined. Members are imported on first
+# access (see __getattr__ below), so that importing this package does not
+# import every one of its modules.
+_MEMBER_MODULES = {
+    'Ainsworth': '_ainsworth',
+    'AlphaSIS': '_alpha_sis',
+    'BeiderMorse': '_beider_morse',
+    'Caverphone': '_caverphone',
+    'DaitchMokotoff': '_daitch_mokotoff',
+    'Davidson': '_davidson',
+    'Dolby': '_dolby',
+    'DoubleMetaphone': '_double_metaphone',
+    'Eudex': '_eudex',
+    'FONEM': '_fonem',
+    'FuzzySoundex': '_fuzzy_soundex',
+    'Haase': '_haase',
+    'HenryEarly': '_henry_early',
+    'Koelner': '_koelner',
+    'LEIN': '_lein',
+    'MetaSoundex': '_meta_soundex',
+    'Metaphone': '_metaphone',
+    'MRA': '_mra',
+    'Norphone': '_norphone',
+    'NRL': '_nrl',
+    'NYSIIS': '_nysiis',
+    'ONCA': '_onca',
+    'ParmarKumbharana': '_parmar_kumbharana',
+    'Phonem': '_phonem',
+    'Phonet': '_phonet',
+    '_Phonetic': '_phonetic',
+    'PhoneticSpanish': '_phonetic_spanish',
+    'Phonex': '_phonex',
+    'PHONIC': '_phonic',
+    'Phonix': '_phonix',
+    'PSHPSoundexFirst': '_pshp_soundex_first',
+    'PSHPSoundexLast': '_pshp_soundex_last',
+    'RefinedSoundex': '_refined_soundex',
+    'RethSchek': '_reth_schek',
+    'RogerRoot': '_roger_root',
+    'RussellIndex': '_russell_index',
+    'SfinxBis': '_sfinx_bis',
+    'SoundD': '_sound_d',
+    'Soundex': '_soundex',
+    'SoundexBR': '_soundex_br',
+    'SpanishMetaphone': '_spanish_metaphone',
+    'SPFC': '_spfc',
+    'StatisticsCanada': '_statistics_canada',
+    'Waahlin': '_waahlin',
+}
 
 __all__ = [
     '_Phonetic',
@@ -194,6 +252,54 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import and return a member of the package on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the member
+
+    Returns
+    -------
+    Any
+        The member
+
+    Raises
+    ------
+    AttributeError
+        module has no attribute
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if name in _MEMBER_MODULES:
+        module = import_module('.' + _MEMBER_MODULES[name], __name__)
+        member = getattr(module, name)
+        globals()[name] = member
+        return member
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name)
+    )
+
+
+def __dir__() -> List[str]:
+    """Return the names in the package, including those not yet imported.
+
+    .. versionadded:: 0.6.0
+
+    """
+    return sorted(set(globals()) | set(_MEMBER_MODULES))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module-level __getattr__ (PEP 562) requires Python 3.7, so earlier
+    # versions import every member up front.
+    for _name in _MEMBER_MODULES:
+        __getattr__(_name)
+
+
 if __name__ == '__main__':
     import doctest
 
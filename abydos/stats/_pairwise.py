@@ -19,19 +19,379 @@
 The stats._pairwise module implements pairwise statistical algorithms.
 """
 
-from typing import Callable, Optional, Sequence, Set, Tuple, Union, cast
-
-from ._mean import amean, hmean, std
+from concurrent.futures import ProcessPoolExecutor
+from math import isnan
+from os import cpu_count
+from typing import (
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from ._mean import amean, gmean, hmean, std
 from ..distance._levenshtein import Levenshtein
 
 __all__ = ['mean_pairwise_similarity', 'pairwise_similarity_statistics']
 
+# The mean functions that _PairwiseAccumulator can compute without retaining
+# every value
+_STREAMING_MEANS = {amean, gmean, hmean}
+
+
+class _PairwiseAccumulator:
+    """A streaming reduction of pairwise similarity values.
+
+    The accumulator tracks the count, maximum, and minimum of the values added
+    to it, the running sums needed for the arithmetic, geometric, and harmonic
+    means, and the running mean & sum of squared deviations for Welford's
+    online variance algorithm. For any other mean function, the values are
+    retained in a list.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = (
+        'count',
+        'max',
+        'min',
+        'first',
+        'all_equal',
+        'zeros',
+        'total',
+        'recip_total',
+        'product',
+        'welford_mean',
+        'welford_m2',
+        'values',
+    )
+
+    def __init__(self, keep_values: bool = False) -> None:
+        """Initialize _PairwiseAccumulator instance.
+
+        Parameters
+        ----------
+        keep_values : bool
+            If True, every value added is retained in the values list
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.count = 0
+        self.max = float('-inf')
+        self.min = float('inf')
+        self.first = 0.0
+        self.all_equal = True
+        self.zeros = 0
+        self.total = 0.0
+        self.recip_total = 0.0
+        self.product = 1.0
+        self.welford_mean = 0.0
+        self.welford_m2 = 0.0
+        self.values = (
+            [] if keep_values else None
+        )  # type: Optional[List[float]]
+
+    def add(self, value: float) -> None:
+        """Add a value to the accumulator.
+
+        Parameters
+        ----------
+        value : float
+            A similarity value
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.values is not None:
+            self.values.append(value)
+
+        self.count += 1
+        if self.count == 1:
+            self.first = value
+            self.max = value
+            self.min = value
+        else:
+            if value != self.first:
+                self.all_equal = False
+            if value > self.max:
+                self.max = value
+            if value < self.min:
+                self.min = value
+
+        self.total += value
+        self.product *= value
+        if value == 0:
+            self.zeros += 1
+        else:
+            self.recip_total += 1.0 / value
+
+        delta = value - self.welford_mean
+        self.welford_mean += delta / self.count
+        self.welford_m2 += delta * (value - self.welford_mean)
+
+    def merge(self, other: '_PairwiseAccumulator') -> None:
+        """Merge another accumulator, which follows this one, into this one.
+
+        The variance terms are combined by the pairwise update of Chan, Golub,
+        & LeVeque.
+
+        Parameters
+        ----------
+        other : _PairwiseAccumulator
+            The accumulator to merge
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not other.count:
+            return
+        if self.values is not None and other.values is not None:
+            self.values.extend(other.values)
+        if not self.count:
+            for attr in self.__slots__:
+                if attr != 'values':
+                    setattr(self, attr, getattr(other, attr))
+            return
+
+        count = self.count + other.count
+        delta = other.welford_mean - self.welford_mean
+        self.welford_m2 += (
+            other.welford_m2 + delta * delta * self.count * other.count / count
+        )
+        self.welford_mean += delta * other.count / count
+
+        self.all_equal = (
+            self.all_equal and other.all_equal and self.first == other.first
+        )
+        self.max = max(self.max, other.max)
+        self.min = min(self.min, other.min)
+        self.zeros += other.zeros
+        self.total += other.total
+        self.recip_total += other.recip_total
+        self.product *= other.product
+        self.count = count
+
+    def mean(self, mean_func: Callable[[Sequence[float]], float]) -> float:
+        """Return the mean of the values, according to mean_func.
+
+        Parameters
+        ----------
+        mean_func : function
+            A mean function that takes a list of values and returns a float
+
+        Returns
+        -------
+        float
+            The mean of the values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if mean_func not in _STREAMING_MEANS:
+            return mean_func(cast(List[float], self.values))
+        if mean_func is amean:
+            return self.total / self.count
+        if mean_func is gmean:
+            return self.product ** (1 / self.count)
+        # hmean
+        if self.all_equal:
+            return self.first
+        if self.zeros:
+            return float('nan') if self.zeros > 1 else 0
+        return self.count / self.recip_total
+
+    def std(self, mean_func: Callable[[Sequence[float]], float]) -> float:
+        """Return the population standard deviation about the mean_func mean.
+
+        Parameters
+        ----------
+        mean_func : function
+            A mean function that takes a list of values and returns a float
+
+        Returns
+        -------
+        float
+            The standard deviation of the values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if mean_func not in _STREAMING_MEANS:
+            return std(cast(List[float], self.values), mean_func, 0)
+        # The sum of squared deviations about any center is the sum of squared
+        # deviations about the arithmetic mean plus n times the squared
+        # distance between the two.
+        offset = (
+            0.0
+            if mean_func is amean
+            else self.welford_mean - self.mean(mean_func)
+        )
+        m2 = self.welford_m2 + self.count * offset * offset
+        if isnan(m2):
+            return float('nan')
+        return (max(0.0, m2) / self.count) ** 0.5
+
+
+def _pairwise_chunk(
+    metric: Callable[[str, str], float],
+    src_collection: Sequence[str],
+    tar_collection: Optional[Sequence[str]],
+    start: int,
+    stop: int,
+    symmetric: bool,
+    keep_values: bool,
+) -> _PairwiseAccumulator:
+    """Return the accumulated similarities for a block of rows.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+    src_collection : list
+        The source collection
+    tar_collection : list or None
+        The target collection, or None if each member of src_collection
+        should be compared with the members following it
+    start : int
+        The index of the first row of src_collection to compare
+    stop : int
+        The index after the last row of src_collection to compare
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions
+    keep_values : bool
+        If True, every similarity is retained by the accumulator
+
+    Returns
+    -------
+    _PairwiseAccumulator
+        The accumulated similarities
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    acc = _PairwiseAccumulator(keep_values)
+    for i in range(start, stop):
+        src = src_collection[i]
+        tars = (
+            src_collection[i + 1 :]
+            if tar_collection is None
+            else tar_collection
+        )
+        for tar in tars:
+            acc.add(metric(src, tar))
+            if symmetric:
+                acc.add(metric(tar, src))
+    return acc
+
+
+def _pairwise_reduce(
+    metric: Callable[[str, str], float],
+    src_collection: Sequence[str],
+    tar_collection: Optional[Sequence[str]],
+    mean_func: Callable[[Sequence[float]], float],
+    symmetric: bool,
+    workers: Optional[int],
+) -> _PairwiseAccumulator:
+    """Return the accumulated pairwise similarities of the collections.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+    src_collection : list
+        The source collection
+    tar_collection : list or None
+        The target collection, or None if each member of src_collection
+        should be compared with the members following it
+    mean_func : function
+        A mean function that takes a list of values and returns a float
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions
+    workers : int or None
+        The number of worker processes to use; None uses one per CPU
+
+    Returns
+    -------
+    _PairwiseAccumulator
+        The accumulated similarities
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    keep_values = mean_func not in _STREAMING_MEANS
+    rows = len(src_collection)
+    if workers is None:
+        workers = cpu_count() or 1
+
+    if workers <= 1 or rows < 2:
+        return _pairwise_chunk(
+            metric,
+            src_collection,
+            tar_collection,
+            0,
+            rows,
+            symmetric,
+            keep_values,
+        )
+
+    # Divide the rows into contiguous blocks, several per worker, with
+    # roughly equal numbers of pairs. (Rows of a triangular comparison have
+    # decreasing numbers of pairs.)
+    blocks = workers * 4
+    if tar_collection is None:
+        row_pairs = [rows - 1 - i for i in range(rows)]
+    else:
+        row_pairs = [len(tar_collection)] * rows
+    target = max(1, sum(row_pairs) // blocks)
+    bounds = [0]
+    pairs = 0
+    for i, count in enumerate(row_pairs):
+        pairs += count
+        if pairs >= target and i + 1 < rows:
+            bounds.append(i + 1)
+            pairs = 0
+    bounds.append(rows)
+
+    acc = _PairwiseAccumulator(keep_values)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _pairwise_chunk,
+                metric,
+                src_collection,
+                tar_collection,
+                start,
+                stop,
+                symmetric,
+                keep_values,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            acc.merge(future.result())
+    return acc
+
 
 def mean_pairwise_similarity(
     collection: Union[str, Sequence[str], Set[str]],
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = hmean,
     symmetric: bool = False,
+    workers: Optional[int] = 1,
 ) -> float:
     """Calculate the mean pairwise similarity of a collection of strings.
 
@@ -50,12 +410,24 @@ def mean_pairwise_similarity(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    workers : int or None
+        The number of worker processes among which to divide the comparisons
+        (1 by default, i.e. no worker processes). None uses one per CPU. When
+        using workers, metric must be picklable (e.g. the sim method of a
+        distance measure instance, but not a lambda).
 
     Returns
     -------
     float
         The mean pairwise similarity of a collection of strings
 
+    Notes
+    -----
+    When mean_func is one of :py:func:`.amean`, :py:func:`.gmean`, or
+    :py:func:`.hmean`, the mean is computed as the similarities are generated,
+    so memory use does not grow with the number of pairs. Any other mean_func
+    requires that all of the similarities be retained.
+
     Raises
     ------
     ValueError
@@ -76,6 +448,8 @@ def mean_pairwise_similarity(
     0.545454545455
 
     .. versionadded:: 0.1.0
+    .. versionchanged:: 0.6.0
+        Added workers parameter & streaming reduction
 
     """
     if metric is None:
@@ -94,15 +468,11 @@ def mean_pairwise_similarity(
 
     collection = list(collection)
 
-    pairwise_values = []
-
-    for i in range(len(collection)):
-        for j in range(i + 1, len(collection)):
-            pairwise_values.append(metric(collection[i], collection[j]))
-            if symmetric:
-                pairwise_values.append(metric(collection[j], collection[i]))
+    acc = _pairwise_reduce(
+        metric, collection, None, mean_func, symmetric, workers
+    )
 
-    return mean_func(pairwise_values)
+    return acc.mean(mean_func)
 
 
 def pairwise_similarity_statistics(
@@ -111,6 +481,7 @@ def pairwise_similarity_statistics(
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = amean,
     symmetric: bool = False,
+    workers: Optional[int] = 1,
 ) -> Tuple[float, float, float, float]:
     """Calculate the pairwise similarity statistics a collection of strings.
 
@@ -132,6 +503,11 @@ def pairwise_similarity_statistics(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    workers : int or None
+        The number of worker processes among which to divide the comparisons
+        (1 by default, i.e. no worker processes). None uses one per CPU. When
+        using workers, metric must be picklable (e.g. the sim method of a
+        distance measure instance, but not a lambda).
 
     Returns
     -------
@@ -148,6 +524,16 @@ def pairwise_similarity_statistics(
         src_collection is neither a string nor iterable
     ValueError
         tar_collection is neither a string nor iterable
+    ValueError
+        src_collection or tar_collection has no members
+
+    Notes
+    -----
+    When mean_func is one of :py:func:`.amean`, :py:func:`.gmean`, or
+    :py:func:`.hmean`, the statistics are computed as the similarities are
+    generated (using Welford's algorithm for the standard deviation), so
+    memory use does not grow with the number of pairs. Any other mean_func
+    requires that all of the similarities be retained.
 
     Example
     -------
@@ -156,6 +542,8 @@ def pairwise_similarity_statistics(
     (0.2, 0.0, 0.118614718615, 0.075070477184)
 
     .. versionadded:: 0.3.0
+    .. versionchanged:: 0.6.0
+        Added workers parameter & streaming reduction
 
     """
     if metric is None:
@@ -177,22 +565,15 @@ def pairwise_similarity_statistics(
 
     src_collection = list(src_collection)
     tar_collection = list(tar_collection)
+    if not src_collection or not tar_collection:
+        raise ValueError('src_collection or tar_collection has no members')
 
-    pairwise_values = []
-
-    for src in src_collection:
-        for tar in tar_collection:
-            pairwise_values.append(metric(src, tar))
-            if symmetric:
-                pairwise_values.append(metric(tar, src))
-
-    return (
-        max(pairwise_values),
-        min(pairwise_values),
-        mean_func(pairwise_values),
-        std(pairwise_values, mean_func, 0),
+    acc = _pairwise_reduce(
+        metric, src_collection, tar_collection, mean_func, symmetric, workers
     )
 
+    return (acc.max, acc.min, acc.mean(mean_func), acc.std(mean_func))
+
 
 if __name__ == '__main__':
     import doctest
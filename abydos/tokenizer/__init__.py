@@ -83,6 +83,12 @@ Finally, an NLTK tokenizer is provided:
     - :py:class:`.NLTKTokenizer` does tokenization using an instantiated NLTK
       tokenizer. Accordingly, NLTK_ needs to be installed.
 
+Any tokenizer may be used by a :py:class:`.Vectorizer`, which turns a
+collection of strings into a :py:class:`.TokenMatrix`, a sparse matrix of
+token weights with a row for each string. The intersections, unions, & dot
+products of all pairs of rows are then computed without tokenizing any string
+again.
+
 .. _SyllabiPy: https://pypi.org/project/syllabipy/
 .. _NLTK: https://www.nltk.org/
 
@@ -103,6 +109,7 @@ from ._saps import SAPSTokenizer
 from ._sonoripy import SonoriPyTokenizer
 from ._tokenizer import _Tokenizer
 from ._vc_cluster import VCClusterTokenizer
+from ._vectorizer import TokenMatrix, Vectorizer
 from ._whitespace import WhitespaceTokenizer
 from ._wordpunct import WordpunctTokenizer
 
@@ -121,6 +128,8 @@ __all__ = [
     'SonoriPyTokenizer',
     'LegaliPyTokenizer',
     'NLTKTokenizer',
+    'Vectorizer',
+    'TokenMatrix',
 ]
 
 
@@ -19,7 +19,7 @@
 Character tokenizer
 """
 
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -74,12 +74,17 @@ class CharacterTokenizer(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
-        self._ordered_tokens = list(string)
-
-        self._scale_and_counterize()
+        super().tokenize(string)
         return self
 
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return list(string)
+
 
 if __name__ == '__main__':
     import doctest
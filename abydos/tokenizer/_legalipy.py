@@ -19,18 +19,35 @@
 LegaliPy tokenizer class
 """
 
-from typing import Callable, Optional, Union
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ._tokenizer import _Tokenizer
 
 try:
     from syllabipy.legalipy import LegaliPy
-    from syllabipy.legalipy import getOnsets as gen_onsets  # noqa: N813
+    from syllabipy.util import cleantext
 except ImportError:  # pragma: no cover
     # If the system lacks the SyllabiPy library, that's fine, but SyllabiPy
     # tokenization won't be supported.
     LegaliPy = None  # type: ignore
-    gen_onsets = None  # type: ignore
+    cleantext = None  # type: ignore
+
+# The onset of a word is everything up to its first vowel, as in SyllabiPy
+_ONSET = re.compile('[^aeiouyàáâäæãåāèéêëēėęîïíīįìôöòóœøōõûüùúūůÿ]*')
 
 
 class LegaliPyTokenizer(_Tokenizer):
@@ -40,7 +57,9 @@ class LegaliPyTokenizer(_Tokenizer):
     """
 
     def __init__(
-        self, scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        self,
+        scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        cache_size: int = 65536,
     ) -> None:
         """Initialize Tokenizer.
 
@@ -60,9 +79,14 @@ class LegaliPyTokenizer(_Tokenizer):
                   in the Counter. Some useful functions include math.exp,
                   math.log1p, math.sqrt, and indexes into interesting integer
                   sequences such as the Fibonacci sequence.
+        cache_size : int
+            The number of words whose syllables are cached. The least recently
+            used are dropped first. If 0, nothing is cached.
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size parameter
 
         """
         if LegaliPy is None:
@@ -73,21 +97,52 @@ class LegaliPyTokenizer(_Tokenizer):
 
         super(LegaliPyTokenizer, self).__init__(scaler)
 
-        self._onsets = ['']
+        self._onsets = frozenset([''])  # type: FrozenSet[str]
+        self._cache_size = cache_size
+        self._syllabify = lru_cache(maxsize=cache_size)(
+            self._syllabify_word
+        )  # type: Callable[[str], Tuple[str, ...]]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state of the instance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_syllabify']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the instance from its pickled state.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._syllabify = lru_cache(maxsize=self._cache_size)(
+            self._syllabify_word
+        )
 
     def train_onsets(
         self,
-        text: str,
+        text: Union[str, Iterable[str]],
         threshold: float = 0.0002,
         clean: bool = True,
         append: bool = False,
     ) -> None:
         """Train the onsets on a text.
 
+        The onsets of the words are counted one string at a time, so a large
+        text may be supplied as an iterable of strings, such as an open file,
+        without reading all of it into memory.
+
         Parameters
         ----------
-        text : str
-            The text on which to train
+        text : str or Iterable[str]
+            The text on which to train, or an iterable of strings (e.g. the
+            lines of a file) which make up the text. Words may not be split
+            across strings.
         threshold : float
             Threshold proportion above which to include onset into onset list
         clean : bool
@@ -95,15 +150,61 @@ class LegaliPyTokenizer(_Tokenizer):
         append : bool
             If True, the current onset list is extended
 
+        Examples
+        --------
+        >>> tok = LegaliPyTokenizer()
+        >>> tok.train_onsets(['the quick brown fox', 'jumped over'])
+        >>> sorted(tok.get_onsets())
+        ['br', 'f', 'j', 'q', 'th']
+
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            text may be an iterable of strings
 
         """
-        new_onsets = gen_onsets(text, threshold, clean)
+        if isinstance(text, str):
+            text = (text,)
+
+        counts = Counter()  # type: TCounter[str]
+        for chunk in text:
+            if clean:
+                chunk = cleantext(chunk)
+            for word in chunk.split():
+                onset = _ONSET.match(word.lower()).group()  # type: ignore
+                if onset:
+                    counts[onset] += 1
+
+        total = sum(counts.values())
+        new_onsets = frozenset(
+            onset
+            for onset, count in counts.items()
+            if count / total > threshold
+        )
         if append:
-            self._onsets = list(set(self._onsets + new_onsets))
+            self._onsets = self._onsets | new_onsets
         else:
             self._onsets = new_onsets
+        self._syllabify.cache_clear()  # type: ignore
+
+    def get_onsets(self) -> FrozenSet[str]:
+        """Return the set of legal onsets.
+
+        Returns
+        -------
+        frozenset
+            The onsets
+
+        Examples
+        --------
+        >>> LegaliPyTokenizer().get_onsets()
+        frozenset({''})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._onsets
 
     def tokenize(self, string: str, ipa: bool = False) -> 'LegaliPyTokenizer':
         """Tokenize the term and store it.
@@ -129,16 +230,29 @@ class LegaliPyTokenizer(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
+        super().tokenize(string)
+        return self
 
-        self._ordered_tokens = []
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokens = []  # type: List[str]
         for word in string.split():
-            self._ordered_tokens += LegaliPy(word, self._onsets)
-        if not self._ordered_tokens:
-            self._ordered_tokens = [self._string]
+            tokens += self._syllabify(word)
+        if not tokens:
+            tokens = [string]
+        return tokens
 
-        self._scale_and_counterize()
-        return self
+    def _syllabify_word(self, word: str) -> Tuple[str, ...]:
+        """Return the syllables of a word.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return tuple(LegaliPy(word, self._onsets))
 
 
 if __name__ == '__main__':
@@ -20,7 +20,7 @@ NLTK tokenizer wrapper class
 """
 
 from inspect import isclass
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -100,11 +100,17 @@ class NLTKTokenizer(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
-        self._ordered_tokens = self.nltk_tokenizer.tokenize(string)
-        self._scale_and_counterize()
+        super().tokenize(string)
         return self
 
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.nltk_tokenizer.tokenize(string)  # type: ignore
+
 
 if __name__ == '__main__':
     import doctest
@@ -20,12 +20,25 @@ QGrams multi-set class
 """
 
 from collections import Iterable
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from typing import (
+    Callable,
+    Iterable as TIterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 from ._tokenizer import _Tokenizer
 
 __all__ = ['QGrams']
 
+_HASH_BASE = np.uint64(0x9E3779B97F4A7C15)
+
 
 class QGrams(_Tokenizer):
     """A q-gram class, which functions like a bag/multiset.
@@ -44,6 +57,7 @@ class QGrams(_Tokenizer):
         start_stop: str = '$#',
         skip: Union[int, TIterable[int]] = 0,
         scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        hashed: bool = False,
     ) -> None:
         """Initialize QGrams.
 
@@ -78,6 +92,12 @@ class QGrams(_Tokenizer):
                   in the Counter. Some useful functions include math.exp,
                   math.log1p, math.sqrt, and indexes into interesting integer
                   sequences such as the Fibonacci sequence.
+        hashed : bool
+            If True, token distance measures with a crisp intersection compare
+            the tokens of strings as sorted arrays of 64-bit hashes (see
+            :py:meth:`_Tokenizer.tokenize_to_hashes`), rather than as Counters.
+            This is faster for strings longer than a few words, but slower for
+            single words.
 
         Raises
         ------
@@ -120,6 +140,8 @@ class QGrams(_Tokenizer):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.4.0
             Broke tokenization functions out into tokenize method
+        .. versionchanged:: 0.6.0
+            Added hashed parameter
 
         """
         if qval == 0:
@@ -132,8 +154,7 @@ class QGrams(_Tokenizer):
         if qval == 1:
             self.start_stop = ''
         self.skip = skip
-
-        self._string_ss = self._string
+        self.hashed = hashed
 
     def tokenize(self, string: str) -> 'QGrams':
         """Tokenize the term and store it.
@@ -150,46 +171,163 @@ class QGrams(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
-        self._ordered_tokens = []
-
-        if not isinstance(self.qval, Iterable):
-            self.qval = (self.qval,)
-        if not isinstance(self.skip, Iterable):
-            self.skip = (self.skip,)
-
-        if string:
-            for qval_i in cast(TIterable[int], self.qval):
-                for skip_i in cast(TIterable[int], self.skip):
-                    if qval_i < 1:
-                        continue
-
-                    if self.start_stop:
-                        string = (
-                            self.start_stop[0] * (qval_i - 1)
-                            + self._string
-                            + self.start_stop[-1] * (qval_i - 1)
-                        )
-                    else:
-                        string = self._string
-
-                    if qval_i > 1 and len(string) < qval_i:
-                        continue
-
-                    # Having appended start & stop symbols (or not), save the
-                    # result, but only for the longest valid qval_i
-                    if len(string) > len(self._string_ss):
-                        self._string_ss = string
-
-                    skip_i += 1
-                    self._ordered_tokens += [
-                        string[i : i + (qval_i * skip_i) : skip_i]
-                        for i in range(len(string) - (qval_i - 1))
-                    ]
-
-        self._scale_and_counterize()
+        super().tokenize(string)
         return self
 
+    def tokenize_to_hashes(self, string: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the q-grams of a string as sorted 64-bit hashes & counts.
+
+        Unless the scaler is one based on the q-grams' lengths or entropy, the
+        q-grams are hashed directly from the string's code points with NumPy,
+        without building any q-gram strings. Each q-gram's hash is a
+        polynomial (Rabin-Karp) hash of its code points, so hashes are only
+        comparable with others from QGrams.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        tuple
+            The hashes of the distinct q-grams, in ascending order (as uint64),
+            and the count (or scaled weight) of each, as
+            :py:meth:`tokenize_to_counter` would return them (as int64 if
+            they are all ints, otherwise as float)
+
+        Examples
+        --------
+        >>> hashes, counts = QGrams().tokenize_to_hashes('AATTATAT')
+        >>> len(hashes), sorted(counts.tolist())
+        (6, [1, 1, 1, 1, 2, 3])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not (
+            self._scaler is None
+            or self._scaler == 'set'
+            or callable(self._scaler)
+        ):
+            return super().tokenize_to_hashes(string)
+
+        hashes = [
+            self._hash_q_grams(padded, qval_i, skip_i)
+            for qval_i, skip_i, padded in self._padded(string)
+        ]
+        if not hashes:
+            return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+        unique, counts = np.unique(np.concatenate(hashes), return_counts=True)
+        if self._scaler == 'set':
+            weights = np.ones(len(unique), dtype=np.int64)
+        elif callable(self._scaler):
+            scaled = [self._scaler(count) for count in counts.tolist()]
+            weights = np.array(
+                scaled,
+                dtype=np.int64
+                if all(isinstance(count, int) for count in scaled)
+                else np.float_,
+            )
+        else:
+            weights = counts.astype(np.int64)
+        return unique, weights
+
+    @staticmethod
+    def _hash_q_grams(padded: str, qval: int, skip: int) -> np.ndarray:
+        """Return the hash of each q-gram of a (padded) string, in order.
+
+        Each q-gram's hash is built up one character at a time, for all
+        q-grams at once, as h * B + (code point + 1) modulo 2 ** 64. As in
+        :py:meth:`_tokenize`, the q-grams that would extend beyond the end of
+        the string when skipping characters are truncated.
+
+        Parameters
+        ----------
+        padded : str
+            The (padded) string
+        qval : int
+            The q-gram length
+        skip : int
+            The number of characters to skip
+
+        Returns
+        -------
+        numpy.ndarray
+            The hashes (as uint64)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        codes = np.frombuffer(
+            padded.encode('utf-32-le', 'surrogatepass'), dtype='<u4'
+        ).astype(np.uint64) + np.uint64(1)
+        starts = np.arange(len(padded) - (qval - 1))
+        hashes = np.zeros(len(starts), dtype=np.uint64)
+        for k in range(qval):
+            positions = starts + k * (skip + 1)
+            if positions[-1] < len(codes):
+                hashes = hashes * _HASH_BASE + codes[positions]
+            else:
+                within = positions < len(codes)
+                hashes[within] = (
+                    hashes[within] * _HASH_BASE + codes[positions[within]]
+                )
+        return hashes
+
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokens = []  # type: List[str]
+        for qval_i, skip_i, padded in self._padded(string):
+            skip_i += 1
+            tokens += [
+                padded[i : i + (qval_i * skip_i) : skip_i]
+                for i in range(len(padded) - (qval_i - 1))
+            ]
+        return tokens
+
+    def _padded(self, string: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield each q & skip, with the string padded for q.
+
+        The string is padded once for each q, and only q & skip values which
+        yield any q-grams are included.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not string:
+            return
+
+        qvals = cast(
+            TIterable[int],
+            self.qval if isinstance(self.qval, Iterable) else (self.qval,),
+        )
+        skips = cast(
+            TIterable[int],
+            self.skip if isinstance(self.skip, Iterable) else (self.skip,),
+        )
+        for qval_i in qvals:
+            if qval_i < 1:
+                continue
+            if self.start_stop:
+                padded = (
+                    self.start_stop[0] * (qval_i - 1)
+                    + string
+                    + self.start_stop[-1] * (qval_i - 1)
+                )
+            else:
+                padded = string
+            if qval_i > 1 and len(padded) < qval_i:
+                continue
+            for skip_i in skips:
+                yield qval_i, skip_i, padded
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,9 +19,22 @@
 Q-Skipgrams multi-set class
 """
 
-from collections import Iterable
+from collections import Counter, Iterable, defaultdict
 from itertools import combinations
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from math import exp, log1p, log2
+from typing import (
+    Callable,
+    Counter as TCounter,
+    DefaultDict,
+    Dict,
+    Iterable as TIterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ._tokenizer import _Tokenizer
 
@@ -45,6 +58,7 @@ class QSkipgrams(_Tokenizer):
         start_stop: str = '$#',
         scaler: Optional[Union[str, Callable[[float], float]]] = None,
         ssk_lambda: Union[float, TIterable[float]] = 0.9,
+        hashed: bool = False,
     ) -> None:
         """Initialize QSkipgrams.
 
@@ -83,6 +97,12 @@ class QSkipgrams(_Tokenizer):
             characters according to the method described in :cite:`Lodhi:2002`.
             To supply multiple values of lambda, provide an Iterable of numeric
             values, such as (0.5, 0.05) or np.arange(0.05, 0.5, 0.05)
+        hashed : bool
+            If True, token distance measures with a crisp intersection compare
+            the tokens of strings as sorted arrays of 64-bit hashes (see
+            :py:meth:`_Tokenizer.tokenize_to_hashes`), rather than as Counters.
+            This is faster for strings longer than a few words, but slower for
+            single words.
 
         Raises
         ------
@@ -128,16 +148,19 @@ class QSkipgrams(_Tokenizer):
         value ``'SSK'``:
 
         >>> QSkipgrams(scaler='SSK').tokenize('AACTAGAAC')
-        QSkipgrams(, {'$A': 2.8883286990000006, '$C': 1.0047784401000002,
-        '$T': 0.5904900000000001, '$G': 0.4782969000000001,
-        '$#': 0.31381059609000006, 'AA': 6.170192010000001, 'AC': 4.486377699,
-        'AT': 1.3851, 'AG': 1.931931, 'A#': 2.6526399291000002, 'CT': 0.81,
-        'CA': 1.850931, 'CG': 0.6561, 'CC': 0.4782969000000001,
-        'C#': 1.2404672100000003, 'TA': 2.05659, 'TG': 0.7290000000000001,
-        'TC': 0.531441, 'T#': 0.4782969000000001, 'GA': 1.5390000000000001,
-        'GC': 0.6561, 'G#': 0.5904900000000001})
+        QSkipgrams(, {'$A': 2.888328699, '$C': 1.0047784401000002,
+        '$T': 0.5904900000000002, '$G': 0.47829690000000014,
+        '$#': 0.31381059609000017, 'AA': 6.170192010000001, 'AC': 4.486377699,
+        'AT': 1.3851, 'AG': 1.9319310000000003, 'A#': 2.6526399291000007,
+        'CT': 0.81, 'CA': 1.8509310000000003, 'CG': 0.6561000000000001,
+        'CC': 0.47829690000000014, 'C#': 1.24046721, 'TA': 2.05659,
+        'TG': 0.7290000000000001, 'TC': 0.5314410000000002,
+        'T#': 0.47829690000000014, 'GA': 1.539, 'GC': 0.6561000000000001,
+        'G#': 0.5904900000000002})
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added hashed parameter
 
         """
         super(QSkipgrams, self).__init__(scaler)
@@ -147,8 +170,8 @@ class QSkipgrams(_Tokenizer):
         self.start_stop = start_stop
         if qval == 1:
             self.start_stop = ''
+        self.hashed = hashed
 
-        self._string_ss = self._string
         if isinstance(ssk_lambda, float):
             self._lambda = (ssk_lambda,)  # type: TIterable[float]
         else:
@@ -167,52 +190,209 @@ class QSkipgrams(_Tokenizer):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            The totals of each token are computed as by
+            :py:meth:`tokenize_to_counter`
 
         """
         self._string = string
-        self._ordered_tokens = []
+        self._ordered_tokens = self._tokenize(string)
+        # The totals are computed by dynamic programming, not from the list,
+        # so the weight of each token in the list is not kept.
+        self._tokens = self._skipgram_totals(string)
         self._ordered_weights = []
+        return self
+
+    def tokenize_to_counter(self, string: str) -> TCounter[str]:
+        """Return the tokens of a string as a Counter object.
+
+        Unlike :py:meth:`tokenize`, this does not enumerate each skipgram:
+        the count (or SSK weight) of each distinct skipgram is computed by
+        dynamic programming, so its cost grows with the number of distinct
+        skipgrams, rather than the number of combinations of q characters.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens, as :py:meth:`get_counter` would return
+            after tokenizing string
+
+        Examples
+        --------
+        >>> QSkipgrams(qval=3, start_stop='').tokenize_to_counter('AATTAT')
+        Counter({'ATT': 6, 'AAT': 5, 'ATA': 4, 'TAT': 2, 'AAA': 1, 'TTA': 1,
+        'TTT': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        totals = self._skipgram_totals(string)
+        if self._scaler is None:
+            return Counter(totals)
+        return self._scale(totals)
+
+    def _skipgram_totals(self, string: str) -> DefaultDict[str, float]:
+        """Return the total (unscaled) weight of each distinct skipgram.
 
-        if not isinstance(self.qval, Iterable):
-            self.qval = (self.qval,)
+        .. versionadded:: 0.6.0
 
-        for qval_i in cast(TIterable[int], self.qval):
+        """
+        if self._scaler == 'SSK':
+            weights = defaultdict(float)  # type: DefaultDict[str, float]
+            for qval_i, padded in self._padded(string):
+                for lam in self._lambda:
+                    for token, weight in self._count_skipgrams(
+                        padded, qval_i, lam
+                    ).items():
+                        weights[token] += weight
+            return weights
+
+        counts = defaultdict(int)  # type: DefaultDict[str, float]
+        for qval_i, padded in self._padded(string):
+            for token, count in self._count_skipgrams(padded, qval_i).items():
+                counts[token] += count
+
+        if self._scaler == 'entropy':
+            n = sum(counts.values())
+            totals = defaultdict(float)  # type: DefaultDict[str, float]
+            totals.update(
+                {
+                    key: -(val / n) * log2(val / n)
+                    for key, val in counts.items()
+                }
+            )
+            return totals
+        if self._scaler in {'length', 'length-log', 'length-exp'}:
+            totals = defaultdict(float)
+            for key, val in counts.items():
+                weight = float(len(key))
+                if self._scaler == 'length-log':
+                    weight = log1p(weight)
+                elif self._scaler == 'length-exp':
+                    weight = exp(weight)
+                totals[key] = val * weight
+            return totals
+        return counts
+
+    @staticmethod
+    def _count_skipgrams(
+        padded: str, qval: int, lam: Optional[float] = None
+    ) -> Dict[str, float]:
+        """Return the count or SSK weight of each q-skipgram of a string.
+
+        A table of the (decayed) counts of each subsequence of length 1 to
+        q - 1 seen so far is extended by each character in turn. The skipgrams
+        are returned in the order of their first occurrence among the
+        combinations of q characters (i.e. of their leftmost positions).
+
+        Parameters
+        ----------
+        padded : str
+            The (padded) string
+        qval : int
+            The skipgram length
+        lam : float
+            The SSK lambda by which each gap is discounted, or None to count
+            each skipgram
+
+        Returns
+        -------
+        dict
+            The count or weight of each distinct skipgram
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # prefixes[k] holds the subsequences of length k, with their counts
+        # or the sum of lam ** (the distance from their first character)
+        prefixes = [
+            {} for _ in range(qval + 1)
+        ]  # type: List[Dict[str, float]]
+        prefixes[0][''] = 1
+        # the leftmost positions of each subsequence's characters, as the
+        # digits of an integer, for the order of their first occurrence
+        ranks = [{} for _ in range(qval + 1)]  # type: List[Dict[str, int]]
+        ranks[0][''] = 0
+        base = len(padded)
+        for pos, char in enumerate(padded):
+            if lam is not None:
+                for k in range(1, qval):
+                    for prefix in prefixes[k]:
+                        prefixes[k][prefix] *= lam
+            for k in range(qval, 0, -1):
+                extended = prefixes[k]
+                for prefix, value in prefixes[k - 1].items():
+                    key = prefix + char
+                    if key in extended:
+                        extended[key] += value
+                    else:
+                        # this is the leftmost occurrence of key
+                        extended[key] = value
+                        ranks[k][key] = ranks[k - 1][prefix] * base + pos
+
+        skipgrams = sorted(prefixes[qval], key=ranks[qval].__getitem__)
+        if lam is not None:
+            scale = lam ** (qval - 1)
+            return {key: prefixes[qval][key] * scale for key in skipgrams}
+        return {key: prefixes[qval][key] for key in skipgrams}
+
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [
+            ''.join(char for _, char in t)
+            for combs in self._combinations(string)
+            for t in combs
+        ]
+
+    def _combinations(
+        self, string: str
+    ) -> Iterator[Iterator[Tuple[Tuple[int, str], ...]]]:
+        """Yield the combinations of (position, character) for each q.
+
+        .. versionadded:: 0.6.0
+
+        """
+        for qval_i, padded in self._padded(string):
+            yield combinations(enumerate(padded), qval_i)
+
+    def _padded(self, string: str) -> Iterator[Tuple[int, str]]:
+        """Yield each q & the string padded for it, if it has any skipgrams.
+
+        .. versionadded:: 0.6.0
+
+        """
+        qvals = cast(
+            TIterable[int],
+            self.qval if isinstance(self.qval, Iterable) else (self.qval,),
+        )
+        for qval_i in qvals:
             if qval_i < 1:
                 continue
 
-            if self.start_stop and self._string:
-                string = (
+            if self.start_stop and string:
+                padded = (
                     self.start_stop[0] * (qval_i - 1)
-                    + self._string
+                    + string
                     + self.start_stop[-1] * (qval_i - 1)
                 )
             else:
-                string = self._string
+                padded = string
 
-            if len(string) < qval_i:
+            if len(padded) < qval_i:
                 continue
 
-            # Having appended start & stop symbols (or not), save the
-            # result, but only for the longest valid qval_i
-            if len(string) > len(self._string_ss):
-                self._string_ss = string
-
-            combs = list(combinations(enumerate(string), qval_i))
-            self._ordered_tokens += [''.join(l[1] for l in t) for t in combs]
-
-            if self._scaler == 'SSK':
-                self._ordered_weights += [
-                    sum(
-                        l ** (t[-1][0] - t[0][0] + len(t) - 1)
-                        for l in self._lambda
-                    )
-                    for t in combs
-                ]
-            else:
-                self._ordered_weights += [1] * len(combs)
-
-        self._scale_and_counterize()
-        return self
+            yield qval_i, padded
 
 
 if __name__ == '__main__':
@@ -20,7 +20,7 @@ Regexp tokenizer
 """
 import re
 
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -95,11 +95,17 @@ class RegexpTokenizer(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
-        self._ordered_tokens = self._regexp.findall(self._string)
-        self._scale_and_counterize()
+        super().tokenize(string)
         return self
 
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._regexp.findall(string)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,7 +19,7 @@
 SAPS class
 """
 
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -84,15 +84,22 @@ class SAPSTokenizer(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
+        super().tokenize(string)
+        return self
+
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
 
-        self._ordered_tokens = []
+        """
+        tokens = []  # type: List[str]
 
         _vowels = set('aeiouyAEIOUY')
 
-        words = self._string.split()
+        words = string.split()
         for w in words:
-            self._ordered_tokens = []
+            tokens = []
             i = 0
             while i < len(w):
                 syll = w[i : i + 1]
@@ -110,10 +117,8 @@ class SAPSTokenizer(_Tokenizer):
                 ):
                     syll += w[i : i + 1]
                     i += 1
-                self._ordered_tokens.append(syll)
-
-        self._scale_and_counterize()
-        return self
+                tokens.append(syll)
+        return tokens
 
 
 if __name__ == '__main__':
@@ -19,7 +19,8 @@
 SonoriPy class
 """
 
-from typing import Callable, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -38,7 +39,9 @@ class SonoriPyTokenizer(_Tokenizer):
     """
 
     def __init__(
-        self, scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        self,
+        scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        cache_size: int = 65536,
     ) -> None:
         """Initialize Tokenizer.
 
@@ -58,9 +61,14 @@ class SonoriPyTokenizer(_Tokenizer):
                   in the Counter. Some useful functions include math.exp,
                   math.log1p, math.sqrt, and indexes into interesting integer
                   sequences such as the Fibonacci sequence.
+        cache_size : int
+            The number of words whose syllables are cached. The least recently
+            used are dropped first. If 0, nothing is cached.
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size parameter
 
         """
         if SonoriPy is None:
@@ -71,6 +79,32 @@ class SonoriPyTokenizer(_Tokenizer):
 
         super(SonoriPyTokenizer, self).__init__(scaler)
 
+        self._cache_size = cache_size
+        self._syllabify = lru_cache(maxsize=cache_size)(
+            self._syllabify_word
+        )  # type: Callable[[str], Tuple[str, ...]]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state of the instance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_syllabify']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the instance from its pickled state.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._syllabify = lru_cache(maxsize=self._cache_size)(
+            self._syllabify_word
+        )
+
     def tokenize(self, string: str) -> 'SonoriPyTokenizer':
         """Tokenize the term and store it.
 
@@ -94,16 +128,29 @@ class SonoriPyTokenizer(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
+        super().tokenize(string)
+        return self
+
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
 
-        self._ordered_tokens = []
+        .. versionadded:: 0.6.0
+
+        """
+        tokens = []  # type: List[str]
         for word in string.split():
-            self._ordered_tokens += SonoriPy(word)
-        if not self._ordered_tokens:
-            self._ordered_tokens = [self._string]
+            tokens += self._syllabify(word)
+        if not tokens:
+            tokens = [string]
+        return tokens
 
-        self._scale_and_counterize()
-        return self
+    def _syllabify_word(self, word: str) -> Tuple[str, ...]:
+        """Return the syllables of a word.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return tuple(SonoriPy(word))
 
 
 if __name__ == '__main__':
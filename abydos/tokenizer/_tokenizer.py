@@ -20,22 +20,57 @@ _Tokenizer base class
 """
 
 from collections import Counter, defaultdict
+from hashlib import blake2b
 from math import exp, log1p, log2
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
     DefaultDict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
 
+import numpy as np
+
 __all__ = ['_Tokenizer']
 
 
+def _hash_tokens(tokens: Iterable[str]) -> np.ndarray:
+    """Return a 64-bit hash of each token.
+
+    Parameters
+    ----------
+    tokens : Iterable[str]
+        The tokens to hash
+
+    Returns
+    -------
+    numpy.ndarray
+        The hashes of the tokens
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    hashes = np.frombuffer(
+        b''.join(
+            blake2b(tok.encode('utf-8'), digest_size=8).digest()
+            for tok in tokens
+        ),
+        dtype='<u8',
+    ).astype(
+        np.uint64
+    )  # type: np.ndarray
+    return hashes
+
+
 class _Tokenizer:
     """Abstract _Tokenizer class.
 
@@ -97,54 +132,251 @@ class _Tokenizer:
         .. versionchanged:: 0.4.1
             Added 'length', 'entropy', and related scalers
         .. versionchanged:: 0.6.0
-            Moved scaling & counterizing to separate function
+            Moved tokenizing, scaling & counterizing to separate functions
 
         """
         self._string = string
-        self._ordered_tokens = [self._string]
-        self._ordered_weights = [1]
-
-        self._scale_and_counterize()
+        self._ordered_tokens, weights = self._tokenize_weighted(string)
+        self._tokens, self._ordered_weights = self._counterize(
+            self._ordered_tokens, weights
+        )
         return self
 
-    def _scale_and_counterize(self) -> None:
-        """Scale the tokens and store them in a defaultdict.
+    def tokenize_to_counter(self, string: str) -> TCounter[str]:
+        """Return the tokens of a string as a Counter object.
+
+        Unlike :py:meth:`tokenize`, this does not store anything on the
+        tokenizer, so a single tokenizer may be used by several threads at
+        once.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens, as :py:meth:`get_counter` would return
+            after tokenizing string
+
+        Examples
+        --------
+        >>> _Tokenizer().tokenize_to_counter('term')
+        Counter({'term': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokens, weights = self._tokenize_weighted(string)
+        if self._scaler is None:
+            return Counter(tokens)
+        return self._scale(self._counterize(tokens, weights)[0])
+
+    def tokenize_to_list(self, string: str) -> List[str]:
+        """Return the tokens of a string as an ordered list.
+
+        Unlike :py:meth:`tokenize`, this does not store anything on the
+        tokenizer.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        list
+            The list of tokens, as :py:meth:`get_list` would return after
+            tokenizing string
+
+        Examples
+        --------
+        >>> _Tokenizer().tokenize_to_list('term')
+        ['term']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tokenize(string)
+
+    def tokenize_many(self, strings: Iterable[str]) -> Iterator[TCounter[str]]:
+        """Yield the tokens of each of a collection of strings.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings to tokenize
+
+        Yields
+        ------
+        Counter
+            The Counter of tokens of each string, in order
+
+        Examples
+        --------
+        >>> list(_Tokenizer().tokenize_many(['term', 'word']))
+        [Counter({'term': 1}), Counter({'word': 1})]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for string in strings:
+            yield self.tokenize_to_counter(string)
+
+    def tokenize_to_hashes(self, string: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the tokens of a string as sorted 64-bit hashes & counts.
+
+        Each distinct token is represented by a 64-bit hash of its UTF-8
+        encoding, which is stable across processes. This is more compact than
+        a Counter, and two such profiles can be compared with NumPy's sorted
+        array set operations (e.g. numpy.intersect1d). Distinct tokens are
+        assumed to have distinct hashes.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        tuple
+            The hashes of the distinct tokens, in ascending order (as uint64),
+            and the count (or scaled weight) of each, as
+            :py:meth:`tokenize_to_counter` would return them (as int64 if
+            they are all ints, otherwise as float)
+
+        Examples
+        --------
+        >>> hashes, counts = _Tokenizer().tokenize_to_hashes('term')
+        >>> hashes.dtype, counts
+        (dtype('uint64'), array([1]))
+
 
         .. versionadded:: 0.6.0
 
         """
+        counter = self.tokenize_to_counter(string)
+        hashes = _hash_tokens(counter.keys())
+        counts = np.fromiter(
+            counter.values(),
+            dtype=np.int64
+            if all(isinstance(count, int) for count in counter.values())
+            else np.float_,
+            count=len(counter),
+        )
+        order = np.argsort(hashes)
+        return hashes[order], counts[order]
+
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        Subclasses override this to define their tokens. It must not store
+        anything on the tokenizer.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        list
+            The tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [string]
+
+    def _tokenize_weighted(
+        self, string: str
+    ) -> Tuple[List[str], Optional[List[float]]]:
+        """Return the tokens of a string & their weights, in order.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        tuple
+            The tokens, and their weights (or None if each has weight 1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tokenize(string), None
+
+    def _counterize(
+        self, tokens: List[str], weights: Optional[List[float]]
+    ) -> Tuple[DefaultDict[str, float], List[float]]:
+        """Return the scaled token weights and their totals for each token.
+
+        Parameters
+        ----------
+        tokens : list
+            The tokens, in order
+        weights : list or None
+            The weight of each token (or None if each has weight 1)
+
+        Returns
+        -------
+        tuple
+            The total of each token's weights, and the (scaled) weight of each
+            token
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if weights is None:
+            weights = [1] * len(tokens)
+        totals = defaultdict(float)  # type: DefaultDict[str, float]
         if self._scaler in {'SSK', 'length', 'length-log', 'length-exp'}:
-            self._tokens = defaultdict(float)
             if cast(str, self._scaler)[:6] == 'length':
-                self._ordered_weights = [len(_) for _ in self._ordered_tokens]
+                weights = [len(_) for _ in tokens]
                 if self._scaler == 'length-log':
-                    self._ordered_weights = [
-                        log1p(_) for _ in self._ordered_weights
-                    ]
+                    weights = [log1p(_) for _ in weights]
                 elif self._scaler == 'length-exp':
-                    self._ordered_weights = [
-                        exp(_) for _ in self._ordered_weights
-                    ]
-            for token, weight in zip(
-                self._ordered_tokens, self._ordered_weights
-            ):
-                self._tokens[token] += weight
+                    weights = [exp(_) for _ in weights]
+            for token, weight in zip(tokens, weights):
+                totals[token] += weight
         elif self._scaler == 'entropy':
-            counts = Counter(self._ordered_tokens)
-            n = len(self._ordered_tokens)
-            self._tokens = defaultdict(float)
-            self._tokens.update(
+            counts = Counter(tokens)
+            n = len(tokens)
+            totals.update(
                 {
                     key: -(val / n) * log2(val / n)
                     for key, val in counts.items()
                 }
             )
-            self._ordered_weights = [
-                self._tokens[tok] / counts[tok] for tok in self._ordered_tokens
-            ]
+            weights = [totals[tok] / counts[tok] for tok in tokens]
+        else:
+            totals = defaultdict(int)
+            totals.update(Counter(tokens))
+        return totals, weights
+
+    def _scale(self, totals: DefaultDict[str, float]) -> TCounter[str]:
+        """Return the token totals, scaled, as a Counter object.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler == 'set':
+            return Counter({key: 1 for key in totals.keys()})
+        elif callable(self._scaler):
+            return Counter(
+                {key: self._scaler(val) for key, val in totals.items()}
+            )
         else:
-            self._tokens = defaultdict(int)
-            self._tokens.update(Counter(self._ordered_tokens))
+            return Counter(totals)
 
     def count(self) -> int:
         """Return token count.
@@ -204,14 +436,7 @@ class _Tokenizer:
         .. versionadded:: 0.4.0
 
         """
-        if self._scaler == 'set':
-            return Counter({key: 1 for key in self._tokens.keys()})
-        elif callable(self._scaler):
-            return Counter(
-                {key: self._scaler(val) for key, val in self._tokens.items()}
-            )
-        else:
-            return Counter(self._tokens)
+        return self._scale(self._tokens)
 
     def get_set(self) -> Set[str]:
         """Return the unique tokens as a set.
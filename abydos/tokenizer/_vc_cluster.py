@@ -28,7 +28,7 @@ to vowel transition marks the start of a new token.
 import re
 import unicodedata
 
-from typing import Callable, Optional, Set, Union
+from typing import Callable, List, Optional, Set, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -109,15 +109,23 @@ class VCClusterTokenizer(_Tokenizer):
         .. versionadded:: 0.4.0
 
         """
-        self._string = string
-        self._ordered_tokens = []
-        token_list = self._regexp.findall(self._string)
+        super().tokenize(string)
+        return self
+
+    def _tokenize(self, string: str) -> List[str]:
+        """Return the tokens of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokens = []  # type: List[str]
+        token_list = self._regexp.findall(string)
         for token in token_list:
             if (
                 token[0] not in self._consonants
                 and token[0] not in self._vowels
             ):
-                self._ordered_tokens.append(token)
+                tokens.append(token)
             else:
                 token = unicodedata.normalize('NFD', token)
                 mode = 0  # 0 = starting mode, 1 = cons, 2 = vowels
@@ -128,7 +136,7 @@ class VCClusterTokenizer(_Tokenizer):
                         mode = 1
                     elif char in self._vowels:
                         if mode == 1:
-                            self._ordered_tokens.append(new_token)
+                            tokens.append(new_token)
                             new_token = char
                         else:
                             new_token += char
@@ -136,14 +144,10 @@ class VCClusterTokenizer(_Tokenizer):
                     else:  # This should cover combining marks, marks, etc.
                         new_token += char
 
-                self._ordered_tokens.append(new_token)
+                tokens.append(new_token)
 
-        self._ordered_tokens = [
-            unicodedata.normalize('NFC', token)
-            for token in self._ordered_tokens
-        ]
-        self._scale_and_counterize()
-        return self
+        tokens = [unicodedata.normalize('NFC', token) for token in tokens]
+        return tokens
 
 
 if __name__ == '__main__':
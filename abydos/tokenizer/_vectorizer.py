@@ -0,0 +1,636 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._vectorizer.
+
+Vectorizer & TokenMatrix classes
+"""
+
+import os
+from array import array
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ._q_grams import QGrams
+from ._tokenizer import _Tokenizer
+
+__all__ = ['TokenMatrix', 'Vectorizer']
+
+
+class TokenMatrix:
+    """A matrix of token weights, in compressed sparse row (CSR) form.
+
+    Each row holds the tokens of a string, and each column corresponds to a
+    token in the vocabulary of the :py:class:`Vectorizer` that produced the
+    matrix. As in other CSR matrices, the columns & weights of the tokens of
+    row i are indices[indptr[i]:indptr[i+1]] & data[indptr[i]:indptr[i+1]].
+
+    The pairwise intersections, unions, & dot products of the rows of two
+    matrices (from the same Vectorizer) are computed without tokenizing any
+    string again.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        n_cols: int,
+    ) -> None:
+        """Initialize TokenMatrix instance.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The weight of each token
+        indices : numpy.ndarray
+            The column of each token
+        indptr : numpy.ndarray
+            The start of each row in data & indices, followed by the number of
+            tokens
+        n_cols : int
+            The number of columns (i.e. the size of the vocabulary)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = (len(indptr) - 1, n_cols)
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.shape[0]
+
+    def __getitem__(self, rows: slice) -> 'TokenMatrix':
+        """Return a block of consecutive rows as a TokenMatrix.
+
+        The block shares the arrays of this matrix, so that, e.g., a large
+        comparison may be made block by block.
+
+        .. versionadded:: 0.6.0
+
+        """
+        start, stop, step = rows.indices(len(self))
+        if step != 1:
+            raise ValueError('Only blocks of consecutive rows are supported.')
+        stop = max(start, stop)
+        first, last = self.indptr[start], self.indptr[stop]
+        return TokenMatrix(
+            self.data[first:last],
+            self.indices[first:last],
+            self.indptr[start : stop + 1] - first,
+            self.shape[1],
+        )
+
+    def row_sums(self) -> np.ndarray:
+        """Return the total (absolute) weight of the tokens in each row.
+
+        Returns
+        -------
+        numpy.ndarray
+            The cardinality of each row
+
+        Examples
+        --------
+        >>> vec = Vectorizer()
+        >>> vec.fit_transform(['Niall', 'Neil', '']).row_sums()
+        array([6., 5., 0.])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.bincount(  # type: ignore
+            self._row_numbers(),
+            weights=np.abs(self.data),
+            minlength=len(self),
+        )
+
+    def dot(self, other: Optional['TokenMatrix'] = None) -> np.ndarray:
+        """Return the dot products of the rows of two matrices.
+
+        Parameters
+        ----------
+        other : TokenMatrix
+            A matrix from the same Vectorizer (or None to use this matrix)
+
+        Returns
+        -------
+        numpy.ndarray
+            A len(self) by len(other) matrix of the sum of the products of the
+            weights of each token in each pair of rows
+
+        Examples
+        --------
+        >>> vec = Vectorizer()
+        >>> vec.fit_transform(['Niall', 'Neil']).dot()
+        array([[6., 2.],
+               [2., 5.]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._pairwise(other, np.multiply)
+
+    def intersection(
+        self, other: Optional['TokenMatrix'] = None
+    ) -> np.ndarray:
+        """Return the cardinalities of the intersections of rows.
+
+        As in the intersection of two Counters, the weight of each token in
+        the intersection is the (positive) minimum of its weights in the two
+        rows.
+
+        Parameters
+        ----------
+        other : TokenMatrix
+            A matrix from the same Vectorizer (or None to use this matrix)
+
+        Returns
+        -------
+        numpy.ndarray
+            A len(self) by len(other) matrix of the cardinality of the
+            intersection of each pair of rows
+
+        Examples
+        --------
+        >>> vec = Vectorizer()
+        >>> names = vec.fit_transform(['Niall', 'Neil', 'Nigel'])
+        >>> names.intersection()
+        array([[6., 2., 3.],
+               [2., 5., 2.],
+               [3., 2., 6.]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._pairwise(other, _positive_minimum)
+
+    def union(self, other: Optional['TokenMatrix'] = None) -> np.ndarray:
+        """Return the cardinalities of the unions of rows.
+
+        The weights of tokens are assumed to be positive, as counts are.
+
+        Parameters
+        ----------
+        other : TokenMatrix
+            A matrix from the same Vectorizer (or None to use this matrix)
+
+        Returns
+        -------
+        numpy.ndarray
+            A len(self) by len(other) matrix of the cardinality of the union of
+            each pair of rows
+
+        Examples
+        --------
+        >>> vec = Vectorizer()
+        >>> names = vec.fit_transform(['Niall', 'Neil', 'Nigel'])
+        >>> names.intersection() / names.union()
+        array([[1.        , 0.22222222, 0.33333333],
+               [0.22222222, 1.        , 0.22222222],
+               [0.33333333, 0.22222222, 1.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if other is None:
+            other = self
+        return (  # type: ignore
+            self.row_sums()[:, np.newaxis]
+            + other.row_sums()
+            - self.intersection(other)
+        )
+
+    def save(self, path: str) -> None:
+        """Save the matrix to a directory.
+
+        The token columns & weights are saved as raw arrays, so that
+        :py:meth:`load` can map them into memory.
+
+        Parameters
+        ----------
+        path : str
+            The directory to save to, which is created if needed
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, 'indices.bin'), 'wb') as indices:
+            np.asarray(self.indices, dtype=np.int64).tofile(indices)
+        with open(os.path.join(path, 'data.bin'), 'wb') as data:
+            np.asarray(self.data, dtype=np.float_).tofile(data)
+        _save_indptr(path, self.indptr, self.shape[1])
+
+    @staticmethod
+    def load(path: str) -> 'TokenMatrix':
+        """Return a matrix saved to a directory, mapped into memory.
+
+        Parameters
+        ----------
+        path : str
+            The directory the matrix was saved to
+
+        Returns
+        -------
+        TokenMatrix
+            The matrix, whose token columns & weights are read-only
+            memory-mapped arrays
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        indptr = np.load(os.path.join(path, 'indptr.npy'))
+        n_cols = int(np.load(os.path.join(path, 'n_cols.npy')))
+        size = int(indptr[-1])
+        if not size:
+            # an empty file cannot be mapped
+            return TokenMatrix(
+                np.zeros(0, dtype=np.float_),
+                np.zeros(0, dtype=np.int64),
+                indptr,
+                n_cols,
+            )
+        return TokenMatrix(
+            np.memmap(
+                os.path.join(path, 'data.bin'),
+                dtype=np.float_,
+                mode='r',
+                shape=(size,),
+            ),
+            np.memmap(
+                os.path.join(path, 'indices.bin'),
+                dtype=np.int64,
+                mode='r',
+                shape=(size,),
+            ),
+            indptr,
+            n_cols,
+        )
+
+    def _row_numbers(self) -> np.ndarray:
+        """Return the row of each token.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.repeat(  # type: ignore
+            np.arange(len(self)), np.diff(self.indptr)
+        )
+
+    def _pairwise(
+        self,
+        other: Optional['TokenMatrix'],
+        func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """Return the sums over shared tokens of a function of their weights.
+
+        Parameters
+        ----------
+        other : TokenMatrix
+            A matrix from the same Vectorizer (or None to use this matrix)
+        func : Callable
+            A function of two arrays of weights, applied elementwise
+
+        Returns
+        -------
+        numpy.ndarray
+            A len(self) by len(other) matrix of the sum, over the tokens each
+            pair of rows shares, of func of their weights
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if other is None:
+            other = self
+
+        # Sort the tokens of other by column (i.e. into CSC form), so that
+        # the rows containing any column can be found.
+        n_cols = max(self.shape[1], other.shape[1])
+        order = np.argsort(other.indices, kind='stable')
+        col_rows = other._row_numbers()[order]
+        col_data = np.asarray(other.data)[order]
+        col_ptr = np.zeros(n_cols + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(other.indices, minlength=n_cols), out=col_ptr[1:]
+        )
+
+        result = np.zeros((len(self), len(other)), dtype=np.float_)
+        for row in range(len(self)):
+            first, last = self.indptr[row], self.indptr[row + 1]
+            cols = self.indices[first:last]
+            starts = col_ptr[cols]
+            counts = col_ptr[cols + 1] - starts
+            total = counts.sum()
+            if not total:
+                continue
+            # The positions, in col_rows & col_data, of the tokens of other
+            # that share a column with each token of this row
+            ends = np.cumsum(counts)
+            positions = np.repeat(starts - ends + counts, counts) + np.arange(
+                total
+            )
+            result[row] = np.bincount(
+                col_rows[positions],
+                weights=func(
+                    np.repeat(self.data[first:last], counts),
+                    col_data[positions],
+                ),
+                minlength=len(other),
+            )
+        return result
+
+
+def _positive_minimum(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Return the elementwise minimum of two arrays, or 0 if it is negative.
+
+    .. versionadded:: 0.6.0
+
+    """
+    return np.maximum(np.minimum(x, y), 0)  # type: ignore
+
+
+def _save_indptr(path: str, indptr: Any, n_cols: int) -> None:
+    """Save the row starts & the number of columns of a matrix.
+
+    .. versionadded:: 0.6.0
+
+    """
+    np.save(os.path.join(path, 'indptr.npy'), np.asarray(indptr, np.int64))
+    np.save(os.path.join(path, 'n_cols.npy'), np.int64(n_cols))
+
+
+class Vectorizer:
+    """Vectorizer.
+
+    A vectorizer turns a collection of strings into a :py:class:`TokenMatrix`,
+    with a row for each string and a column for each token in its vocabulary.
+    The tokens of each string are counted (and scaled) by a tokenizer from
+    the :py:mod:`abydos.tokenizer` package, once per string.
+
+    .. versionadded:: 0.6.0
+    """
+
+    # The number of tokens written to a memory-mapped matrix at a time
+    _chunk_size = 1 << 16
+
+    def __init__(self, tokenizer: Optional[_Tokenizer] = None) -> None:
+        """Initialize Vectorizer instance.
+
+        Parameters
+        ----------
+        tokenizer : _Tokenizer
+            A tokenizer instance from the :py:mod:`abydos.tokenizer` package
+            (by default, QGrams with q=2), whose scaler (e.g. 'set', 'length',
+            'entropy', or a function) determines the weight of each token
+
+        Examples
+        --------
+        >>> vec = Vectorizer(QGrams(qval=3, scaler='set'))
+        >>> vec.vocabulary
+        {}
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.tokenizer = tokenizer if tokenizer is not None else QGrams()
+        self.vocabulary = {}  # type: Dict[str, int]
+
+    def fit(self, strings: Iterable[str]) -> 'Vectorizer':
+        """Set the vocabulary to the tokens of a collection of strings.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings whose tokens make up the vocabulary
+
+        Returns
+        -------
+        Vectorizer
+            The vectorizer itself
+
+        Examples
+        --------
+        >>> Vectorizer().fit(['Niall', 'Neil']).vocabulary
+        {'$N': 0, 'Ni': 1, 'ia': 2, 'al': 3, 'll': 4, 'l#': 5, 'Ne': 6, 'ei': 7,
+        'il': 8}
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.vocabulary = {}
+        return self.partial_fit(strings)
+
+    def partial_fit(self, strings: Iterable[str]) -> 'Vectorizer':
+        """Add the tokens of a collection of strings to the vocabulary.
+
+        Tokens already in the vocabulary keep their columns, so matrices
+        produced before and after a call remain comparable.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings whose tokens are added to the vocabulary
+
+        Returns
+        -------
+        Vectorizer
+            The vectorizer itself
+
+        Examples
+        --------
+        >>> vec = Vectorizer().fit(['Niall'])
+        >>> len(vec.partial_fit(['Neil']).vocabulary)
+        9
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vocabulary = self.vocabulary
+        for string in strings:
+            for token in self.tokenizer.tokenize_to_counter(string):
+                if token not in vocabulary:
+                    vocabulary[token] = len(vocabulary)
+        return self
+
+    def transform(
+        self, strings: Iterable[str], path: Optional[str] = None
+    ) -> TokenMatrix:
+        """Return the token matrix of a collection of strings.
+
+        Tokens that are not in the vocabulary are ignored, so every string
+        that will be compared should be included in fitting.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings to vectorize
+        path : str
+            If supplied, the matrix is written to this directory as it is
+            built, and the returned matrix maps it into memory (see
+            :py:meth:`TokenMatrix.load`)
+
+        Returns
+        -------
+        TokenMatrix
+            A matrix with a row for each string
+
+        Examples
+        --------
+        >>> vec = Vectorizer().fit(['Niall'])
+        >>> mat = vec.transform(['Niall', 'Neil'])
+        >>> mat.shape
+        (2, 6)
+        >>> mat.row_sums()
+        array([6., 2.])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._vectorize(strings, False, path)
+
+    def fit_transform(
+        self, strings: Iterable[str], path: Optional[str] = None
+    ) -> TokenMatrix:
+        """Set the vocabulary & return the token matrix of a collection.
+
+        This tokenizes each string only once.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings to vectorize
+        path : str
+            If supplied, the matrix is written to this directory as it is
+            built, and the returned matrix maps it into memory (see
+            :py:meth:`TokenMatrix.load`)
+
+        Returns
+        -------
+        TokenMatrix
+            A matrix with a row for each string
+
+        Examples
+        --------
+        >>> vec = Vectorizer()
+        >>> vec.fit_transform(['Niall', 'Neil']).shape
+        (2, 9)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.vocabulary = {}
+        return self._vectorize(strings, True, path)
+
+    def _vectorize(
+        self, strings: Iterable[str], extend: bool, path: Optional[str]
+    ) -> TokenMatrix:
+        """Return the token matrix of a collection of strings.
+
+        Parameters
+        ----------
+        strings : Iterable[str]
+            The strings to vectorize
+        extend : bool
+            If True, tokens not in the vocabulary are added to it
+        path : str
+            The directory to write the matrix to, or None
+
+        Returns
+        -------
+        TokenMatrix
+            A matrix with a row for each string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vocabulary = self.vocabulary
+        indptr = array('q', [0])
+        indices = array('q')
+        data = array('d')
+        files = None  # type: Optional[Tuple[BinaryIO, BinaryIO]]
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            files = (
+                open(os.path.join(path, 'indices.bin'), 'wb'),
+                open(os.path.join(path, 'data.bin'), 'wb'),
+            )
+
+        try:
+            written = 0
+            for string in strings:
+                for token, weight in self.tokenizer.tokenize_to_counter(
+                    string
+                ).items():
+                    if token not in vocabulary:
+                        if not extend:
+                            continue
+                        vocabulary[token] = len(vocabulary)
+                    indices.append(vocabulary[token])
+                    data.append(weight)
+                indptr.append(written + len(indices))
+                if files is not None and len(indices) >= self._chunk_size:
+                    written += len(indices)
+                    indices.tofile(files[0])
+                    data.tofile(files[1])
+                    del indices[:]
+                    del data[:]
+            if files is not None:
+                indices.tofile(files[0])
+                data.tofile(files[1])
+        finally:
+            if files is not None:
+                files[0].close()
+                files[1].close()
+
+        if path is not None:
+            _save_indptr(path, indptr, len(vocabulary))
+            return TokenMatrix.load(path)
+        return TokenMatrix(
+            np.array(data, dtype=np.float_),
+            np.array(indices, dtype=np.int64),
+            np.array(indptr, dtype=np.int64),
+            len(vocabulary),
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
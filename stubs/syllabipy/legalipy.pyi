@@ -1,8 +1,8 @@
 # Stubs for syllabipy.legalipy (Python 3)
 
-from typing import List
+from typing import Collection, List
 
-def LegaliPy(word: str, onsets: List[str]) -> List[str]: ...
+def LegaliPy(word: str, onsets: Collection[str]) -> List[str]: ...
 def getOnsets(
     text: str, threshold: float = 0.0002, clean: bool = True
 ) -> List[str]: ...
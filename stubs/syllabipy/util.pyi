@@ -0,0 +1,3 @@
+# Stubs for syllabipy.util (Python 3)
+
+def cleantext(text: str) -> str: ...
@@ -0,0 +1,112 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.benchmark.bench_import.
+
+This module benchmarks the time taken to import parts of Abydos.
+
+Each import is timed in a fresh interpreter. The ``eager`` cases import every
+member of a package, which is what importing the package did before its
+members were loaded lazily.
+"""
+
+import argparse
+import json
+import subprocess  # noqa: S404
+import sys
+from statistics import median
+
+IMPORTS = {
+    'distance': 'import abydos.distance',
+    'distance.Levenshtein': 'from abydos.distance import Levenshtein',
+    'distance.Jaccard': 'from abydos.distance import Jaccard',
+    'distance (eager)': 'import abydos.distance as pkg\n'
+    'for name in pkg.__all__:\n'
+    '    getattr(pkg, name)',
+    'phonetic': 'import abydos.phonetic',
+    'phonetic.Soundex': 'from abydos.phonetic import Soundex',
+    'phonetic.BeiderMorse': 'from abydos.phonetic import BeiderMorse',
+    'phonetic (eager)': 'import abydos.phonetic as pkg\n'
+    'for name in pkg.__all__:\n'
+    '    getattr(pkg, name)',
+}
+
+_TIMER = '''
+from time import perf_counter
+start = perf_counter()
+{}
+print(perf_counter() - start)
+'''
+
+
+def time_import(statement, repeat=5):
+    """Return the times taken by statement, each in a fresh interpreter.
+
+    Parameters
+    ----------
+    statement : str
+        The import statement(s) to time
+    repeat : int
+        The number of interpreters in which to time the statement
+
+    Returns
+    -------
+    list of float
+        The times, in seconds
+
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output(  # noqa: S603
+            [sys.executable, '-c', _TIMER.format(statement)]
+        )
+        times.append(float(output.decode('utf-8').strip()))
+    return times
+
+
+def main(argv=None):
+    """Run the import benchmarks and report the results.
+
+    Parameters
+    ----------
+    argv : list of str
+        Command line arguments
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='interpreters per import'
+    )
+    parser.add_argument('--json', help='write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, statement in IMPORTS.items():
+        times = time_import(statement, args.repeat)
+        results[name] = {'min': min(times), 'median': median(times)}
+        print(
+            '{:<24} min {:8.2f} ms   median {:8.2f} ms'.format(
+                name, min(times) * 1000, median(times) * 1000
+            )
+        )
+
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump(results, json_file, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
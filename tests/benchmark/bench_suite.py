@@ -0,0 +1,573 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.benchmark.bench_suite.
+
+This module benchmarks the public classes of the distance, phonetic, stemmer,
+fingerprint, & tokenizer packages.
+
+Each class is instantiated with its default parameters and timed on inputs
+drawn from the test corpora at several input sizes & string lengths:
+
+    - distance measures compute ``dist`` on pairs from
+      wikipediaCommonMisspellings.csv (misspelling & correction) and on pairs
+      of names from nachnamen.csv & uscensus2000.bm.cc.csv
+    - phonetic algorithms ``encode`` names from nachnamen.csv &
+      uscensus2000.bm.cc.csv
+    - stemmers ``stem`` words from the snowball_*.csv corpus for their
+      language (English words from snowball_porter.csv otherwise)
+    - fingerprints ``fingerprint`` & tokenizers ``tokenize`` words from
+      snowball_porter.csv
+
+For the ``natural`` string length, corpus entries are used as they are. For a
+numeric string length, consecutive entries are joined with spaces and cut to
+that length.
+
+Results are written as JSON, which can be compared with the results of
+another run, e.g.:
+
+    python -m tests.benchmark.bench_suite --output before.json
+    (make changes)
+    python -m tests.benchmark.bench_suite --output after.json \
+        --compare before.json
+"""
+
+import argparse
+import codecs
+import inspect
+import json
+import platform
+import re
+import subprocess  # noqa: S404
+import sys
+from datetime import datetime
+from importlib import import_module
+from time import perf_counter
+
+import abydos
+
+from .. import _corpus_file
+
+PACKAGES = ('distance', 'phonetic', 'stemmer', 'fingerprint', 'tokenizer')
+
+# The method timed for each package
+METHODS = {
+    'distance': 'dist',
+    'phonetic': 'encode',
+    'stemmer': 'stem',
+    'fingerprint': 'fingerprint',
+    'tokenizer': 'tokenize',
+}
+
+# The snowball_*.csv corpus used for each language-specific stemmer
+STEMMER_CORPORA = {
+    'Porter': 'snowball_porter.csv',
+    'Porter2': 'snowball_porter2.csv',
+    'Lovins': 'snowball_lovins.csv',
+    'Schinke': 'snowball_schinke.csv',
+    'SnowballDanish': 'snowball_danish.csv',
+    'SnowballDutch': 'snowball_dutch.csv',
+    'SnowballGerman': 'snowball_german.csv',
+    'SnowballNorwegian': 'snowball_norwegian.csv',
+    'SnowballSwedish': 'snowball_swedish.csv',
+    'CLEFGerman': 'snowball_german.csv',
+    'CLEFGermanPlus': 'snowball_german.csv',
+    'Caumanns': 'snowball_german.csv',
+    'CLEFSwedish': 'snowball_swedish.csv',
+}
+
+SIZES = (10, 100, 1000)
+LENGTHS = ('natural', '8', '32', '128')
+
+
+def _read_column(filename, column=0, header=False):
+    """Return a column of a corpus file.
+
+    Parameters
+    ----------
+    filename : str
+        The name of a file in tests/corpora
+    column : int
+        The index of the column to return
+    header : bool
+        Set to True if the file's first line is a header
+
+    Returns
+    -------
+    list of str
+        The column's non-empty values
+
+    """
+    with codecs.open(_corpus_file(filename), encoding='utf-8') as corpus:
+        lines = corpus.read().splitlines()
+    if header:
+        lines = lines[1:]
+    values = []
+    for line in lines:
+        fields = line.split(',')
+        if len(fields) > column and fields[column]:
+            values.append(fields[column])
+    return values
+
+
+def _at_length(values, length, count):
+    """Return count strings built from values at the given length.
+
+    Parameters
+    ----------
+    values : list of str
+        Corpus values
+    length : str
+        'natural' or a number of characters
+    count : int
+        The number of strings to return
+
+    Returns
+    -------
+    list of str
+        The strings
+
+    """
+    if length == 'natural':
+        return [values[i % len(values)] for i in range(count)]
+
+    length = int(length)
+    strings = []
+    pos = 0
+    for _ in range(count):
+        parts = []
+        while sum(len(part) + 1 for part in parts) < length:
+            parts.append(values[pos % len(values)])
+            pos += 1
+        strings.append(' '.join(parts)[:length])
+    return strings
+
+
+def _corpora():
+    """Return the corpora used as benchmark inputs.
+
+    Returns
+    -------
+    dict
+        Corpus name to list of values, or (for pairs) list of tuples
+
+    """
+    names = _read_column('nachnamen.csv') + _read_column(
+        'uscensus2000.bm.cc.csv', header=True
+    )
+    misspelled = _read_column('wikipediaCommonMisspellings.csv', 0, True)
+    corrected = _read_column('wikipediaCommonMisspellings.csv', 1, True)
+    words = {
+        filename: _read_column(filename, header=True)
+        for filename in set(STEMMER_CORPORA.values())
+    }
+    return {
+        'names': names,
+        'misspellings': list(zip(misspelled, corrected)),
+        'name_pairs': list(zip(names[::2], names[1::2])),
+        'words': words,
+    }
+
+
+def _inputs(package, cls_name, corpora, size, length):
+    """Return the corpus name & inputs for a class.
+
+    Parameters
+    ----------
+    package : str
+        The package name
+    cls_name : str
+        The class name
+    corpora : dict
+        The corpora, as returned by _corpora
+    size : int
+        The number of inputs
+    length : str
+        'natural' or a number of characters
+
+    Returns
+    -------
+    list of tuple
+        (corpus name, list of argument tuples) for each input set
+
+    """
+    if package == 'distance':
+        sets = []
+        for corpus in ('misspellings', 'name_pairs'):
+            pairs = corpora[corpus]
+            srcs = _at_length([pair[0] for pair in pairs], length, size)
+            tars = _at_length([pair[1] for pair in pairs], length, size)
+            sets.append((corpus, list(zip(srcs, tars))))
+        return sets
+    if package == 'phonetic':
+        return [
+            (
+                'names',
+                [
+                    (name,)
+                    for name in _at_length(corpora['names'], length, size)
+                ],
+            )
+        ]
+    filename = (
+        STEMMER_CORPORA.get(cls_name, 'snowball_porter.csv')
+        if package == 'stemmer'
+        else 'snowball_porter.csv'
+    )
+    return [
+        (
+            filename[:-4],
+            [
+                (word,)
+                for word in _at_length(
+                    corpora['words'][filename], length, size
+                )
+            ],
+        )
+    ]
+
+
+def _classes(package, pattern=None):
+    """Yield the name & class of each public class in a package.
+
+    Parameters
+    ----------
+    package : str
+        The package name
+    pattern : str
+        A regular expression that class names must match
+
+    Yields
+    ------
+    tuple
+        The class name & class
+
+    """
+    module = import_module('abydos.' + package)
+    for name in sorted(module.__all__):
+        if name.startswith('_'):
+            continue
+        if pattern is not None and not re.search(pattern, name):
+            continue
+        cls = getattr(module, name)
+        if inspect.isclass(cls):
+            yield name, cls
+
+
+def _time_calls(func, args_list, repeat):
+    """Return the minimum time taken to call func on each of args_list.
+
+    Parameters
+    ----------
+    func : callable
+        The function to time
+    args_list : list of tuple
+        The arguments of each call
+    repeat : int
+        The number of times to repeat the calls
+
+    Returns
+    -------
+    float
+        The minimum, over the repetitions, of the total time (in seconds)
+
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        for args in args_list:
+            func(*args)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def run(
+    packages=PACKAGES,
+    sizes=SIZES,
+    lengths=LENGTHS,
+    repeat=3,
+    max_seconds=10.0,
+    max_call_seconds=0.05,
+    pattern=None,
+    verbose=True,
+):
+    """Run the benchmarks and return the results.
+
+    Parameters
+    ----------
+    packages : tuple of str
+        The packages to benchmark
+    sizes : tuple of int
+        The numbers of inputs
+    lengths : tuple of str
+        The string lengths: 'natural' or a number of characters
+    repeat : int
+        The number of times to repeat each timing
+    max_seconds : float
+        If timing a class on one input set takes longer than this, larger
+        sizes of that corpus & string length are skipped
+    max_call_seconds : float
+        If a class takes longer than this per call on one input set, larger
+        sizes & longer strings of that corpus are skipped, as are longer
+        strings for which a quadratic extrapolation from shorter strings
+        exceeds this
+    pattern : str
+        A regular expression that class names must match
+    verbose : bool
+        Set to True to print each result as it is measured
+
+    Returns
+    -------
+    dict
+        The results, with run metadata
+
+    """
+    corpora = _corpora()
+    results = []
+    for package in packages:
+        method = METHODS[package]
+        for cls_name, cls in _classes(package, pattern):
+            key = '{}.{}'.format(package, cls_name)
+            try:
+                func = getattr(cls(), method)
+            except Exception as exc:  # noqa: B902
+                results.append({'name': key, 'skipped': repr(exc)})
+                if verbose:
+                    print('{:<40} skipped: {!r}'.format(key, exc))
+                continue
+
+            # Corpora for which longer strings are not timed
+            too_slow = set()
+            # The mean string length & time per call of the last case timed
+            # at a shorter length, for each corpus
+            shorter = {}
+            for length in sorted(lengths, key=_length_order):
+                # Corpora for which larger sizes at this length are not timed
+                too_large = set()
+                last_case = {}
+                for size in sorted(sizes):
+                    for corpus, args_list in _inputs(
+                        package, cls_name, corpora, size, length
+                    ):
+                        if corpus in too_slow or corpus in too_large:
+                            continue
+                        mean_len = _mean_length(args_list)
+                        if corpus in shorter:
+                            # Assume quadratic growth, since a single call
+                            # to a measure that grows faster cannot be
+                            # interrupted
+                            prev_len, prev_call = shorter[corpus]
+                            if (
+                                prev_call * (mean_len / prev_len) ** 2
+                                > max_call_seconds
+                            ):
+                                too_slow.add(corpus)
+                                continue
+                        result = {
+                            'name': key,
+                            'method': method,
+                            'corpus': corpus,
+                            'size': size,
+                            'length': length,
+                        }
+                        try:
+                            seconds = _time_calls(func, args_list, repeat)
+                        except Exception as exc:  # noqa: B902
+                            result['error'] = repr(exc)
+                            too_slow.add(corpus)
+                        else:
+                            result['seconds'] = seconds
+                            result['us_per_call'] = seconds / size * 1e6
+                            last_case[corpus] = (mean_len, seconds / size)
+                            if seconds / size > max_call_seconds:
+                                too_slow.add(corpus)
+                            elif seconds > max_seconds:
+                                too_large.add(corpus)
+                        results.append(result)
+                        if verbose:
+                            print(_format_result(result))
+                for corpus in last_case:
+                    shorter[corpus] = last_case[corpus]
+
+    return {
+        'abydos': abydos.__version__,
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': datetime.now().isoformat(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def _mean_length(args_list):
+    """Return the mean length of the strings in a list of argument tuples."""
+    lengths = [len(arg) for args in args_list for arg in args]
+    return max(1.0, sum(lengths) / len(lengths))
+
+
+def _length_order(length):
+    """Return a sort key that orders string lengths from shortest."""
+    return -1 if length == 'natural' else int(length)
+
+
+def _result_key(result):
+    """Return the key identifying a result's benchmark case."""
+    return '{} {} n={} len={}'.format(
+        result['name'], result['corpus'], result['size'], result['length']
+    )
+
+
+def _format_result(result):
+    """Return a result as a line of text."""
+    if 'error' in result:
+        return '{:<60} error: {}'.format(_result_key(result), result['error'])
+    return '{:<60} {:12.2f} us/call'.format(
+        _result_key(result), result['us_per_call']
+    )
+
+
+def _git_commit():
+    """Return the current git commit, if available."""
+    try:
+        return (
+            subprocess.check_output(  # noqa: S603, S607
+                ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL
+            )
+            .decode('utf-8')
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold=0.1):
+    """Return the lines of a comparison of two sets of results.
+
+    Parameters
+    ----------
+    baseline : dict
+        Results of an earlier run
+    current : dict
+        Results of this run
+    threshold : float
+        Relative changes in time smaller than this are not marked
+
+    Returns
+    -------
+    list of str
+        A line for each benchmark case found in both runs, with the ratio of
+        the baseline time to the current time (>1 is a speedup), followed by
+        a summary
+
+    """
+    base_times = {
+        _result_key(result): result['seconds']
+        for result in baseline['results']
+        if 'seconds' in result
+    }
+    lines = []
+    faster = slower = 0
+    for result in current['results']:
+        if 'seconds' not in result:
+            continue
+        key = _result_key(result)
+        if key not in base_times or not result['seconds']:
+            continue
+        ratio = base_times[key] / result['seconds']
+        mark = ''
+        if ratio > 1 + threshold:
+            mark = 'faster'
+            faster += 1
+        elif ratio < 1 / (1 + threshold):
+            mark = 'SLOWER'
+            slower += 1
+        lines.append('{:<60} {:8.2f}x {}'.format(key, ratio, mark))
+    lines.append(
+        '{} faster, {} slower, of {} cases compared'.format(
+            faster, slower, len(lines)
+        )
+    )
+    return lines
+
+
+def main(argv=None):
+    """Run the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : list of str
+        Command line arguments
+
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the public classes of Abydos.'
+    )
+    parser.add_argument(
+        '--packages', nargs='+', default=PACKAGES, choices=PACKAGES
+    )
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--lengths', nargs='+', default=LENGTHS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--max-seconds',
+        type=float,
+        default=10.0,
+        help='skip larger sizes of a case that takes longer than this',
+    )
+    parser.add_argument(
+        '--max-call-seconds',
+        type=float,
+        default=0.05,
+        help='skip larger sizes & longer strings of a case that takes longer '
+        'than this per call',
+    )
+    parser.add_argument(
+        '--filter', help='only run classes matching this regular expression'
+    )
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument(
+        '--compare', help='compare results with those in this JSON file'
+    )
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = run(
+        tuple(args.packages),
+        tuple(args.sizes),
+        tuple(args.lengths),
+        args.repeat,
+        args.max_seconds,
+        args.max_call_seconds,
+        args.filter,
+        not args.quiet,
+    )
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=1)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        for line in compare(baseline, results):
+            print(line)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -106,6 +106,26 @@ class ArithmeticCoderTestCases(unittest.TestCase):
         self.coder.set_probs({'\x00': (0, 1)})
         self.assertEqual(self.coder.decode(1, 1), '')
 
+    def test_arithmetic_encoded_len(self):
+        """Test abydos.compression.Arithmetic.encoded_len."""
+        self.coder.set_probs(self.niall_probs)
+        for text in NIALL + ('', 'Ni\x00ll', 'Neil Noígíallach'):
+            self.assertEqual(
+                self.coder.encoded_len(text), self.coder.encode(text)[1]
+            )
+        self.assertRaises(KeyError, self.coder.encoded_len, 'NIALL')
+        self.coder.set_probs({'\x00': (0, 1)})
+        self.assertEqual(self.coder.encoded_len(''), 1)
+
+    def test_arithmetic_long(self):
+        """Test abydos.compression.Arithmetic on a long text."""
+        text = ' '.join(NIALL * 100)
+        coder = Arithmetic(text)
+        longval, nbits = coder.encode(text)
+        self.assertEqual(nbits, 39001)
+        self.assertEqual(coder.encoded_len(text), nbits)
+        self.assertEqual(coder.decode(longval, nbits), text)
+
 
 if __name__ == '__main__':
     unittest.main()
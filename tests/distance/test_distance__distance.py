@@ -21,7 +21,7 @@ This module contains unit tests for abydos.distance._Distance
 
 import unittest
 
-from abydos.distance import Dice, Levenshtein
+from abydos.distance import Dice, Levenshtein, Tversky
 
 
 class DistanceTestCases(unittest.TestCase):
@@ -62,6 +62,66 @@ class DistanceTestCases(unittest.TestCase):
             self.dice.dist_abs('Niall', 'Nigel'),
         )
 
+    def test_pairwise(self):
+        """Test abydos.distance._Distance.pairwise."""
+        srcs = ['Niall', 'Neil', 'Colin', '']
+        tars = ['Nigel', 'Coiln', 'Neal']
+        for cmp in (self.lev, self.dice, Tversky(alpha=0.2, beta=0.8)):
+            for method in ('sim', 'dist', 'dist_abs'):
+                mat = cmp.pairwise(srcs, tars, method)
+                self.assertEqual(mat.shape, (4, 3))
+                for i, src in enumerate(srcs):
+                    for j, tar in enumerate(tars):
+                        self.assertAlmostEqual(
+                            mat[i, j], getattr(cmp, method)(src, tar)
+                        )
+
+        # generators are consumed only once
+        mat = self.lev.pairwise((_ for _ in srcs), iter(tars), 'dist_abs')
+        self.assertEqual(mat.shape, (4, 3))
+        self.assertEqual(mat[0, 0], 2.0)
+
+        self.assertEqual(self.lev.pairwise([], tars).shape, (0, 3))
+        self.assertRaises(ValueError, self.lev.pairwise, srcs, tars, 'foo')
+
+    def test_sim_many(self):
+        """Test abydos.distance._Distance.sim_many."""
+        tars = ['Nigel', 'Coiln', 'Neal', '']
+        for cmp in (self.lev, self.dice):
+            sims = cmp.sim_many('Niall', iter(tars))
+            self.assertEqual(sims.shape, (4,))
+            for sim, tar in zip(sims, tars):
+                self.assertAlmostEqual(sim, cmp.sim('Niall', tar))
+        self.assertEqual(self.lev.sim_many('Niall', []).shape, (0,))
+
+    def test_pairwise_self(self):
+        """Test abydos.distance._Distance.pairwise_self."""
+        strings = ['Niall', 'Neil', 'Colin', 'Coiln', '']
+        tversky = Tversky(alpha=0.2, beta=0.8)
+
+        mat = tversky.pairwise_self(iter(strings))
+        self.assertEqual(mat.shape, (5, 5))
+        for i, src in enumerate(strings):
+            for j, tar in enumerate(strings):
+                self.assertAlmostEqual(mat[i, j], tversky.sim(src, tar))
+
+        for cmp in (self.lev, self.dice):
+            values = cmp.pairwise_self(strings, 'dist', condensed=True)
+            self.assertEqual(values.shape, (10,))
+            mat = cmp.pairwise_self(strings, 'dist')
+            pos = 0
+            for i in range(len(strings)):
+                for j in range(i + 1, len(strings)):
+                    self.assertAlmostEqual(values[pos], mat[i, j])
+                    pos += 1
+
+        self.assertEqual(
+            self.lev.pairwise_self(['Niall'], condensed=True).shape, (0,)
+        )
+        self.assertRaises(
+            ValueError, self.lev.pairwise_self, strings, 'sim_abs'
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,103 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance__ncd.
+
+This module contains unit tests for abydos.distance._NCD
+"""
+
+import pickle
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from abydos.distance import NCDbz2, NCDzlib, _NCD
+
+from .. import COLIN, NIALL
+
+
+class NCDTestCases(unittest.TestCase):
+    """Test _NCD functions.
+
+    abydos.distance._NCD
+    """
+
+    def test_ncd_dist(self):
+        """Test abydos.distance._NCD.dist."""
+        # without a compressor, the length is the UTF-8 length, so that
+        # distinct strings share nothing
+        cmp = _NCD()
+        self.assertEqual(cmp._compressed_len('ça'), 3)  # noqa: SF01
+        self.assertEqual(cmp.dist('', ''), 0.0)
+        self.assertEqual(cmp.dist('a', ''), 1.0)
+        self.assertEqual(cmp.dist('abcd', 'ab'), 1.0)
+        self.assertEqual(list(cmp.dist_many('abcd', ['ab', 'abcd'])), [1, 0])
+
+    def test_ncd_threads(self):
+        """Test abydos.distance._NCD shared among threads."""
+
+        class _SlowStr(str):
+            """A string whose hashing lets other threads run."""
+
+            def __hash__(self):
+                time.sleep(0)
+                return super().__hash__()
+
+        # the cache is used between hashing a string & finding it, so that
+        # other threads evict strings while they are being looked up
+        words = [_SlowStr('w{}'.format(i)) for i in range(6)]
+        word_pairs = [(src, tar) for src in words for tar in words] * 20
+        pairs = [(src, tar) for src in NIALL for tar in COLIN[:10]]
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(20):
+                cmp = NCDzlib(cache_size=3)
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(
+                        executor.map(lambda pair: cmp.dist(*pair), word_pairs)
+                    )
+                self.assertEqual(len(cmp._cache), 3)
+
+            for cmp in (
+                NCDzlib(cache_size=3),
+                NCDzlib(cache_size=0),
+                NCDbz2(cache_size=5),
+            ):
+                serial = [cmp.dist(src, tar) for src, tar in pairs]
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    threaded = list(
+                        executor.map(lambda pair: cmp.dist(*pair), pairs)
+                    )
+                self.assertEqual(serial, threaded)
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_ncd_pickle(self):
+        """Test abydos.distance._NCD pickling."""
+        cmp = NCDzlib(cache_size=3)
+        cmp.dist('Niall', 'Neil')
+        copy = pickle.loads(pickle.dumps(cmp))
+        self.assertEqual(list(copy._cache), ['Niall', 'Neil'])
+        self.assertEqual(copy.dist('Niall', 'Neil'), cmp.dist('Niall', 'Neil'))
+        copy.dist('Colin', 'Nigel')
+        self.assertEqual(list(copy._cache), ['Neil', 'Colin', 'Nigel'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,23 +19,46 @@
 This module contains unit tests for abydos.distance._TokenDistance
 """
 
+import pickle
+import sys
 import unittest
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from math import isnan, log1p
 
+import numpy as np
+
+from abydos import distance
 from abydos.distance import (
+    SSK,
     AverageLinkage,
+    Bag,
+    Cosine,
     DamerauLevenshtein,
+    FuzzyWuzzyTokenSort,
+    GilbertWells,
+    HendersonHeron,
     Jaccard,
     JaroWinkler,
+    KuhnsIII,
+    RaupCrick,
     SokalMichener,
+    Tversky,
+    YuleQ,
+    _TokenDistance,
 )
 from abydos.stats import ConfusionTable
 from abydos.tokenizer import (
     CharacterTokenizer,
+    QGrams,
     QSkipgrams,
+    Vectorizer,
     WhitespaceTokenizer,
 )
 
+from .. import COLIN, NIALL
+
 
 class TokenDistanceTestCases(unittest.TestCase):
     """Test _TokenDistance functions.
@@ -433,6 +456,230 @@ class TokenDistanceTestCases(unittest.TestCase):
             Counter({'#': 0.5, 'e#': -1, 'e': -0.5}),
         )
 
+    def test_token_distance_threads(self):
+        """Test abydos.distance._TokenDistance shared among threads."""
+        pairs = [(src, tar) for src in NIALL for tar in COLIN[:10]]
+        measures = (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            self.cmp_j_fuzzy,
+            self.cmp_j_linkage,
+            Cosine(tokenizer=QSkipgrams(qval=2)),
+            Tversky(alpha=0.2, beta=0.8, normalizer='proportional'),
+            SokalMichener(alphabet='abcdefghijklmnopqrstuvwxyz'),
+            FuzzyWuzzyTokenSort(),
+        )
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for cmp in measures:
+                serial = [cmp.sim(src, tar) for src, tar in pairs]
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    threaded = list(
+                        executor.map(lambda pair: cmp.sim(*pair), pairs)
+                    )
+                self.assertEqual(serial, threaded)
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_token_distance_hashed(self):
+        """Test abydos.distance._TokenDistance with hashed tokens."""
+        pairs = [(src, tar) for src in NIALL[::2] for tar in COLIN[:3]]
+        pairs += [('', ''), ('', 'Niall'), ('Niall', 'Niall')]
+        for cls, kwargs in (
+            (Jaccard, {}),
+            (Cosine, {'normalizer': 'proportional'}),
+            (Tversky, {'alpha': 0.2, 'beta': 0.8}),
+            (SokalMichener, {'alphabet': 'abcdefghijklmnopqrstuvwxyz'}),
+            (SokalMichener, {'alphabet': None}),
+        ):
+            for tokenizer in (
+                QGrams(qval=3, start_stop=''),
+                QSkipgrams(qval=2, scaler='SSK'),
+                QGrams(scaler=log1p),
+            ):
+                cmp = cls(tokenizer=tokenizer, **kwargs)
+                tokenizer = copy(tokenizer)
+                tokenizer.hashed = True
+                cmp_hashed = cls(tokenizer=tokenizer, **kwargs)
+                self.assertTrue(cmp_hashed._hashed)  # noqa: SF01
+                for src, tar in pairs:
+                    self.assertAlmostEqual(
+                        cmp.sim(src, tar), cmp_hashed.sim(src, tar)
+                    )
+                    cmp._tokenize(src, tar)  # noqa: SF01
+                    cmp_hashed._tokenize(src, tar)  # noqa: SF01
+                    for card in (
+                        '_src_card',
+                        '_src_only_card',
+                        '_tar_card',
+                        '_tar_only_card',
+                        '_symmetric_difference_card',
+                        '_total_card',
+                        '_total_complement_card',
+                        '_population_card',
+                        '_union_card',
+                        '_intersection_card',
+                    ):
+                        self.assertAlmostEqual(
+                            getattr(cmp, card)(), getattr(cmp_hashed, card)()
+                        )
+                    # the tokens are still available as Counters
+                    self.assertEqual(
+                        cmp._intersection(),  # noqa: SF01
+                        cmp_hashed._intersection(),  # noqa: SF01
+                    )
+                np.testing.assert_allclose(
+                    cmp.pairwise(NIALL[:8], COLIN[:8]),
+                    cmp_hashed.pairwise(NIALL[:8], COLIN[:8]),
+                )
+
+        # only crisp intersections are computed from hashes
+        self.assertFalse(
+            Jaccard(
+                intersection_type='soft', tokenizer=QGrams(hashed=True)
+            )._hashed  # noqa: SF01
+        )
+
+        # Counters may be compared with hashed strings
+        cmp = Jaccard(tokenizer=QGrams(hashed=True))
+        self.assertEqual(cmp.sim(Counter({'$N': 1, 'Ni': 1}), 'Niall'), 1 / 3)
+        self.assertEqual(cmp.sim(Counter(), Counter()), 1.0)
+
+    def test_token_distance_hashed_measures(self):
+        """Test every _TokenDistance measure with hashed tokens."""
+        pairs = [
+            ('', ''),
+            ('', 'b'),
+            ('a', 'adaceeed'),
+            ('Niall', 'Neil'),
+            ('Niall', 'Niall'),
+            ('Colin', 'Cullen'),
+        ]
+        for name in distance.__all__:
+            cls = getattr(distance, name)
+            if (
+                name.startswith('_')
+                or not isinstance(cls, type)
+                or not issubclass(cls, _TokenDistance)
+                # these sample tokens at random
+                or name in {'ChaoDice', 'ChaoJaccard'}
+            ):
+                continue
+            cmp = cls(tokenizer=QGrams())
+            cmp_hashed = cls(tokenizer=QGrams(hashed=True))
+            for src, tar in pairs:
+                # integer counts remain ints (e.g. for factorials)
+                cmp._tokenize(src, tar)  # noqa: SF01
+                cmp_hashed._tokenize(src, tar)  # noqa: SF01
+                for card in (
+                    '_src_card',
+                    '_tar_card',
+                    '_intersection_card',
+                    '_union_card',
+                    '_total_complement_card',
+                ):
+                    self.assertIs(
+                        type(getattr(cmp_hashed, card)()),
+                        type(getattr(cmp, card)()),
+                    )
+                for method in ('sim', 'dist', 'dist_abs'):
+                    try:
+                        value = getattr(cmp, method)(src, tar)
+                    except NotImplementedError:
+                        self.assertRaises(
+                            NotImplementedError,
+                            getattr(cmp_hashed, method),
+                            src,
+                            tar,
+                        )
+                        continue
+                    hashed_value = getattr(cmp_hashed, method)(src, tar)
+                    if isnan(value):
+                        self.assertTrue(isnan(hashed_value))
+                    else:
+                        self.assertAlmostEqual(value, hashed_value)
+
+    def test_token_distance_from_cards(self):
+        """Test abydos.distance._TokenDistance.from_cards."""
+        names = ('',) + NIALL[:10] + COLIN[:10]
+        for cmp in (
+            Jaccard(),
+            Tversky(alpha=0.2, beta=0.7),
+            Cosine(),
+            SokalMichener(),
+            YuleQ(),
+            KuhnsIII(),
+            # these take factorials of the cardinalities
+            HendersonHeron(),
+            GilbertWells(),
+            RaupCrick(),
+            Jaccard(tokenizer=QSkipgrams(scaler='length')),
+        ):
+            mat = Vectorizer(cmp.params['tokenizer']).fit_transform(names)
+            a = mat.intersection()
+            b = mat.row_sums()[:, np.newaxis] - a
+            c = mat.row_sums() - a
+            for method in ('sim', 'dist', 'dist_abs'):
+                values = cmp.from_cards(a, b, c, 784, method)
+                self.assertEqual(values.shape, (len(names), len(names)))
+                for i, src in enumerate(names):
+                    for j, tar in enumerate(names):
+                        if i != j:
+                            self.assertAlmostEqual(
+                                values[i, j], getattr(cmp, method)(src, tar)
+                            )
+
+        # pairs with empty sides
+        np.testing.assert_allclose(
+            Jaccard().from_cards([1, 2, 0, 0], [1, 1, 1, 0], [2, 0, 3, 0]),
+            [0.25, 2 / 3, 0.0, 1.0],
+        )
+        # cardinalities are broadcast
+        np.testing.assert_allclose(
+            Jaccard().from_cards([[1], [2]], 1, [2, 0]),
+            [[0.25, 0.5], [0.4, 2 / 3]],
+        )
+        self.assertEqual(Jaccard().from_cards(1, 1, 2).shape, ())
+
+        np.testing.assert_allclose(
+            HendersonHeron().from_cards([2], [1], [3], [784]), [0.99990263472]
+        )
+
+        self.assertRaises(ValueError, SSK().from_cards, 1, 1, 1)
+        self.assertRaises(ValueError, AverageLinkage().from_cards, 1, 1, 1)
+        self.assertRaises(
+            ValueError, FuzzyWuzzyTokenSort().from_cards, 1, 1, 1
+        )
+        # errors in the measure itself are not mistaken for a lack of tokens
+        with self.assertRaises((TypeError, ValueError)) as context:
+            HendersonHeron().from_cards(2.5, 1, 0.5, 784)
+        self.assertNotIn('tokens themselves', str(context.exception))
+        # Bag's distance from an empty string is the other string's length,
+        # which it takes from the string itself
+        self.assertEqual(Bag().from_cards(1, 1, 2, method='dist_abs'), 2)
+        self.assertEqual(Bag().from_cards(0, 0, 2), 0.0)
+        self.assertRaises(
+            ValueError, Bag().from_cards, 0, 0, 2, None, 'dist_abs'
+        )
+        self.assertRaises(ValueError, Jaccard().from_cards, 1, 1, 1, None, '')
+
+        # distinct rows
+        rows = np.array([[1.0, 2.0], [0.5, 2.0], [1.0, 2.0], [0.5, 3.0]])
+        first, inverse = Jaccard._distinct_rows(rows)  # noqa: SF01
+        np.testing.assert_array_equal(rows[first][inverse], rows)
+        self.assertEqual(len(first), 3)
+
+    def test_token_distance_pickle(self):
+        """Test abydos.distance._TokenDistance pickling."""
+        for cmp in (self.cmp_j_crisp, self.cmp_j_soft):
+            cmp.sim('Niall', 'Neil')
+            cmp_copy = pickle.loads(pickle.dumps(cmp))
+            self.assertEqual(
+                cmp.sim('Colin', 'Coiln'), cmp_copy.sim('Colin', 'Coiln')
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_bk_tree.
+
+This module contains unit tests for abydos.distance.BKTree
+"""
+
+import codecs
+import os
+import tempfile
+import unittest
+
+from abydos.distance import (
+    BKTree,
+    DamerauLevenshtein,
+    Hamming,
+    Indel,
+    Levenshtein,
+)
+
+from .. import NIALL, _corpus_file
+
+
+class BKTreeTestCases(unittest.TestCase):
+    """Test BKTree functions.
+
+    abydos.distance.BKTree
+    """
+
+    with codecs.open(
+        _corpus_file('wikipediaCommonMisspellings.csv'), encoding='utf-8'
+    ) as corpus:
+        next(corpus)
+        misspellings = [line.strip().split(',') for line in corpus]
+    words = sorted({correct for _, correct in misspellings})
+
+    tree = BKTree(words)
+
+    def _linear_within(self, metric, words, query, k):
+        return sorted(
+            (dist, word)
+            for dist, word in ((metric.dist_abs(query, w), w) for w in words)
+            if dist <= k
+        )
+
+    def test_bk_tree_add(self):
+        """Test abydos.distance.BKTree.add."""
+        tree = BKTree()
+        self.assertEqual(len(tree), 0)
+        self.assertNotIn('Niall', tree)
+        self.assertEqual(tree.within('Niall', 5), [])
+        self.assertEqual(tree.nearest('Niall'), [])
+
+        for name in NIALL:
+            tree.add(name)
+        self.assertEqual(len(tree), len(set(NIALL)))
+        tree.add('Niall')
+        self.assertEqual(len(tree), len(set(NIALL)))
+        self.assertIn('Niall', tree)
+        self.assertNotIn('Nial', tree)
+
+        self.assertEqual(len(self.tree), len(self.words))
+
+    def test_bk_tree_within(self):
+        """Test abydos.distance.BKTree.within."""
+        self.assertEqual(self.tree.within('abandonned', 0), [])
+        self.assertEqual(self.tree.within('abandonned', 1), [('abandoned', 1)])
+        self.assertEqual(self.tree.within('aberration', 0)[0][1], 0)
+
+        lev = Levenshtein()
+        for error, _ in self.misspellings[::250]:
+            linear = self._linear_within(lev, self.words, error, 2)
+            for k in range(3):
+                self.assertEqual(
+                    sorted(
+                        (dist, word)
+                        for word, dist in self.tree.within(error, k)
+                    ),
+                    [(dist, word) for dist, word in linear if dist <= k],
+                )
+
+        for metric in (DamerauLevenshtein(), Hamming(), Indel()):
+            tree = BKTree(NIALL, metric)
+            for name in NIALL + ('Nil', 'Colin', ''):
+                for k in range(4):
+                    self.assertEqual(
+                        sorted(
+                            (dist, word) for word, dist in tree.within(name, k)
+                        ),
+                        self._linear_within(metric, set(NIALL), name, k),
+                    )
+
+    def test_bk_tree_nearest(self):
+        """Test abydos.distance.BKTree.nearest."""
+        self.assertEqual(self.tree.nearest('abandonned'), [('abandoned', 1)])
+        self.assertEqual(self.tree.nearest('Niall', 0), [])
+
+        lev = Levenshtein()
+        for error, _ in self.misspellings[::250]:
+            linear = sorted(lev.dist_abs(error, word) for word in self.words)
+            for n in (1, 3, 5):
+                nearest = self.tree.nearest(error, n)
+                for word, dist in nearest:
+                    self.assertEqual(lev.dist_abs(error, word), dist)
+                self.assertEqual([dist for _, dist in nearest], linear[:n])
+
+        tree = BKTree(NIALL[:5])
+        self.assertEqual(len(tree.nearest('Niall', 10)), 5)
+
+    def test_bk_tree_save_load(self):
+        """Test abydos.distance.BKTree.save_tree & .load_tree."""
+        handle, path = tempfile.mkstemp('.dat')
+        tree = BKTree(NIALL, Indel())
+        tree.save_tree(path)
+
+        loaded = BKTree()
+        loaded.load_tree(path)
+        self.assertEqual(len(loaded), len(tree))
+        for name in ('Niall', 'Nil', 'Colin'):
+            self.assertEqual(loaded.within(name, 3), tree.within(name, 3))
+            self.assertEqual(loaded.nearest(name, 4), tree.nearest(name, 4))
+        self.assertIsInstance(loaded._metric, Indel)
+
+        os.close(handle)
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
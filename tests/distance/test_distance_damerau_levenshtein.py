@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.DamerauLevenshtein
 """
 
+import random
 import unittest
 
 from abydos.distance import DamerauLevenshtein
@@ -52,6 +53,42 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
         self.assertEqual(self.cmp55105.dist_abs('cab', 'cba'), 5)
         self.assertRaises(ValueError, self.cmp1010105.dist_abs, 'ab', 'ba')
 
+    def test_damerau_levenshtein_max_distance(self):
+        """Test abydos.distance.DamerauLevenshtein with max_distance."""
+        self.assertEqual(self.cmp.dist_abs('CA', 'ABC', 2), 2)
+        self.assertEqual(self.cmp.dist_abs('CA', 'ABC', 1), 2)
+        self.assertEqual(self.cmp.dist_abs('', 'ABC', 1), 2)
+        self.assertEqual(self.cmp.dist_abs('a' * 100, 'b' * 10, 2), 3)
+        self.assertEqual(self.cmp571010.dist_abs('a', 'ab', 4.5), 5.5)
+        self.assertEqual(self.cmp55105.dist_abs('abc', 'bac', 5), 5)
+        self.assertEqual(self.cmp.dist('CA', 'ABC', 2 / 3), 2 / 3)
+        self.assertGreater(self.cmp.dist('CA', 'ABC', 0.5), 0.5)
+        self.assertRaises(
+            ValueError, self.cmp1010105.dist_abs, 'ab', 'ba', max_distance=1
+        )
+
+        # compare with the unbounded computation
+        rng = random.Random(1964)
+        for cmp in (self.cmp, self.cmp571010, self.cmp55105):
+            for _ in range(200):
+                src = ''.join(
+                    rng.choice('abcd') for _ in range(rng.randint(0, 12))
+                )
+                tar = ''.join(
+                    rng.choice('abcd') for _ in range(rng.randint(0, 12))
+                )
+                dist_abs = cmp.dist_abs(src, tar)
+                for max_distance in (0, 1, 2, 5, 7.5, 12):
+                    if dist_abs <= max_distance:
+                        self.assertEqual(
+                            cmp.dist_abs(src, tar, max_distance), dist_abs
+                        )
+                    else:
+                        self.assertEqual(
+                            cmp.dist_abs(src, tar, max_distance),
+                            max_distance + 1,
+                        )
+
     def test_damerau_dist(self):
         """Test abydos.distance.DamerauLevenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.DiscountedLevenshtein
 """
 
+import random
 import unittest
 
 from abydos.distance import DiscountedLevenshtein
@@ -117,6 +118,33 @@ class DiscountedLevenshteinTestCases(unittest.TestCase):
             self.cmp.dist_abs('ATCAACGAGT', 'AACGATTAG'), 3.480037325627888
         )
 
+    def test_discounted_levenshtein_score(self):
+        """Test abydos.distance.DiscountedLevenshtein's row-wise score."""
+        rng = random.Random(2019)
+        for cmp in (
+            self.cmp,
+            self.cmp_coda,
+            DiscountedLevenshtein(mode='osa', discount_func='exp'),
+        ):
+            for _ in range(50):
+                src = ''.join(
+                    rng.choice('abeo') for _ in range(rng.randint(1, 12))
+                )
+                tar = ''.join(
+                    rng.choice('abeo') for _ in range(rng.randint(1, 12))
+                )
+                dist_abs = cmp._alignment_matrix(src, tar, backtrace=False)[
+                    -1, -1
+                ]
+                self.assertEqual(cmp._score(src, tar), dist_abs)
+                for max_distance in (0.5, 1, 2.5):
+                    self.assertEqual(
+                        cmp.dist_abs(src, tar, max_distance),
+                        dist_abs
+                        if dist_abs <= max_distance
+                        else max_distance + 1,
+                    )
+
     def test_discounted_levenshtein_dist(self):
         """Test abydos.distance.DiscountedLevenshtein.dist."""
         # Base cases
@@ -77,6 +77,15 @@ class IndelTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist_abs('Colin', 'Coiln'), 2)
         self.assertAlmostEqual(self.cmp.dist_abs('Coiln', 'Colin'), 2)
 
+    def test_indel_max_distance(self):
+        """Test abydos.distance.Indel with max_distance."""
+        self.assertEqual(self.cmp.dist_abs('Nigel', 'Niall', 4), 4)
+        self.assertEqual(self.cmp.dist_abs('Nigel', 'Niall', 3), 4)
+        self.assertEqual(self.cmp.dist_abs('abcd', 'efgh', 2), 3)
+        self.assertEqual(self.cmp.dist_abs('Colin', 'Coiln', 2), 2)
+        self.assertAlmostEqual(self.cmp.dist('Colin', 'Coiln', 0.2), 0.2)
+        self.assertGreater(self.cmp.dist('Nigel', 'Niall', 0.3), 0.3)
+
 
 if __name__ == '__main__':
     unittest.main()
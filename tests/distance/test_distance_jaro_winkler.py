@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.JaroWinkler
 """
 
+import random
 import unittest
 
 from abydos.distance import JaroWinkler
@@ -95,6 +96,49 @@ class JaroWinklerTestCases(unittest.TestCase):
             0.97083333,
         )
 
+    def test_sim_many_jaro_winkler(self):
+        """Test abydos.distance.JaroWinkler.sim_many."""
+        tars = ['MARHTA', 'MARTHA', '', ' MARTHA ', 'AMRTHA', 'XYZ', 'MA']
+        for cmp in (
+            self.jaro,
+            self.jaro_winkler,
+            JaroWinkler(long_strings=True),
+            JaroWinkler(qval=2),
+        ):
+            sims = cmp.sim_many('MARTHA', tars)
+            self.assertEqual(sims.shape, (len(tars),))
+            for sim, tar in zip(sims, tars):
+                self.assertEqual(sim, cmp.sim('MARTHA', tar))
+            self.assertEqual(
+                list(cmp.pairwise(['MARTHA', ''], tars, 'dist')[1]),
+                [cmp.dist('', tar) for tar in tars],
+            )
+        self.assertEqual(list(self.jaro.sim_many(' ', ['', ' '])), [0.0, 1.0])
+        self.assertRaises(
+            ValueError,
+            JaroWinkler(boost_threshold=2).sim_many,
+            'abcd',
+            ['dcba'],
+        )
+
+        # the sim of each pair is the same in either order
+        rng = random.Random(1989)
+        for cmp in (self.jaro, JaroWinkler(qval=2)):
+            for _ in range(100):
+                src = ''.join(
+                    rng.choice('abcd') for _ in range(rng.randint(0, 12))
+                )
+                tars = [
+                    ''.join(
+                        rng.choice('abcd') for _ in range(rng.randint(0, 12))
+                    )
+                    for _ in range(5)
+                ]
+                self.assertEqual(
+                    list(cmp.sim_many(src, tars)),
+                    [cmp.sim(tar, src) for tar in tars],
+                )
+
     def test_dist_jaro_winkler(self):
         """Test abydos.distance.JaroWinkler.dist."""
         self.assertEqual(self.jaro.dist('', ''), 0)
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.LCSseq
 """
 
+import random
 import unittest
 
 from abydos.distance import LCSseq
@@ -69,6 +70,31 @@ class LCSseqTestCases(unittest.TestCase):
         self.assertEqual(self.cmp.lcsseq('cc', 'bbbbcccccc'), 'cc')
         self.assertEqual(self.cmp.lcsseq('ccc', 'bcbb'), 'c')
 
+    def test_lcsseq_len(self):
+        """Test abydos.distance.LCSseq.lcsseq_len."""
+        self.assertEqual(self.cmp.lcsseq_len('', ''), 0)
+        self.assertEqual(self.cmp.lcsseq_len('abc', ''), 0)
+        self.assertEqual(self.cmp.lcsseq_len('', 'abc'), 0)
+        self.assertEqual(self.cmp.lcsseq_len('abc', 'abc'), 3)
+        self.assertEqual(self.cmp.lcsseq_len('abcd', 'efgh'), 0)
+        self.assertEqual(
+            self.cmp.lcsseq_len('thisisatest', 'testing123testing'), 7
+        )
+        self.assertEqual(self.cmp.lcsseq_len('XMJYAUZ', 'MZJAWXU'), 4)
+
+        # compare with the length of the subsequence itself
+        rng = random.Random(1986)
+        for _ in range(200):
+            src = ''.join(
+                rng.choice('abcd') for _ in range(rng.randint(0, 40))
+            )
+            tar = ''.join(
+                rng.choice('abcd') for _ in range(rng.randint(0, 40))
+            )
+            self.assertEqual(
+                self.cmp.lcsseq_len(src, tar), len(self.cmp.lcsseq(src, tar))
+            )
+
     def test_lcsseq_sim(self):
         """Test abydos.distance.LCSseq.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.LCSstr
 """
 
+import random
 import unittest
 
 from abydos.distance import LCSstr
@@ -85,6 +86,29 @@ ACTGCCTGGGAAAAGATCGGCAGCCACGGTGGCGAGTATGGCGCCGAGGCCGT',
             'TGGCGAGTATGG',
         )
 
+        # of equally long substrings, the first to end in src is returned
+        self.assertEqual(self.cmp.lcsstr('abxcd', 'cdyab'), 'ab')
+        self.assertEqual(self.cmp.lcsstr('cdyab', 'abxcd'), 'cd')
+
+        # compare with the dynamic programming table
+        rng = random.Random(1985)
+        for _ in range(300):
+            src = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 30)))
+            tar = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 30)))
+            lengths = [[0] * (len(tar) + 1) for _ in range(len(src) + 1)]
+            longest, src_longest = 0, 0
+            for i in range(1, len(src) + 1):
+                for j in range(1, len(tar) + 1):
+                    if src[i - 1] == tar[j - 1]:
+                        lengths[i][j] = lengths[i - 1][j - 1] + 1
+                        if lengths[i][j] > longest:
+                            longest = lengths[i][j]
+                            src_longest = i
+            self.assertEqual(
+                self.cmp.lcsstr(src, tar),
+                src[src_longest - longest : src_longest],
+            )
+
     def test_lcsstr_sim(self):
         """Test abydos.distance.LCSstr.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.Levenshtein
 """
 
+import random
 import unittest
 
 from abydos.distance import Levenshtein
@@ -167,6 +168,133 @@ class LevenshteinTestCases(unittest.TestCase):
             7.499999999999999,
         )
 
+    def test_levenshtein_bit_parallel(self):
+        """Test abydos.distance.Levenshtein's bit-parallel computation."""
+        self.assertTrue(self.cmp._bit_parallel())
+        self.assertTrue(Levenshtein(mode='osa')._bit_parallel())
+        self.assertTrue(Levenshtein(cost=(1, 1, 1, 5))._bit_parallel())
+        self.assertFalse(
+            Levenshtein(mode='osa', cost=(1, 1, 1, 5))._bit_parallel()
+        )
+        self.assertFalse(Levenshtein(cost=(1, 1, 2, 1))._bit_parallel())
+        self.assertFalse(self.cmp_taper._bit_parallel())
+        self.assertTrue(Levenshtein(vowel_ignorance=True)._bit_parallel())
+        self.assertTrue(
+            Levenshtein(vowel_ignorance_ins_del=True)._bit_parallel()
+        )
+        self.assertFalse(
+            Levenshtein(mode='osa', vowel_ignorance=True)._bit_parallel()
+        )
+        self.assertFalse(
+            Levenshtein(
+                vowel_ignorance=True, cost=(1, 1, 2, 1)
+            )._bit_parallel()
+        )
+
+        # compare with the DP computation, including strings longer than
+        # a machine word
+        rng = random.Random(1966)
+        for cmp in (
+            self.cmp,
+            Levenshtein(mode='osa'),
+            Levenshtein(vowel_ignorance=True),
+            Levenshtein(vowel_ignorance_ins_del=True),
+            Levenshtein(vowel_ignorance=True, vowel_ignorance_ins_del=True),
+        ):
+            for _ in range(50):
+                src = ''.join(
+                    rng.choice('abcde') for _ in range(rng.randint(1, 150))
+                )
+                tar = ''.join(
+                    rng.choice('abcde') for _ in range(rng.randint(1, 150))
+                )
+                self.assertEqual(
+                    cmp.dist_abs(src, tar),
+                    cmp._alignment_matrix(src, tar, backtrace=False)[-1, -1],
+                )
+
+        self.assertEqual(self.cmp.dist_abs('Niall', 'Ni\u00e5ll'), 1)
+        self.assertEqual(
+            Levenshtein(vowel_ignorance=True).dist_abs('Niall', 'Ni\u00e5ll'),
+            0,
+        )
+        self.assertEqual(
+            Levenshtein(vowel_ignorance_ins_del=True).dist_abs('Neal', 'Nl'),
+            0,
+        )
+        self.assertEqual(Levenshtein(mode='osa').dist_abs('ab', 'ba'), 1)
+        self.assertEqual(self.cmp.dist_abs('ab', 'ba'), 2)
+
+    def test_levenshtein_score(self):
+        """Test abydos.distance.Levenshtein's row-wise score."""
+        rng = random.Random(1974)
+        for cmp in (
+            self.cmp_taper,
+            Levenshtein(mode='osa', cost=(2, 1, 3, 0.5)),
+            Levenshtein(vowel_ignorance=True),
+            Levenshtein(vowel_ignorance_ins_del=True),
+        ):
+            for _ in range(50):
+                src = ''.join(
+                    rng.choice('abce') for _ in range(rng.randint(1, 12))
+                )
+                tar = ''.join(
+                    rng.choice('abce') for _ in range(rng.randint(1, 12))
+                )
+                self.assertEqual(
+                    cmp._score(src, tar),
+                    cmp._alignment_matrix(src, tar, backtrace=False)[-1, -1],
+                )
+
+    def test_levenshtein_max_distance(self):
+        """Test abydos.distance.Levenshtein with max_distance."""
+        self.assertEqual(self.cmp.dist_abs('Niall', 'Neil', 3), 3)
+        self.assertEqual(self.cmp.dist_abs('Niall', 'Neil', 2), 3)
+        self.assertEqual(self.cmp.dist_abs('Niall', 'Neil', 0), 1)
+        self.assertEqual(self.cmp.dist_abs('Niall', 'Niall', 0), 0)
+        self.assertEqual(self.cmp.dist_abs('', 'abc', 1), 2)
+        self.assertEqual(self.cmp.dist_abs('abc', '', 1.5), 2.5)
+        self.assertEqual(self.cmp.dist_abs('a' * 100, 'b' * 10, 2), 3)
+        self.assertEqual(self.cmp.dist('Niall', 'Neil', 0.6), 0.6)
+        self.assertGreater(self.cmp.dist('Niall', 'Neil', 0.5), 0.5)
+        self.assertEqual(
+            Levenshtein(mode='osa').dist_abs('ATCG', 'TAGC', 2), 2
+        )
+        self.assertEqual(
+            Levenshtein(cost=(1, 1, 2, 1)).dist_abs('ATCG', 'TAGC', 3), 4
+        )
+
+        # compare with the unbounded computation, for both the bit-parallel
+        # and DP computations
+        rng = random.Random(1985)
+        for cmp in (
+            self.cmp,
+            self.cmp_taper,
+            Levenshtein(mode='osa'),
+            Levenshtein(cost=(1, 1, 2, 1)),
+            Levenshtein(mode='osa', cost=(2, 1, 3, 0.5)),
+            Levenshtein(vowel_ignorance=True),
+            Levenshtein(vowel_ignorance_ins_del=True),
+        ):
+            for _ in range(100):
+                src = ''.join(
+                    rng.choice('abce') for _ in range(rng.randint(0, 12))
+                )
+                tar = ''.join(
+                    rng.choice('abce') for _ in range(rng.randint(0, 12))
+                )
+                dist_abs = cmp.dist_abs(src, tar)
+                for max_distance in (0, 1, 2, 2.5, 5):
+                    if dist_abs <= max_distance:
+                        self.assertAlmostEqual(
+                            cmp.dist_abs(src, tar, max_distance), dist_abs
+                        )
+                    else:
+                        self.assertEqual(
+                            cmp.dist_abs(src, tar, max_distance),
+                            max_distance + 1,
+                        )
+
     def test_levenshtein_dist(self):
         """Test abydos.distance.Levenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
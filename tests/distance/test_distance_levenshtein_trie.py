@@ -0,0 +1,163 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_levenshtein_trie.
+
+This module contains unit tests for abydos.distance.LevenshteinTrie
+"""
+
+import codecs
+import os
+import random
+import tempfile
+import unittest
+
+from abydos.distance import Levenshtein, LevenshteinTrie
+
+from .. import NIALL, _corpus_file
+
+
+class LevenshteinTrieTestCases(unittest.TestCase):
+    """Test LevenshteinTrie functions.
+
+    abydos.distance.LevenshteinTrie
+    """
+
+    with codecs.open(
+        _corpus_file('wikipediaCommonMisspellings.csv'), encoding='utf-8'
+    ) as corpus:
+        next(corpus)
+        misspellings = [line.strip().split(',') for line in corpus]
+    words = sorted({correct for _, correct in misspellings})
+
+    trie = LevenshteinTrie(words)
+
+    def test_levenshtein_trie_add(self):
+        """Test abydos.distance.LevenshteinTrie.add."""
+        trie = LevenshteinTrie()
+        self.assertEqual(len(trie), 0)
+        self.assertNotIn('', trie)
+        self.assertEqual(trie.within('Niall', 5), [])
+        self.assertEqual(trie.nearest('Niall'), [])
+
+        for name in NIALL:
+            trie.add(name)
+        self.assertEqual(len(trie), len(set(NIALL)))
+        trie.add('Niall')
+        self.assertEqual(len(trie), len(set(NIALL)))
+        self.assertIn('Niall', trie)
+        self.assertNotIn('Nial', trie)
+        self.assertNotIn('Niallx', trie)
+        trie.add('')
+        self.assertIn('', trie)
+        self.assertEqual(trie.nearest('N'), [('', 1)])
+
+        self.assertEqual(len(self.trie), len(self.words))
+
+    def test_levenshtein_trie_within(self):
+        """Test abydos.distance.LevenshteinTrie.within."""
+        self.assertEqual(self.trie.within('abandonned', 0), [])
+        self.assertEqual(self.trie.within('abandonned', 1), [('abandoned', 1)])
+        self.assertEqual(self.trie.within('aberration', 0)[0][1], 0)
+
+        lev = Levenshtein()
+        for error, _ in self.misspellings[::250]:
+            dists = [(lev.dist_abs(error, word), word) for word in self.words]
+            for k in range(3):
+                self.assertEqual(
+                    [
+                        (dist, word)
+                        for word, dist in self.trie.within(error, k)
+                    ],
+                    sorted(_ for _ in dists if _[0] <= k),
+                )
+
+        # compare with Levenshtein in each mode & with other costs
+        rng = random.Random(1989)
+        for mode, cost in (
+            ('lev', (1, 1, 1, 1)),
+            ('osa', (1, 1, 1, 1)),
+            ('lev', (2, 1, 3, 1)),
+            ('osa', (1, 2, 1, 0.5)),
+            ('osa', (0, 1, 1, 1)),
+        ):
+            lev = Levenshtein(mode=mode, cost=cost)
+            words = {
+                ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 7)))
+                for _ in range(200)
+            }
+            trie = LevenshteinTrie(words, mode, cost)
+            for _ in range(20):
+                query = ''.join(
+                    rng.choice('abcd') for _ in range(rng.randint(0, 8))
+                )
+                dists = [(lev.dist_abs(query, word), word) for word in words]
+                for k in (0, 1, 2, 3.5):
+                    self.assertEqual(
+                        [(dist, word) for word, dist in trie.within(query, k)],
+                        sorted(_ for _ in dists if _[0] <= k),
+                    )
+                for n in (1, 4, 20):
+                    nearest = trie.nearest(query, n)
+                    self.assertEqual(
+                        [dist for _, dist in nearest],
+                        sorted(dist for dist, _ in dists)[:n],
+                    )
+                    for word, dist in nearest:
+                        self.assertEqual(lev.dist_abs(query, word), dist)
+
+        self.assertEqual(
+            LevenshteinTrie(['ab', 'ba', 'abc'], 'osa').within('ab', 1),
+            [('ab', 0), ('abc', 1), ('ba', 1)],
+        )
+
+    def test_levenshtein_trie_nearest(self):
+        """Test abydos.distance.LevenshteinTrie.nearest."""
+        self.assertEqual(self.trie.nearest('abandonned'), [('abandoned', 1)])
+        self.assertEqual(self.trie.nearest('Niall', 0), [])
+
+        lev = Levenshtein()
+        for error, _ in self.misspellings[::250]:
+            dists = sorted(lev.dist_abs(error, word) for word in self.words)
+            for n in (1, 3, 5):
+                nearest = self.trie.nearest(error, n)
+                for word, dist in nearest:
+                    self.assertEqual(lev.dist_abs(error, word), dist)
+                self.assertEqual([dist for _, dist in nearest], dists[:n])
+
+        trie = LevenshteinTrie(NIALL[:5])
+        self.assertEqual(len(trie.nearest('Niall', 10)), 5)
+
+    def test_levenshtein_trie_save_load(self):
+        """Test abydos.distance.LevenshteinTrie.save_tree & .load_tree."""
+        handle, path = tempfile.mkstemp('.dat')
+        trie = LevenshteinTrie(NIALL, 'osa', (1, 1, 1, 0.5))
+        trie.save_tree(path)
+
+        loaded = LevenshteinTrie()
+        loaded.load_tree(path)
+        self.assertEqual(len(loaded), len(trie))
+        for name in ('Niall', 'Nial', 'Colin'):
+            self.assertEqual(loaded.within(name, 3), trie.within(name, 3))
+            self.assertEqual(loaded.nearest(name, 4), trie.nearest(name, 4))
+        self.assertEqual(loaded.within('Naill', 0.5), [('Niall', 0.5)])
+
+        os.close(handle)
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.distance.MinHash
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import MinHash
 
 
@@ -36,35 +38,66 @@ class MinHashTestCases(unittest.TestCase):
         """Test abydos.distance.MinHash.sim."""
         # Base cases
         self.assertEqual(self.cmp.sim('', ''), 1.0)
-        self.assertEqual(self.cmp.sim('a', ''), 0.5)
-        self.assertEqual(self.cmp.sim('', 'a'), 0.5)
-        self.assertEqual(self.cmp.sim('abc', ''), 0.75)
-        self.assertEqual(self.cmp.sim('', 'abc'), 0.75)
+        self.assertEqual(self.cmp.sim('a', ''), 0.0)
+        self.assertEqual(self.cmp.sim('', 'a'), 0.0)
+        self.assertEqual(self.cmp.sim('abc', ''), 0.0)
+        self.assertEqual(self.cmp.sim('', 'abc'), 0.0)
         self.assertEqual(self.cmp.sim('abc', 'abc'), 1.0)
-        self.assertEqual(self.cmp.sim('abcd', 'efgh'), 0.6)
+        self.assertEqual(self.cmp.sim('abcd', 'efgh'), 0.0)
 
-        self.assertAlmostEqual(self.cmp.sim('Nigel', 'Niall'), 1.0)
-        self.assertAlmostEqual(self.cmp.sim('Niall', 'Nigel'), 1.0)
+        self.assertAlmostEqual(self.cmp.sim('Nigel', 'Niall'), 1 / 3)
+        self.assertAlmostEqual(self.cmp.sim('Niall', 'Nigel'), 1 / 3)
         self.assertAlmostEqual(self.cmp.sim('Colin', 'Coiln'), 0.5)
         self.assertAlmostEqual(self.cmp.sim('Coiln', 'Colin'), 0.5)
-        self.assertAlmostEqual(self.cmp.sim('ATCAACGAGT', 'AACGATTAG'), 1.0)
+        self.assertAlmostEqual(self.cmp.sim('ATCAACGAGT', 'AACGATTAG'), 4 / 11)
 
     def test_minhash_dist(self):
         """Test abydos.distance.MinHash.dist."""
         # Base cases
         self.assertEqual(self.cmp.dist('', ''), 0.0)
-        self.assertEqual(self.cmp.dist('a', ''), 0.5)
-        self.assertEqual(self.cmp.dist('', 'a'), 0.5)
-        self.assertEqual(self.cmp.dist('abc', ''), 0.25)
-        self.assertEqual(self.cmp.dist('', 'abc'), 0.25)
+        self.assertEqual(self.cmp.dist('a', ''), 1.0)
+        self.assertEqual(self.cmp.dist('', 'a'), 1.0)
+        self.assertEqual(self.cmp.dist('abc', ''), 1.0)
+        self.assertEqual(self.cmp.dist('', 'abc'), 1.0)
         self.assertEqual(self.cmp.dist('abc', 'abc'), 0.0)
-        self.assertEqual(self.cmp.dist('abcd', 'efgh'), 0.4)
+        self.assertEqual(self.cmp.dist('abcd', 'efgh'), 1.0)
 
-        self.assertAlmostEqual(self.cmp.dist('Nigel', 'Niall'), 0.0)
-        self.assertAlmostEqual(self.cmp.dist('Niall', 'Nigel'), 0.0)
+        self.assertAlmostEqual(self.cmp.dist('Nigel', 'Niall'), 2 / 3)
+        self.assertAlmostEqual(self.cmp.dist('Niall', 'Nigel'), 2 / 3)
         self.assertAlmostEqual(self.cmp.dist('Colin', 'Coiln'), 0.5)
         self.assertAlmostEqual(self.cmp.dist('Coiln', 'Colin'), 0.5)
-        self.assertAlmostEqual(self.cmp.dist('ATCAACGAGT', 'AACGATTAG'), 0.0)
+        self.assertAlmostEqual(
+            self.cmp.dist('ATCAACGAGT', 'AACGATTAG'), 7 / 11
+        )
+
+    def test_minhash_signature(self):
+        """Test abydos.distance.MinHash.signature."""
+        self.assertRaises(ValueError, self.cmp.signature, 'Niall')
+
+        cmp = MinHash(k=256)
+        sig = cmp.signature('Niall')
+        self.assertEqual(sig.shape, (256,))
+        self.assertEqual(sig.dtype, np.uint64)
+        self.assertTrue(np.array_equal(sig, cmp.signature('Niall')))
+        self.assertTrue(np.array_equal(sig, MinHash(k=256).signature('Niall')))
+        self.assertFalse(
+            np.array_equal(sig, MinHash(k=256, seed=1).signature('Niall'))
+        )
+        self.assertTrue(
+            np.array_equal(
+                cmp.signature(''), np.full(256, 2 ** 64 - 1, dtype=np.uint64)
+            )
+        )
+
+        # signatures agree on the proportion of hash functions expected for
+        # the Jaccard similarity of the token sets (here 1/3)
+        self.assertAlmostEqual(
+            float(np.mean(sig == cmp.signature('Nigel'))), 1 / 3, delta=0.1
+        )
+        self.assertEqual(
+            cmp.sim('Niall', 'Nigel'),
+            float(np.mean(sig == cmp.signature('Nigel'))),
+        )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,115 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_minhash_lsh.
+
+This module contains unit tests for abydos.distance.MinHashLSH
+"""
+
+import codecs
+import unittest
+
+from abydos.distance import Jaccard, MinHash, MinHashLSH
+from abydos.tokenizer import WhitespaceTokenizer
+
+from .. import NIALL, _corpus_file
+
+
+class MinHashLSHTestCases(unittest.TestCase):
+    """Test MinHashLSH functions.
+
+    abydos.distance.MinHashLSH
+    """
+
+    with codecs.open(
+        _corpus_file('wikipediaCommonMisspellings.csv'), encoding='utf-8'
+    ) as corpus:
+        next(corpus)
+        misspellings = [line.strip().split(',') for line in corpus]
+    words = sorted({correct for _, correct in misspellings})
+
+    def test_minhash_lsh_init(self):
+        """Test abydos.distance.MinHashLSH.__init__."""
+        self.assertRaises(ValueError, MinHashLSH, 0)
+        self.assertRaises(ValueError, MinHashLSH, 4, 0)
+        lsh = MinHashLSH(4, 3, seed=5)
+        self.assertEqual(lsh._minhash._k, 12)
+        self.assertEqual(lsh._minhash._seed, 5)
+        self.assertEqual(len(lsh._buckets), 4)
+
+        tokenizer = WhitespaceTokenizer()
+        self.assertIs(
+            MinHashLSH(tokenizer=tokenizer)._minhash.params['tokenizer'],
+            tokenizer,
+        )
+        self.assertEqual(
+            MinHashLSH(qval=3)._minhash.params['tokenizer'].qval, 3
+        )
+
+    def test_minhash_lsh_insert_query(self):
+        """Test abydos.distance.MinHashLSH.insert & .query."""
+        lsh = MinHashLSH()
+        self.assertEqual(lsh.query('Niall'), [])
+        for num, name in enumerate(NIALL):
+            lsh.insert(num, name)
+        self.assertEqual(len(lsh), len(NIALL))
+
+        # identical strings always share every bucket, & keys are returned
+        # once each, in the order inserted
+        self.assertEqual(
+            lsh.query('Niall'),
+            [num for num, name in enumerate(NIALL) if name == 'Niall'],
+        )
+        lsh.insert('x', '')
+        lsh.insert('y', '')
+        self.assertEqual(lsh.query(''), ['x', 'y'])
+
+        # the candidates include the correct spellings of the misspellings
+        # with high similarity, & are a small part of the index
+        lsh = MinHashLSH(bands=32, rows=4)
+        for word in self.words:
+            lsh.insert(word, word)
+        jac = Jaccard()
+        found = missed = candidates = 0
+        for error, correct in self.misspellings[::20]:
+            keys = lsh.query(error)
+            candidates += len(keys)
+            if jac.sim(error, correct) >= 0.7:
+                if correct in keys:
+                    found += 1
+                else:
+                    missed += 1
+        self.assertGreater(found, 100)
+        self.assertLess(missed, found / 20)
+        self.assertLess(
+            candidates / len(self.misspellings[::20]), len(self.words) / 100
+        )
+
+        # two strings share a bucket if their signatures agree in any band
+        lsh = MinHashLSH(bands=8, rows=4)
+        cmp = MinHash(k=32)
+        lsh.insert(0, 'Christopher')
+        for name in NIALL + ('Christophe', 'Kristopher', 'Cristofer'):
+            sig = cmp.signature(name).reshape(8, 4)
+            other = cmp.signature('Christopher').reshape(8, 4)
+            self.assertEqual(
+                lsh.query(name),
+                [0] if (sig == other).all(axis=1).any() else [],
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -87,6 +87,19 @@ class NCDarithTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.sim('Njáll', 'Njall'), 0.25)
         self.assertAlmostEqual(self.cmp.sim('Njall', 'Njáll'), 0.25)
 
+    def test_ncd_arith_dist_many(self):
+        """Test abydos.distance.NCDarith.dist_many."""
+        for cmp in (self.cmp, self.cmp_probs):
+            dists = cmp.dist_many('Niall', NIALL)
+            self.assertEqual(dists.shape, (len(NIALL),))
+            for dist, tar in zip(dists, NIALL):
+                self.assertEqual(dist, cmp.dist('Niall', tar))
+            self.assertEqual(
+                list(cmp.sim_many('Niall', NIALL)), list(1.0 - dists)
+            )
+        self.assertEqual(len(self.cmp._cache), 0)
+        self.assertGreater(len(self.cmp_probs._cache), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
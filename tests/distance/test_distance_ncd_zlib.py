@@ -23,6 +23,8 @@ import unittest
 
 from abydos.distance import NCDzlib
 
+from .. import NIALL
+
 
 class CompressionTestCases(unittest.TestCase):
     """Test compression distance functions.
@@ -44,6 +46,35 @@ class CompressionTestCases(unittest.TestCase):
         self.assertLess(self.cmp.sim('a', ''), 1)
         self.assertAlmostEqual(self.cmp.sim('abcdefg', 'fg'), 0.46153846153846)
 
+    def test_ncd_zlib_dist_many(self):
+        """Test abydos.distance.NCDzlib.dist_many."""
+        for cmp in (self.cmp, NCDzlib(0), NCDzlib(9)):
+            for query in ('Niall', '', ' '.join(NIALL)):
+                dists = cmp.dist_many(query, iter(NIALL + ('',)))
+                self.assertEqual(
+                    list(dists),
+                    [cmp.dist(query, tar) for tar in NIALL + ('',)],
+                )
+                self.assertEqual(
+                    list(cmp.sim_many(query, NIALL)),
+                    [cmp.sim(query, tar) for tar in NIALL],
+                )
+        self.assertEqual(self.cmp.dist_many('Niall', []).shape, (0,))
+
+    def test_ncd_zlib_cache(self):
+        """Test abydos.distance.NCDzlib compressed length cache."""
+        cmp = NCDzlib(cache_size=3)
+        cmp.dist('Niall', 'Neil')
+        cmp.dist('Niall', 'Nigel')
+        self.assertEqual(list(cmp._cache), ['Neil', 'Niall', 'Nigel'])
+        cmp.dist('Colin', 'Neil')
+        self.assertEqual(list(cmp._cache), ['Nigel', 'Colin', 'Neil'])
+        self.assertAlmostEqual(cmp.dist('abcdefg', 'fg'), 0.5384615384615)
+
+        cmp = NCDzlib(cache_size=0)
+        self.assertAlmostEqual(cmp.dist('abcdefg', 'fg'), 0.5384615384615)
+        self.assertEqual(len(cmp._cache), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.NeedlemanWunsch
 """
 
+import random
 import unittest
 
 from abydos.distance import NeedlemanWunsch
@@ -79,6 +80,49 @@ def _sim_nw(src, tar):
     return 2 * int(src is tar) - 1
 
 
+def _nw_reference(src, tar, gap_cost, sim_func, local=False):
+    """Return the Needleman-Wunsch (or Smith-Waterman) score, cell by cell."""
+    floor = 0 if local else float('-inf')
+    d_mat = [[0.0] * (len(tar) + 1) for _ in range(len(src) + 1)]
+    for i in range(len(src) + 1):
+        for j in range(len(tar) + 1):
+            if i and j:
+                d_mat[i][j] = max(
+                    floor,
+                    d_mat[i - 1][j - 1] + sim_func(src[i - 1], tar[j - 1]),
+                    d_mat[i - 1][j] - gap_cost,
+                    d_mat[i][j - 1] - gap_cost,
+                )
+            elif not local:
+                d_mat[i][j] = -(i + j) * gap_cost
+    return d_mat[-1][-1]
+
+
+def _gotoh_reference(src, tar, gap_open, gap_ext, sim_func):
+    """Return the Gotoh score, cell by cell."""
+    inf = float('-inf')
+    d_mat = [[inf] * (len(tar) + 1) for _ in range(len(src) + 1)]
+    p_mat = [[inf] * (len(tar) + 1) for _ in range(len(src) + 1)]
+    q_mat = [[inf] * (len(tar) + 1) for _ in range(len(src) + 1)]
+    d_mat[0][0] = 0.0
+    for i in range(1, len(src) + 1):
+        p_mat[i][0] = -gap_open - gap_ext * (i - 1)
+    for j in range(1, len(tar) + 1):
+        q_mat[0][j] = -gap_open - gap_ext * (j - 1)
+    for i in range(1, len(src) + 1):
+        for j in range(1, len(tar) + 1):
+            d_mat[i][j] = sim_func(src[i - 1], tar[j - 1]) + max(
+                d_mat[i - 1][j - 1], p_mat[i - 1][j - 1], q_mat[i - 1][j - 1]
+            )
+            p_mat[i][j] = max(
+                d_mat[i - 1][j] - gap_open, p_mat[i - 1][j] - gap_ext
+            )
+            q_mat[i][j] = max(
+                d_mat[i][j - 1] - gap_open, q_mat[i][j - 1] - gap_ext
+            )
+    return max(d_mat[-1][-1], p_mat[-1][-1], q_mat[-1][-1])
+
+
 class MatrixSimTestCases(unittest.TestCase):
     """Test matrix similarity functions.
 
@@ -150,6 +194,43 @@ class NeedlemanWunschTestCases(unittest.TestCase):
         for i in range(len(NIALL)):
             self.assertEqual(nw2.sim_score(NIALL[0], NIALL[i]), nw_vals[i])
 
+    def test_needleman_wunsch_sim_score_many(self):
+        """Test abydos.distance.NeedlemanWunsch.sim_score_many & .sim_many."""
+        dna = ('AGACTAGTTAC', 'CGAGACGT', 'TGACGT', 'GATTACA', '')
+        for cmp, strings in (
+            (NeedlemanWunsch(), NIALL),
+            (NeedlemanWunsch(5, _sim_wikipedia), dna),
+        ):
+            for query in ('',) + strings[:3]:
+                scores = cmp.sim_score_many(query, iter(strings))
+                self.assertEqual(scores.shape, (len(strings),))
+                self.assertEqual(
+                    list(scores),
+                    [cmp.sim_score(query, tar) for tar in strings],
+                )
+            self.assertEqual(
+                list(cmp.sim_many(strings[0], strings[:4])),
+                [cmp.sim(strings[0], tar) for tar in strings[:4]],
+            )
+        self.assertEqual(
+            NeedlemanWunsch().sim_score_many('Niall', []).shape, (0,)
+        )
+
+        # compare long strings with a cell-by-cell alignment
+        rng = random.Random(1970)
+        cmp = NeedlemanWunsch(2, _sim_wikipedia)
+        for _ in range(10):
+            src = ''.join(
+                rng.choice('ACGT') for _ in range(rng.randint(0, 60))
+            )
+            tar = ''.join(
+                rng.choice('ACGT') for _ in range(rng.randint(0, 60))
+            )
+            self.assertAlmostEqual(
+                cmp.sim_score(src, tar),
+                _nw_reference(src, tar, 2, _sim_wikipedia),
+            )
+
     def test_needleman_wunsch_sim(self):
         """Test abydos.distance.NeedlemanWunsch.sim."""
         self.assertEqual(NeedlemanWunsch().sim('', ''), 1.0)
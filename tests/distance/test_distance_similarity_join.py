@@ -0,0 +1,140 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_similarity_join.
+
+This module contains unit tests for abydos.distance.SimilarityJoin
+"""
+
+import random
+import unittest
+from collections import Counter
+from math import log1p
+
+from abydos.distance import (
+    Cosine,
+    Dice,
+    Jaccard,
+    Levenshtein,
+    Overlap,
+    SimilarityJoin,
+    Tversky,
+)
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
+
+from .. import NIALL
+
+
+class SimilarityJoinTestCases(unittest.TestCase):
+    """Test SimilarityJoin functions.
+
+    abydos.distance.SimilarityJoin
+    """
+
+    def _brute_force(self, measure, left, right, threshold):
+        if right is None:
+            pairs = [
+                (i, j)
+                for i in range(len(left))
+                for j in range(i + 1, len(left))
+            ]
+            right = left
+        else:
+            pairs = [
+                (i, j) for i in range(len(left)) for j in range(len(right))
+            ]
+        sims = [(i, j, measure.sim(left[i], right[j])) for i, j in pairs]
+        return [(i, j, sim) for i, j, sim in sims if sim >= threshold]
+
+    def test_similarity_join_init(self):
+        """Test abydos.distance.SimilarityJoin.__init__."""
+        self.assertIsInstance(SimilarityJoin()._measure, Jaccard)
+        self.assertRaises(ValueError, SimilarityJoin, Levenshtein())
+        self.assertRaises(ValueError, SimilarityJoin, Tversky(bias=0.5))
+        self.assertRaises(
+            ValueError, SimilarityJoin, Jaccard(intersection_type='soft')
+        )
+        self.assertRaises(
+            ValueError, SimilarityJoin, Jaccard(normalizer='proportional')
+        )
+        self.assertRaises(
+            ValueError,
+            SimilarityJoin(Jaccard(tokenizer=QGrams(scaler=log1p))).join,
+            NIALL,
+        )
+        self.assertRaises(ValueError, SimilarityJoin().join, NIALL, None, 0)
+
+    def test_similarity_join_join(self):
+        """Test abydos.distance.SimilarityJoin.join."""
+        sj = SimilarityJoin()
+        self.assertEqual(sj.join([]), [])
+        self.assertEqual(sj.join(NIALL, []), [])
+        self.assertEqual(
+            sj.join(['Niall', 'Neil', 'Nigel'], ['Neal', 'Nail', 'Niall']),
+            [(0, 2, 1.0)],
+        )
+        self.assertEqual(
+            sj.join(['', 'Niall', '', 'Niall'], threshold=1.0),
+            [(0, 2, 1.0), (1, 3, 1.0)],
+        )
+        self.assertEqual(
+            sj.join(iter(NIALL), iter(NIALL), 0.5),
+            self._brute_force(Jaccard(), NIALL, NIALL, 0.5),
+        )
+        self.assertEqual(
+            sj.join([Counter({'a': 2}), Counter({'a': 1})], threshold=0.5),
+            [(0, 1, 0.5)],
+        )
+
+        # compare with every pair of strings, for each measure
+        rng = random.Random(1877)
+        for measure in (
+            Jaccard(),
+            Dice(),
+            Cosine(),
+            Overlap(),
+            Tversky(alpha=0.2, beta=0.8),
+            Jaccard(qval=1),
+            Jaccard(tokenizer=QGrams(qval=3, scaler='set')),
+            Dice(tokenizer=WhitespaceTokenizer()),
+        ):
+            sj = SimilarityJoin(measure)
+            for _ in range(3):
+                left = [
+                    ''.join(
+                        rng.choice('aabcd ') for _ in range(rng.randint(0, 9))
+                    )
+                    for _ in range(20)
+                ]
+                right = [
+                    ''.join(
+                        rng.choice('aabcd ') for _ in range(rng.randint(0, 9))
+                    )
+                    for _ in range(15)
+                ]
+                for threshold in (0.2, 0.5, 0.8, 1.0):
+                    self.assertEqual(
+                        sj.join(left, right, threshold),
+                        self._brute_force(measure, left, right, threshold),
+                    )
+                    self.assertEqual(
+                        sj.join(left, threshold=threshold),
+                        self._brute_force(measure, left, None, threshold),
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,11 +19,16 @@
 This module contains unit tests for abydos.distance.SmithWaterman
 """
 
+import random
 import unittest
 
 from abydos.distance import SmithWaterman
 
-from .test_distance_needleman_wunsch import _sim_nw, _sim_wikipedia
+from .test_distance_needleman_wunsch import (
+    _nw_reference,
+    _sim_nw,
+    _sim_wikipedia,
+)
 from .. import NIALL
 
 
@@ -60,6 +65,43 @@ class SmithWatermanTestCases(unittest.TestCase):
         for i in range(len(NIALL)):
             self.assertEqual(sw2.sim_score(NIALL[0], NIALL[i]), sw_vals[i])
 
+    def test_smith_waterman_sim_score_many(self):
+        """Test abydos.distance.SmithWaterman.sim_score_many & .sim_many."""
+        dna = ('AGACTAGTTAC', 'CGAGACGT', 'TGACGT', 'GATTACA', '')
+        for cmp, strings in (
+            (SmithWaterman(), NIALL),
+            (SmithWaterman(5, _sim_wikipedia), dna),
+        ):
+            for query in ('',) + strings[:3]:
+                scores = cmp.sim_score_many(query, iter(strings))
+                self.assertEqual(scores.shape, (len(strings),))
+                self.assertEqual(
+                    list(scores),
+                    [cmp.sim_score(query, tar) for tar in strings],
+                )
+            self.assertEqual(
+                list(cmp.sim_many(strings[0], strings[:4])),
+                [cmp.sim(strings[0], tar) for tar in strings[:4]],
+            )
+        self.assertEqual(
+            SmithWaterman().sim_score_many('Niall', []).shape, (0,)
+        )
+
+        # compare long strings with a cell-by-cell alignment
+        rng = random.Random(1970)
+        cmp = SmithWaterman(2, _sim_wikipedia)
+        for _ in range(10):
+            src = ''.join(
+                rng.choice('ACGT') for _ in range(rng.randint(0, 60))
+            )
+            tar = ''.join(
+                rng.choice('ACGT') for _ in range(rng.randint(0, 60))
+            )
+            self.assertAlmostEqual(
+                cmp.sim_score(src, tar),
+                _nw_reference(src, tar, 2, _sim_wikipedia, True),
+            )
+
     def test_smith_waterman_sim(self):
         """Test abydos.distance.SmithWaterman.sim."""
         self.assertEqual(SmithWaterman().sim('', ''), 1.0)
@@ -51,6 +51,16 @@ class YujianBoTestCases(unittest.TestCase):
             self.cmp.dist('ATCAACGAGT', 'AACGATTAG'), 0.4166666667
         )
 
+    def test_yujian_bo_max_distance(self):
+        """Test abydos.distance.YujianBo with max_distance."""
+        self.assertAlmostEqual(
+            self.cmp.dist('Niall', 'Neil', 0.5), self.cmp.dist('Niall', 'Neil')
+        )
+        self.assertGreater(self.cmp.dist('Niall', 'Neil', 0.4), 0.4)
+        self.assertAlmostEqual(
+            self.cmp.dist('Niall', 'Neil', 2), self.cmp.dist('Niall', 'Neil')
+        )
+
     def test_yujian_bo_sim(self):
         """Test abydos.distance.YujianBo.sim."""
         # Base cases
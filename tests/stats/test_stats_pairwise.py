@@ -20,6 +20,7 @@ This module contains unit tests for abydos.stats pairwise functions
 """
 
 import unittest
+from math import isnan
 
 from abydos.distance import Jaccard, JaroWinkler
 from abydos.stats import (
@@ -27,8 +28,11 @@ from abydos.stats import (
     gmean,
     hmean,
     mean_pairwise_similarity,
+    median,
     pairwise_similarity_statistics,
+    std,
 )
+from abydos.stats._pairwise import _PairwiseAccumulator  # noqa: I100
 
 NIALL = (
     'Niall',
@@ -67,6 +71,11 @@ NIALL_1WORD = (
 )
 
 
+def _nan_or(value):
+    """Return value, or a string if it is NaN, so that NaNs compare equal."""
+    return 'NaN' if isnan(value) else value
+
+
 class MPSTestCases(unittest.TestCase):
     """Test mean pairwise similarity functions.
 
@@ -148,6 +157,43 @@ class MPSTestCases(unittest.TestCase):
             mean_pairwise_similarity(set(NIALL)),
         )
 
+    def test_mean_pairwise_similarity_workers(self):
+        """Test abydos.stats.mean_pairwise_similarity with workers."""
+        cmp = JaroWinkler()
+        for mean_func in (amean, gmean, hmean, median):
+            for symmetric in (False, True):
+                self.assertAlmostEqual(
+                    _nan_or(
+                        mean_pairwise_similarity(
+                            NIALL, mean_func=mean_func, symmetric=symmetric
+                        )
+                    ),
+                    _nan_or(
+                        mean_pairwise_similarity(
+                            NIALL,
+                            mean_func=mean_func,
+                            symmetric=symmetric,
+                            workers=2,
+                        )
+                    ),
+                )
+                self.assertAlmostEqual(
+                    _nan_or(
+                        mean_pairwise_similarity(
+                            NIALL, cmp.sim, mean_func, symmetric
+                        )
+                    ),
+                    _nan_or(
+                        mean_pairwise_similarity(
+                            NIALL, cmp.sim, mean_func, symmetric, workers=None
+                        )
+                    ),
+                )
+        self.assertEqual(
+            mean_pairwise_similarity(['Niall', 'Neil'], workers=3),
+            mean_pairwise_similarity(['Niall', 'Neil']),
+        )
+
 
 class PSSTestCases(unittest.TestCase):
     """Test pairwise similarity statistics functions.
@@ -199,6 +245,66 @@ class PSSTestCases(unittest.TestCase):
         self.assertAlmostEqual(pw_mean, 0.08499999999999999)
         self.assertAlmostEqual(pw_std, 0.16132265804901677)
 
+        self.assertRaises(
+            ValueError, pairwise_similarity_statistics, NIALL, []
+        )
+
+    def test_pairwise_similarity_statistics_workers(self):
+        """Test abydos.stats.pairwise_similarity_statistics with workers."""
+        cmp = Jaccard()
+        for mean_func in (amean, gmean, hmean, median):
+            for symmetric in (False, True):
+                serial = pairwise_similarity_statistics(
+                    NIALL, NIALL_1WORD, cmp.sim, mean_func, symmetric
+                )
+                parallel = pairwise_similarity_statistics(
+                    NIALL, NIALL_1WORD, cmp.sim, mean_func, symmetric, 3
+                )
+                for serial_val, parallel_val in zip(serial, parallel):
+                    self.assertAlmostEqual(
+                        _nan_or(serial_val), _nan_or(parallel_val)
+                    )
+
+
+class PairwiseAccumulatorTestCases(unittest.TestCase):
+    """Test the streaming reduction of pairwise similarities.
+
+    abydos.stats._pairwise._PairwiseAccumulator
+    """
+
+    def test_pairwise_accumulator(self):
+        """Test abydos.stats._pairwise._PairwiseAccumulator."""
+        samples = (
+            [0.25, 0.5, 0.125, 1.0, 0.75, 0.5],
+            [0.5, 0.0, 0.25],
+            [0.0, 0.0, 0.25, 0.5],
+            [0.4, 0.4, 0.4],
+            [0.0, 0.0],
+            [0.7],
+        )
+        for values in samples:
+            for split in range(len(values) + 1):
+                acc = _PairwiseAccumulator()
+                for val in values[:split]:
+                    acc.add(val)
+                other = _PairwiseAccumulator()
+                for val in values[split:]:
+                    other.add(val)
+                acc.merge(other)
+
+                self.assertEqual(acc.count, len(values))
+                self.assertEqual(acc.max, max(values))
+                self.assertEqual(acc.min, min(values))
+                for mean_func in (amean, gmean, hmean):
+                    self.assertAlmostEqual(
+                        _nan_or(acc.mean(mean_func)),
+                        _nan_or(mean_func(values)),
+                    )
+                    self.assertAlmostEqual(
+                        _nan_or(acc.std(mean_func)),
+                        _nan_or(std(values, mean_func, 0)),
+                    )
+
         (pw_max, pw_min, pw_mean, pw_std) = pairwise_similarity_statistics(
             'The', 'jumped'
         )
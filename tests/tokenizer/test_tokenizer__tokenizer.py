@@ -23,8 +23,20 @@ import sys
 import unittest
 from collections import Counter
 from math import log1p
+from threading import Thread
 
-from abydos.tokenizer import QGrams, QSkipgrams, _Tokenizer
+import numpy as np
+
+from abydos.tokenizer import (
+    CVClusterTokenizer,
+    QGrams,
+    QSkipgrams,
+    SAPSTokenizer,
+    WhitespaceTokenizer,
+    _Tokenizer,
+)
+
+from .. import NIALL
 
 
 class TokenizerTestCases(unittest.TestCase):
@@ -180,6 +192,111 @@ class TokenizerTestCases(unittest.TestCase):
         nelson_entropy = QSkipgrams(scaler='entropy').tokenize('NELSON')
         self.assertAlmostEqual(nelson_entropy.count(), 4.6644977792)
 
+    def test__tokenizer_pure(self):
+        """Test abydos.tokenizer._Tokenizer.tokenize_to_counter & related."""
+        tokenizers = (
+            _Tokenizer(),
+            QGrams(),
+            QGrams((1, 3), skip=(0, 1), scaler='length'),
+            QSkipgrams(scaler='SSK'),
+            QSkipgrams(qval=3, scaler='entropy'),
+            WhitespaceTokenizer(scaler='set'),
+            SAPSTokenizer(scaler=log1p),
+            CVClusterTokenizer(),
+        )
+        strings = NIALL + ('', 'seven-twelfths', 'a b c f a c g e a b')
+        for tokenizer in tokenizers:
+            for string in strings:
+                counter = tokenizer.tokenize_to_counter(string)
+                tokens = tokenizer.tokenize_to_list(string)
+                tokenizer.tokenize(string)
+                self.assertEqual(counter, tokenizer.get_counter())
+                self.assertEqual(tokens, tokenizer.get_list())
+            self.assertEqual(
+                list(tokenizer.tokenize_many(iter(strings))),
+                [tokenizer.tokenize_to_counter(_) for _ in strings],
+            )
+
+        # nothing is stored on the tokenizer
+        qgrams = QGrams()
+        qgrams.tokenize('Niall')
+        qgrams.tokenize_to_counter('Neil')
+        qgrams.tokenize_to_list('Nigel')
+        list(qgrams.tokenize_many(['Neal', 'Nail']))
+        self.assertEqual(qgrams._string, 'Niall')
+        self.assertEqual(
+            qgrams.get_list(), ['$N', 'Ni', 'ia', 'al', 'll', 'l#']
+        )
+        self.assertEqual(qgrams.qval, 2)
+
+        # so a single tokenizer may be shared among threads
+        results = {}
+
+        def _tokenize_all(num):
+            results[num] = [qgrams.tokenize_to_counter(_) for _ in NIALL]
+
+        threads = [Thread(target=_tokenize_all, args=(_,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for num in range(4):
+            self.assertEqual(
+                results[num],
+                [QGrams().tokenize(_).get_counter() for _ in NIALL],
+            )
+
+    def test__tokenizer_hashes(self):
+        """Test abydos.tokenizer._Tokenizer.tokenize_to_hashes."""
+        tokenizers = (
+            _Tokenizer(),
+            QGrams(hashed=True),
+            QGrams(qval=(1, 3), skip=(0, 2), scaler='set'),
+            QGrams(start_stop='', scaler=log1p),
+            QGrams(scaler='length'),
+            QSkipgrams(scaler='SSK'),
+            WhitespaceTokenizer(scaler='set'),
+        )
+        strings = NIALL + ('', 'a b c f a c g e a b', 'ça\U0001f600')
+        whole = _Tokenizer()
+        for tokenizer in tokenizers:
+            for string in strings:
+                counter = tokenizer.tokenize_to_counter(string)
+                hashes, counts = tokenizer.tokenize_to_hashes(string)
+                self.assertEqual(hashes.dtype, np.uint64)
+                self.assertEqual(len(hashes), len(counter))
+                self.assertTrue((hashes[1:] > hashes[:-1]).all())
+                # each token's hash (i.e. the hash of a string that is its
+                # own only token) is paired with the token's count, but
+                # QGrams hash most q-grams from their code points
+                if (
+                    isinstance(tokenizer, QGrams)
+                    and tokenizer._scaler != 'length'  # noqa: SF01
+                ):
+                    token_hashes = {
+                        tok: QGrams._hash_q_grams(  # noqa: SF01
+                            tok, len(tok), 0
+                        )[0].item()
+                        for tok in counter
+                    }
+                else:
+                    token_hashes = {
+                        tok: whole.tokenize_to_hashes(tok)[0][0].item()
+                        for tok in counter
+                    }
+                self.assertEqual(
+                    dict(zip(hashes.tolist(), counts.tolist())),
+                    {
+                        token_hashes[tok]: count
+                        for tok, count in counter.items()
+                    },
+                )
+                # integer counts remain ints
+                self.assertEqual(
+                    {type(count) for count in counts.tolist()},
+                    {type(count) for count in counter.values()},
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
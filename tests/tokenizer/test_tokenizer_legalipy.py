@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import pickle
 import unittest
 
 from abydos.tokenizer import LegaliPyTokenizer
@@ -89,6 +90,73 @@ class LegaliPyTokenizerTestCases(unittest.TestCase):
             sorted(['ca', 'ter', 'pil', 'lars']),
         )
 
+    def test_legalipy_tokenizer_train_onsets(self):
+        """Test abydos.tokenizer.LegaliPyTokenizer.train_onsets."""
+        try:
+            from syllabipy.legalipy import getOnsets
+        except ImportError:  # pragma: no cover
+            return
+
+        with open(_corpus_file('misspellings.csv')) as corpus:
+            text = corpus.read()
+
+        # training on the lines of a file matches training on its text
+        for clean in (True, False):
+            tok = LegaliPyTokenizer()
+            tok.train_onsets(text, clean=clean)
+            self.assertEqual(
+                tok.get_onsets(), frozenset(getOnsets(text, clean=clean))
+            )
+            streamed = LegaliPyTokenizer()
+            with open(_corpus_file('misspellings.csv')) as corpus:
+                streamed.train_onsets(corpus, clean=clean)
+            self.assertEqual(streamed.get_onsets(), tok.get_onsets())
+
+        tok = LegaliPyTokenizer()
+        tok.train_onsets(['ready', 'steady', 'go'], threshold=0.3)
+        self.assertEqual(tok.get_onsets(), {'r', 'st', 'g'})
+        tok.train_onsets('bravo', append=True)
+        self.assertEqual(tok.get_onsets(), {'r', 'st', 'g', 'br'})
+
+    def test_legalipy_tokenizer_cache(self):
+        """Test abydos.tokenizer.LegaliPyTokenizer syllable cache."""
+        try:
+            from syllabipy.legalipy import LegaliPy  # noqa: F401
+        except ImportError:  # pragma: no cover
+            return
+
+        tok = LegaliPyTokenizer(cache_size=2)
+        tok.train_onsets('son sun lark nest pin spec tack cure')
+        tok.tokenize('nelson nelson peninsular')
+        info = tok._syllabify.cache_info()  # noqa: SF01
+        self.assertEqual((info.hits, info.misses), (1, 2))
+        self.assertEqual(
+            tok.get_list(),
+            ['nel', 'son', 'nel', 'son', 'pe', 'nin', 'su', 'lar'],
+        )
+        tok.tokenize('spectacular nelson')
+        info = tok._syllabify.cache_info()  # noqa: SF01
+        self.assertEqual((info.misses, info.currsize), (4, 2))
+
+        # retraining clears the cache
+        tok.train_onsets('nelson', append=True)
+        self.assertEqual(tok._syllabify.cache_info().currsize, 0)  # noqa: SF01
+
+        # without a cache, the syllables are the same
+        uncached = LegaliPyTokenizer(cache_size=0)
+        uncached.train_onsets('son sun lark nest pin spec tack cure')
+        self.assertEqual(
+            uncached.tokenize('nelson peninsular').get_list(),
+            tok.tokenize('nelson peninsular').get_list(),
+        )
+
+        copy = pickle.loads(pickle.dumps(tok))
+        self.assertEqual(copy.get_onsets(), tok.get_onsets())
+        self.assertEqual(
+            copy.tokenize('spectacular').get_list(),
+            tok.tokenize('spectacular').get_list(),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
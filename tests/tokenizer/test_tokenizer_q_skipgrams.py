@@ -19,8 +19,11 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import random
 import unittest
 from collections import Counter
+from itertools import combinations
+from math import log1p
 
 from abydos.tokenizer import QSkipgrams
 
@@ -616,6 +619,57 @@ class QSkipgramsTestCases(unittest.TestCase):
         for key in gold_counter.keys():
             self.assertAlmostEqual(gold_counter[key], test_counter[key])
 
+    def test_qskipgrams_counter(self):
+        """Test abydos.tokenizer.QSkipgrams.tokenize_to_counter."""
+        rng = random.Random(2020)
+        strings = ('', 'a', 'AACTAGAAC', 'interdisciplinarian') + tuple(
+            ''.join(rng.choice('abcd ') for _ in range(rng.randint(0, 12)))
+            for _ in range(50)
+        )
+        for tokenizer in (
+            QSkipgrams(),
+            QSkipgrams(qval=1),
+            QSkipgrams(qval=(1, 2, 3), start_stop=''),
+            QSkipgrams(qval=3, start_stop='^'),
+            QSkipgrams(scaler='SSK'),
+            QSkipgrams(qval=3, scaler='SSK', ssk_lambda=(0.5, 0.05)),
+            QSkipgrams(scaler='set'),
+            QSkipgrams(qval=(2, 3), scaler='length-log'),
+            QSkipgrams(scaler='entropy'),
+            QSkipgrams(scaler=log1p),
+        ):
+            for string in strings:
+                # the counts of the enumerated skipgrams
+                gold = Counter(tokenizer.tokenize(string).get_list())
+                counter = tokenizer.tokenize_to_counter(string)
+                self.assertEqual(set(counter), set(gold))
+                self.assertEqual(counter, tokenizer.get_counter())
+                if tokenizer._scaler is None:  # noqa: SF01
+                    self.assertEqual(counter, gold)
+
+        # SSK weights match the sum over each combination of characters
+        tokenizer = QSkipgrams(
+            qval=3, start_stop='', scaler='SSK', ssk_lambda=0.6
+        )
+        string = 'abracadabra'
+        gold = Counter()
+        for comb in combinations(enumerate(string), 3):
+            gold[''.join(char for _, char in comb)] += 0.6 ** (
+                comb[-1][0] - comb[0][0] + 2
+            )
+        counter = tokenizer.tokenize_to_counter(string)
+        self.assertEqual(set(counter), set(gold))
+        for key in gold:
+            self.assertAlmostEqual(counter[key], gold[key])
+
+        # long strings at higher q are counted without enumerating the
+        # C(200, 5) > 2.5 billion combinations
+        counter = QSkipgrams(qval=5, start_stop='').tokenize_to_counter(
+            'ab' * 100
+        )
+        self.assertEqual(len(counter), 32)
+        self.assertEqual(sum(counter.values()), 2535650040)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import pickle
 import unittest
 
 from abydos.tokenizer import SonoriPyTokenizer
@@ -70,6 +71,29 @@ class SonoriPyTokenizerTestCases(unittest.TestCase):
             sorted(['ca', 'ter', 'pil', 'lars']),
         )
 
+        # repeated words are syllabified once
+        tok = SonoriPyTokenizer(cache_size=2)
+        tok.tokenize('nelson nelson peninsular')
+        info = tok._syllabify.cache_info()  # noqa: SF01
+        self.assertEqual((info.hits, info.misses), (1, 2))
+        self.assertEqual(
+            tok.get_list(),
+            ['nel', 'son', 'nel', 'son', 'pe', 'nin', 'su', 'lar'],
+        )
+        tok.tokenize('spectacular nelson')
+        info = tok._syllabify.cache_info()  # noqa: SF01
+        self.assertEqual((info.misses, info.currsize), (4, 2))
+        self.assertEqual(
+            SonoriPyTokenizer(cache_size=0).tokenize('nelson').get_list(),
+            ['nel', 'son'],
+        )
+
+        copy = pickle.loads(pickle.dumps(tok))
+        self.assertEqual(
+            copy.tokenize('caterpillars').get_list(),
+            ['ca', 'ter', 'pil', 'lars'],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,191 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer_vectorizer.
+
+This module contains unit tests for abydos.tokenizer.Vectorizer &
+abydos.tokenizer.TokenMatrix
+"""
+
+import tempfile
+import unittest
+from math import log1p
+
+import numpy as np
+
+from abydos.tokenizer import (
+    QGrams,
+    QSkipgrams,
+    TokenMatrix,
+    Vectorizer,
+    WhitespaceTokenizer,
+)
+
+from .. import COLIN, NIALL
+
+
+class VectorizerTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.Vectorizer & abydos.tokenizer.TokenMatrix."""
+
+    strings = NIALL + COLIN + ('',)
+
+    def test_vectorizer(self):
+        """Test abydos.tokenizer.Vectorizer."""
+        vec = Vectorizer()
+        self.assertIsInstance(vec.tokenizer, QGrams)
+        self.assertEqual(vec.vocabulary, {})
+
+        # the vocabulary is shared, & only grows with partial_fit
+        vec.fit(['Niall'])
+        self.assertEqual(
+            vec.vocabulary,
+            {'$N': 0, 'Ni': 1, 'ia': 2, 'al': 3, 'll': 4, 'l#': 5},
+        )
+        vec.partial_fit(['Neil'])
+        self.assertEqual(len(vec.vocabulary), 9)
+        self.assertEqual(vec.vocabulary['$N'], 0)
+        self.assertEqual(vec.vocabulary['Ne'], 6)
+        vec.fit(['Neil'])
+        self.assertEqual(vec.vocabulary['Ne'], 1)
+
+        # transform ignores unknown tokens, but fit_transform doesn't
+        vec.fit(['Niall'])
+        mat = vec.transform(['Niall', 'Neil', 'Colin'])
+        self.assertEqual(mat.shape, (3, 6))
+        np.testing.assert_array_equal(mat.row_sums(), [6, 2, 0])
+        self.assertEqual(len(vec.vocabulary), 6)
+        mat = vec.fit_transform(['Niall', 'Neil', 'Colin'])
+        self.assertEqual(mat.shape, (3, 15))
+        np.testing.assert_array_equal(mat.row_sums(), [6, 5, 6])
+        np.testing.assert_array_equal(mat.indptr, [0, 6, 11, 17])
+
+        # each row holds the weights of the tokens, as scaled by the
+        # tokenizer
+        for tokenizer in (
+            QGrams(),
+            QGrams(qval=3, scaler='set'),
+            QSkipgrams(scaler='length'),
+            QSkipgrams(qval=3, scaler='entropy'),
+            WhitespaceTokenizer(scaler=log1p),
+        ):
+            vec = Vectorizer(tokenizer)
+            mat = vec.fit_transform(self.strings)
+            self.assertEqual(
+                mat.shape, (len(self.strings), len(vec.vocabulary))
+            )
+            tokens = {col: tok for tok, col in vec.vocabulary.items()}
+            for row, string in enumerate(self.strings):
+                first, last = mat.indptr[row], mat.indptr[row + 1]
+                self.assertEqual(
+                    {
+                        tokens[col]: weight
+                        for col, weight in zip(
+                            mat.indices[first:last], mat.data[first:last]
+                        )
+                    },
+                    dict(tokenizer.tokenize_to_counter(string)),
+                )
+
+    def test_vectorizer_mmap(self):
+        """Test abydos.tokenizer.Vectorizer memory-mapped output."""
+        vec = Vectorizer(QSkipgrams())
+        mat = vec.fit_transform(self.strings)
+        with tempfile.TemporaryDirectory() as path:
+            # write in several chunks
+            vec._chunk_size = 100  # noqa: SF01
+            mapped = vec.transform(self.strings, path)
+            self.assertIsInstance(mapped.data, np.memmap)
+            self.assertIsInstance(mapped.indices, np.memmap)
+            self.assertEqual(mapped.shape, mat.shape)
+            np.testing.assert_array_equal(mapped.indptr, mat.indptr)
+            np.testing.assert_array_equal(mapped.indices, mat.indices)
+            np.testing.assert_array_equal(mapped.data, mat.data)
+            np.testing.assert_array_equal(
+                mapped.intersection(mat), mat.intersection()
+            )
+            del mapped
+
+        with tempfile.TemporaryDirectory() as path:
+            mat[3:10].save(path)
+            loaded = TokenMatrix.load(path)
+            self.assertEqual(loaded.shape, (7, mat.shape[1]))
+            np.testing.assert_array_equal(loaded.dot(mat), mat[3:10].dot(mat))
+            del loaded
+
+        # empty matrices
+        with tempfile.TemporaryDirectory() as path:
+            empty = vec.transform([''], path)
+            self.assertEqual(empty.shape, (1, mat.shape[1]))
+            self.assertEqual(len(empty.data), 0)
+            np.testing.assert_array_equal(empty.union(mat), [mat.row_sums()])
+            vec.transform([], path)
+            self.assertEqual(len(TokenMatrix.load(path)), 0)
+
+    def test_token_matrix(self):
+        """Test abydos.tokenizer.TokenMatrix."""
+        for tokenizer in (
+            QGrams(),
+            QGrams(qval=(1, 2), scaler='set'),
+            QSkipgrams(scaler='length'),
+            WhitespaceTokenizer(scaler=log1p),
+        ):
+            vec = Vectorizer(tokenizer)
+            mat = vec.fit_transform(self.strings)
+            counters = list(tokenizer.tokenize_many(self.strings))
+            intersection = mat.intersection()
+            union = mat.union()
+            dot = mat.dot()
+            for row, src in enumerate(counters):
+                for col, tar in enumerate(counters):
+                    self.assertAlmostEqual(
+                        intersection[row, col], sum((src & tar).values())
+                    )
+                    self.assertAlmostEqual(
+                        union[row, col],
+                        sum(((src + tar) - (src & tar)).values()),
+                    )
+                    self.assertAlmostEqual(
+                        dot[row, col], sum(src[tok] * tar[tok] for tok in src),
+                    )
+
+            # blocks of rows share the matrix's columns
+            np.testing.assert_array_equal(
+                mat[5:12].intersection(mat[:20]), intersection[5:12, :20]
+            )
+            np.testing.assert_array_equal(mat[-4:].union(), union[-4:, -4:])
+            self.assertEqual(len(mat[10:5]), 0)
+            self.assertEqual(mat[10:5].dot(mat).shape, (0, len(mat)))
+
+        # matrices transformed before & after the vocabulary grows remain
+        # comparable
+        vec = Vectorizer().fit(NIALL)
+        before = vec.transform(NIALL)
+        after = vec.partial_fit(COLIN).transform(COLIN)
+        self.assertGreater(after.shape[1], before.shape[1])
+        np.testing.assert_array_equal(
+            before.intersection(after), after.intersection(before).T
+        )
+        full = Vectorizer().fit_transform(NIALL + COLIN)
+        np.testing.assert_array_equal(
+            before.intersection(after),
+            full[: len(NIALL)].intersection(full[len(NIALL) :]),
+        )
+
+        self.assertRaises(ValueError, before.__getitem__, slice(0, 5, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()